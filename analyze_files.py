@@ -9,6 +9,10 @@ import os
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from services.workbook_loader import Workbook
+
 def analyze_excel_files():
     """Analizza tutti i file Excel nella cartella data/raw/"""
 
@@ -30,17 +34,18 @@ def analyze_excel_files():
         print("-" * 40)
 
         file_path = os.path.join(raw_dir, file)
+        workbook = None
 
         try:
-            # Carica il file Excel
-            excel_file = pd.ExcelFile(file_path)
-            print(f"📋 Fogli disponibili: {excel_file.sheet_names}")
+            # Carica il file Excel una sola volta (i fogli vengono letti dallo stesso handle)
+            workbook = Workbook(file_path)
+            print(f"📋 Fogli disponibili: {workbook.sheet_names}")
 
             # Analizza ogni foglio
-            for sheet_name in excel_file.sheet_names:
+            for sheet_name in workbook.sheet_names:
                 print(f"\n   📄 Foglio: {sheet_name}")
 
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
+                df = workbook.sheet(sheet_name)
                 print(f"   📐 Dimensioni: {df.shape[0]} righe × {df.shape[1]} colonne")
 
                 if df.empty:
@@ -90,6 +95,9 @@ def analyze_excel_files():
 
         except Exception as e:
             print(f"   ❌ Errore nell'analisi: {e}")
+        finally:
+            if workbook is not None:
+                workbook.close()
 
 if __name__ == "__main__":
     analyze_excel_files()
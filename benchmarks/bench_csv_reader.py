@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+pandas' C parser vs. pyarrow's multithreaded reader on a synthetic force/displacement log.
+
+The CSV mimics a raw test export: one row per sample with time, force, displacement,
+extension and the specimen number, optionally semicolon-separated and cp1252-encoded
+as Excel writes it on Windows. Both engines go through Workbook, so delimiter and
+encoding are sniffed the same way, and the Arrow frame is checked against read_csv
+(float_precision='round_trip', pyarrow parses floats exactly) before timing.
+
+Usage:
+    python benchmarks/bench_csv_reader.py [--rows 1000000] [--repeat 3] [--semicolon]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import numpy as np
+import pandas as pd
+from services.workbook_loader import ARROW_CSV_AVAILABLE, Workbook, sniff_csv_format
+
+
+def write_log(path: str, rows: int, semicolon: bool):
+    """Write the synthetic force/displacement log."""
+    rng = np.random.default_rng(0)
+    time_s = np.arange(rows) * 0.01
+    displacement = time_s * 0.05
+    df = pd.DataFrame({
+        "Time (s)": time_s,
+        "Force (N)": np.abs(np.sin(time_s / 50)) * 800 + rng.normal(0, 2, rows),
+        "Displacement (mm)": displacement,
+        "Extension (%)": displacement / 0.5,
+        "Specimen": np.arange(rows) // 200000 + 1,
+    })
+    if semicolon:
+        df.to_csv(path, index=False, sep=";", encoding="cp1252", float_format="%.6g")
+    else:
+        df.to_csv(path, index=False, float_format="%.6g")
+
+
+def best_of(repeat: int, read) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        read()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000, help='Samples in the log')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per engine (best is reported)')
+    parser.add_argument('--semicolon', action='store_true', help='Write a ;-separated cp1252 file')
+    args = parser.parse_args()
+
+    if not ARROW_CSV_AVAILABLE:
+        sys.exit("pyarrow is not installed; the Arrow CSV reader is unavailable")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "force_displacement.csv")
+        write_log(path, args.rows, args.semicolon)
+        csv_format = sniff_csv_format(path)
+        print(f"{args.rows} rows, {os.path.getsize(path) / 1e6:.1f} MB, sniffed {csv_format}")
+
+        with Workbook(path) as workbook:
+            arrow = workbook.sheet(0)
+        expected = pd.read_csv(path, sep=csv_format.delimiter, encoding=csv_format.encoding,
+                               float_precision='round_trip')
+        pd.testing.assert_frame_equal(arrow, expected)
+
+        def read(engine):
+            def run():
+                with Workbook(path, engine=engine) as workbook:
+                    workbook.sheet(0)
+            return run
+
+        pandas_seconds = best_of(args.repeat, read('pandas'))
+        arrow_seconds = best_of(args.repeat, read('auto'))
+        print(f"csv (pandas C parser): {pandas_seconds:7.3f} s")
+        print(f"csv-arrow (pyarrow, {os.cpu_count()} CPUs): {arrow_seconds:7.3f} s   "
+              f"speedup: {pandas_seconds / arrow_seconds:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Per-post HTML processing time: previous multi-parse extraction vs single-parse page analysis.
+
+"before" reproduces the previous flow for one post: the crawler parses the page and walks
+every <a> twice (YouTube, manufacturers), Post._clean_html_content parses it again, and
+ParserService parses it a third time to find download links, all with html.parser. "after"
+is one page analysis shared by the crawler and the parser, timed for each parser backend.
+
+Usage:
+    python benchmarks/bench_html_analysis.py [--repeat 20] [--scale 40]
+"""
+
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bs4 import BeautifulSoup
+from models.page_analysis import (
+    DOWNLOAD_SECTION_CLASSES, FILE_LINK_EXTENSIONS, HTML_PARSERS, MANUFACTURER_DOMAINS, YOUTUBE_PATTERNS,
+    analyze_html, clean_document
+)
+
+PAGES_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "pages"
+
+
+def extract_before(url: str, html: str):
+    """Previous flow: three parses and separate link walks."""
+    soup = BeautifulSoup(html, 'html.parser')
+    title = next((h1.get_text().strip() for h1 in soup.find_all('h1')
+                  if 'MyTechFun.com' not in h1.get_text()), "Unknown Title")
+    youtube_link = next((a.get('href') for a in soup.find_all('a', href=True)
+                         if any(p in a.get('href') for p in YOUTUBE_PATTERNS)), None)
+    manufacturer_links = [a.get('href') for a in soup.find_all('a', href=True)
+                          if any(d in a.get('href') for d in MANUFACTURER_DOMAINS)]
+
+    cleaned_text = clean_document(BeautifulSoup(html, 'html.parser'))
+
+    soup = BeautifulSoup(html, 'html.parser')
+    sections = [s.parent for s in soup.find_all(string=lambda t: t and 'download' in t.lower()) if s.parent]
+    for selector in DOWNLOAD_SECTION_CLASSES:
+        sections.extend(soup.select('.' + selector))
+    links = {urljoin(url, a.get('href')) for a in soup.find_all('a', href=True)
+             if any(ext in a.get('href').lower() for ext in FILE_LINK_EXTENSIONS)}
+    for section in sections:
+        links.update(urljoin(url, a.get('href')) for a in section.find_all('a', href=True))
+
+    return title, youtube_link, manufacturer_links, cleaned_text, links
+
+
+def extract_after(url: str, html: str, parser: str = 'html.parser'):
+    """Current flow: one parse shared by the crawler and the parser."""
+    analysis = analyze_html(url, html, parser)
+    return (analysis.title, analysis.youtube_link, analysis.manufacturer_links,
+            analysis.cleaned_text, set(analysis.download_links))
+
+
+def scaled_page(html: str, scale: int) -> str:
+    """Grow a page to a realistic post size by repeating its results table body."""
+    start, end = html.find('<table>'), html.find('</table>')
+    if start < 0 or scale <= 1:
+        return html
+    rows = html[start + len('<table>'):end]
+    return html[:start + len('<table>')] + rows * scale + html[end:]
+
+
+def time_per_post(extract, pages, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for url, html in pages:
+            extract(url, html)
+        samples.append((time.perf_counter() - started) / len(pages))
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20, help='Timing repetitions (median is reported)')
+    parser.add_argument('--scale', type=int, default=40, help='Repeat factor for the results table of each page')
+    args = parser.parse_args()
+
+    pages = []
+    for index, path in enumerate(sorted(glob.glob(os.path.join(PAGES_DIR, '*.html')))):
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append((f"https://www.mytechfun.com/video/{index + 1}", scaled_page(f.read(), args.scale)))
+
+    for url, html in pages:
+        before = extract_before(url, html)
+        for parser in HTML_PARSERS:
+            assert extract_after(url, html, parser) == before, f"Outputs differ for {url} ({parser})"
+
+    before = time_per_post(extract_before, pages, args.repeat)
+    average_kb = sum(len(html) for _, html in pages) / len(pages) / 1024
+
+    print(f"pages: {len(pages)}  average size: {average_kb:.1f} KiB  repeat: {args.repeat}")
+    print(f"before (3 parses, html.parser): {before * 1000:8.2f} ms/post")
+    for parser in HTML_PARSERS:
+        after = time_per_post(lambda url, html: extract_after(url, html, parser), pages, args.repeat)
+        print(f"after  (1 parse, {parser + '):':<12} {after * 1000:8.2f} ms/post  ({before / after:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Wall time of NormalizerService.process_materials over the downloaded corpus in data/raw.
+
+Each --workers value normalizes every spreadsheet in the corpus once. The material list
+is checked to be identical across worker counts.
+
+Usage:
+    python benchmarks/bench_normalize.py [--raw-dir data/raw] [--workers 1 2 4]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import structlog
+from models.valid_file import VALID_FILE_TYPES, ValidFile
+from services.normalizer_service import NormalizerService
+
+
+def load_corpus(raw_dir: str):
+    """Build ValidFile objects for every spreadsheet in raw_dir (named <sha256>_<filename>)."""
+    files = []
+    for path in sorted(glob.glob(os.path.join(raw_dir, '*'))):
+        filename = os.path.basename(path)
+        file_type = os.path.splitext(filename)[1].lower()
+        if file_type not in VALID_FILE_TYPES:
+            continue
+        sha, _, original_name = filename.partition('_')
+        files.append(ValidFile(
+            filename=original_name or filename,
+            file_type=file_type,
+            sha256_hash=sha,
+            file_path=path,
+            download_timestamp="",
+            source_post_url="",
+            file_size=os.path.getsize(path),
+            url=""
+        ))
+    return files
+
+
+def summarize(materials):
+    return [(m.material_name, m.quality_rating.value, sorted(m.normalized_values)) for m in materials]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--raw-dir', default='data/raw', help='Directory with downloaded spreadsheets')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='Worker counts to time')
+    args = parser.parse_args()
+
+    # Keep per-file log lines out of the timings
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    files = load_corpus(args.raw_dir)
+    print(f"files: {len(files)}  cpus: {os.cpu_count()}")
+
+    reference = None
+    for workers in args.workers:
+        service = NormalizerService(workers=workers)
+        started = time.perf_counter()
+        materials = service.process_materials(files)
+        elapsed = time.perf_counter() - started
+        service.close()
+
+        if reference is None:
+            reference = summarize(materials)
+        assert summarize(materials) == reference, f"Results differ with workers={workers}"
+        print(f"workers={workers}: {elapsed:6.2f} s  materials: {len(materials)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Wall time of NormalizerService.process_materials over data/raw with the parsed-sheet cache.
+
+Runs: without cache, cold cache (parse and store), then warm cache (the re-run after a
+rule tweak: every sheet is served from the cache, no spreadsheet is opened). The material
+list is checked to be identical across runs.
+
+Usage:
+    python benchmarks/bench_sheet_cache.py [--raw-dir data/raw] [--engine auto]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import structlog
+from bench_normalize import load_corpus
+from services.normalizer_service import NormalizerService
+from services.sheet_cache import SheetCache
+from services.workbook_loader import EXCEL_ENGINES
+
+
+def summarize(materials):
+    return [(m.material_name, m.quality_rating.value, m.normalized_values) for m in materials]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--raw-dir', default='data/raw', help='Directory with downloaded spreadsheets')
+    parser.add_argument('--engine', default='auto', choices=EXCEL_ENGINES, help='Spreadsheet reader engine')
+    args = parser.parse_args()
+
+    # Keep per-file log lines out of the timings
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    files = load_corpus(args.raw_dir)
+    cache = SheetCache(tempfile.mkdtemp(prefix='sheet-cache-'))
+    print(f"files: {len(files)}  engine: {args.engine}")
+
+    reference = None
+    for label, sheet_cache in [('no cache', None), ('cold cache', cache), ('warm cache', cache)]:
+        service = NormalizerService(reader_engine=args.engine, sheet_cache=sheet_cache)
+        cache.stats.clear()
+        started = time.perf_counter()
+        materials = service.process_materials(files)
+        elapsed = time.perf_counter() - started
+
+        if reference is None:
+            reference = summarize(materials)
+        assert summarize(materials) == reference, f"Results differ with {label}"
+        counts = f"  hits: {cache.stats['hits']}  misses: {cache.stats['misses']}" if sheet_cache else ""
+        print(f"{label:<10}: {elapsed:6.2f} s{counts}")
+
+    size = sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(cache.cache_dir) for name in names)
+    print(f"cache size: {size / 1024:.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Full sheet reads vs. table-only reads (Workbook.table) on a synthetic results sheet.
+
+The sheet mimics a MyTechFun results file: a small results table (materials x test
+results) in the top-left corner, a blank column, then a long raw data block (time, force,
+displacement) next to it. Workbook.sheet parses everything; Workbook.table sniffs the
+header and first rows, then reads only the results table.
+
+Each engine is checked to return the table cut from the full sheet before timing.
+
+Usage:
+    python benchmarks/bench_table_reads.py [--raw-rows 50000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pandas as pd
+from services.workbook_loader import CALAMINE_AVAILABLE, Workbook
+
+
+def write_sheet(path: str, raw_rows: int):
+    """Write the synthetic results sheet: table in A1:E9, raw data in G1:J<raw_rows + 1>."""
+    from openpyxl import Workbook as OpenpyxlWorkbook
+
+    book = OpenpyxlWorkbook(write_only=True)
+    sheet = book.create_sheet("Results")
+    table = [["Material", "Tensile strength", "Elongation at break", "Density", "Tg"]]
+    table += [[f"PLA {i}", f"{45 + i} MPa", f"{4 + i / 10:.1f} %", "1.24 g/cm³", f"{58 + i} °C"] for i in range(8)]
+    for row in range(raw_rows + 1):
+        cells = table[row] + [None] if row < len(table) else [None] * 6
+        if row == 0:
+            cells += ["Time (s)", "Force (N)", "Displacement (mm)", "Sample"]
+        else:
+            cells += [row * 0.01, (row % 500) * 0.8, row * 0.002, row // 1000]
+        sheet.append(cells)
+    book.save(path)
+
+
+def best_of(repeat: int, read) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        read()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--raw-rows', type=int, default=50000, help='Rows of the raw data block')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per mode (best is reported)')
+    args = parser.parse_args()
+
+    engines = ['openpyxl-stream'] + (['calamine'] if CALAMINE_AVAILABLE else [])
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "results.xlsx")
+        write_sheet(path, args.raw_rows)
+
+        for engine in engines:
+            with Workbook(path, engine=engine) as workbook:
+                table, bounds = workbook.table("Results")
+            with Workbook(path, engine=engine) as workbook:
+                full = workbook.sheet("Results")
+            pd.testing.assert_frame_equal(table, bounds.apply(full), check_dtype=False, obj=engine)
+
+            def read_full():
+                with Workbook(path, engine=engine) as workbook:
+                    workbook.sheet("Results")
+
+            def read_table():
+                with Workbook(path, engine=engine) as workbook:
+                    workbook.table("Results")
+
+            full_seconds = best_of(args.repeat, read_full)
+            table_seconds = best_of(args.repeat, read_table)
+            print(f"{engine:<15} full sheet {full.shape}: {full_seconds:7.3f} s   "
+                  f"table {table.shape} ({bounds.read_range(table)}): {table_seconds:7.3f} s   "
+                  f"speedup: {full_seconds / table_seconds:5.1f}x")
+        print(f"skipped regions: {', '.join(bounds.skipped_regions)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of SI unit conversion: per-value dictionary lookup versus UnitRegistry.convert.
+
+The per-value baseline is the previous approach (lower-case and strip each unit, look it up,
+multiply or call); the registry resolves each distinct unit once and converts the whole
+array with one multiply-add. Results are checked to agree.
+
+Usage:
+    python benchmarks/bench_unit_conversion.py [--values 1000000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import numpy as np
+from services.unit_registry import UnitRegistry
+
+# Units as they appear in sheets, including spellings without a conversion
+UNITS = ["MPa", "GPa", "psi", "°C", "°F", "g/cm³", "mm", "%", "", "J/m"]
+
+PER_VALUE_MAPPINGS = {
+    "mpa": 1e6, "gpa": 1e9, "psi": 6894.76, "g/cm³": 1000, "mm": 0.001,
+    "°c": lambda c: c + 273.15,
+    "°f": lambda f: (f - 32) * 5 / 9 + 273.15,
+}
+
+
+def convert_per_value(values, units):
+    si_values = []
+    for value, unit in zip(values, units):
+        conversion = PER_VALUE_MAPPINGS.get(unit.lower().strip())
+        if conversion is None:
+            si_values.append(value)
+        elif callable(conversion):
+            si_values.append(conversion(value))
+        else:
+            si_values.append(value * conversion)
+    return np.array(si_values)
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--values', type=int, default=1_000_000, help='Number of values to convert')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per method (best is reported)')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    values = rng.uniform(-50, 500, args.values)
+    units = np.array(UNITS, dtype=object)[rng.integers(0, len(UNITS), args.values)]
+    registry = UnitRegistry()
+
+    per_value_time, expected = best_of(args.repeat, convert_per_value, values.tolist(), units.tolist())
+    registry_time, (converted, _) = best_of(args.repeat, registry.convert, values, units)
+    assert np.allclose(converted, expected, rtol=1e-12), "Conversions differ"
+
+    print(f"values: {args.values}  distinct units: {len(UNITS)}")
+    print(f"per value: {per_value_time * 1e6:10.0f} µs")
+    print(f"registry : {registry_time * 1e6:10.0f} µs  ({per_value_time / registry_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
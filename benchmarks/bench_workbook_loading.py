@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Time and peak memory for reading every sheet of every workbook in data/raw.
+
+Modes:
+    reopen           previous analyze_files.py pattern: pd.ExcelFile for the sheet names, then
+                     pd.read_excel(path, sheet_name=...) per sheet (the archive is re-opened each time)
+    once             services.workbook_loader.Workbook: one open per file, all sheets from that handle
+                     (pandas engine)
+    openpyxl-stream  Workbook with openpyxl read-only streaming of plain values
+    calamine         Workbook with the python-calamine reader (skipped when not installed)
+
+Every engine mode is first checked to return the same DataFrames as the pandas engine.
+
+Each mode runs in a fresh subprocess so peak RSS is not shared between modes; Python heap
+peak is measured in a second run under tracemalloc.
+
+Usage:
+    python benchmarks/bench_workbook_loading.py [--raw-dir data/raw] [--modes reopen once openpyxl-stream calamine]
+"""
+
+import argparse
+import glob
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def read_reopen(paths):
+    import pandas as pd
+    cells = 0
+    for path in paths:
+        for sheet_name in pd.ExcelFile(path).sheet_names:
+            cells += pd.read_excel(path, sheet_name=sheet_name).size
+    return cells
+
+
+def read_with_engine(engine: str):
+    def read(paths):
+        from services.workbook_loader import Workbook
+        cells = 0
+        for path in paths:
+            with Workbook(path, engine=engine) as workbook:
+                cells += sum(df.size for df in workbook.sheets().values())
+        return cells
+    return read
+
+
+MODES = {
+    'reopen': read_reopen,
+    'once': read_with_engine('pandas'),
+    'openpyxl-stream': read_with_engine('openpyxl-stream'),
+    'calamine': read_with_engine('calamine')
+}
+
+
+def check_engines(paths, engines):
+    """Assert every engine returns exactly the DataFrames of the pandas engine."""
+    import pandas as pd
+    from services.workbook_loader import Workbook
+    for path in paths:
+        with Workbook(path, engine='pandas') as workbook:
+            reference = workbook.sheets()
+        for engine in engines:
+            with Workbook(path, engine=engine) as workbook:
+                for name, df in workbook.sheets().items():
+                    pd.testing.assert_frame_equal(df, reference[name], obj=f"{engine}: {path} [{name}]")
+
+
+def run_child(mode: str, raw_dir: str, trace: bool):
+    """Run one mode in this process and print its measurements as JSON."""
+    import pandas  # noqa: F401  (import cost is excluded from the timing)
+
+    paths = sorted(glob.glob(os.path.join(raw_dir, '*.xls*')))
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    cells = MODES[mode](paths)
+    elapsed = time.perf_counter() - started
+    result = {
+        'files': len(paths),
+        'cells': int(cells),
+        'seconds': elapsed,
+        'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }
+    if trace:
+        result['heap_peak_mb'] = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--raw-dir', default='data/raw', help='Directory with downloaded spreadsheets')
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    parser.add_argument('--child', choices=list(MODES), help=argparse.SUPPRESS)
+    parser.add_argument('--trace', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.raw_dir, args.trace)
+        return
+
+    from services.workbook_loader import CALAMINE_AVAILABLE
+    modes = [mode for mode in args.modes if mode != 'calamine' or CALAMINE_AVAILABLE]
+    check_engines(sorted(glob.glob(os.path.join(args.raw_dir, '*.xls*'))),
+                  [mode for mode in modes if mode in ('openpyxl-stream', 'calamine')])
+
+    for mode in modes:
+        command = [sys.executable, __file__, '--child', mode, '--raw-dir', args.raw_dir]
+        timed = json.loads(subprocess.check_output(command).decode().strip().splitlines()[-1])
+        traced = json.loads(subprocess.check_output(command + ['--trace']).decode().strip().splitlines()[-1])
+        print(f"{mode:<15} files: {timed['files']}  cells: {timed['cells']}  "
+              f"time: {timed['seconds']:6.2f} s  peak RSS: {timed['max_rss_mb']:6.1f} MB  "
+              f"heap peak: {traced['heap_peak_mb']:6.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
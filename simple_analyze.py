@@ -2,6 +2,12 @@
 
 import pandas as pd
 import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from services.workbook_loader import Workbook
 
 def analyze_files():
     print("📊 ANALISI FILE EXCEL - MTF CRAWLER")
@@ -20,12 +26,12 @@ def analyze_files():
         file_path = f"{raw_dir}/{file}"
 
         try:
-            # Analizza fogli disponibili
-            excel_file = pd.ExcelFile(file_path)
-            print(f"Fogli: {excel_file.sheet_names}")
+            # Analizza fogli disponibili (il file viene aperto una sola volta)
+            with Workbook(file_path) as workbook:
+                print(f"Fogli: {workbook.sheet_names}")
 
-            # Analizza primo foglio
-            df = pd.read_excel(file_path, sheet_name=0)
+                # Analizza primo foglio
+                df = workbook.sheet(0)
             print(f"Dimensioni: {df.shape[0]} righe × {df.shape[1]} colonne")
 
             # Mostra nomi colonne
@@ -11,6 +11,8 @@ import argparse
 from pathlib import Path
 import structlog
 import os
+from datetime import datetime
+from typing import Optional
 
 # SSL certificate workaround for macOS/Python
 try:
@@ -26,9 +28,25 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from lib.logging import setup_logging, get_logger, create_operation_logger
 from lib.validation import validate_url, validate_constitutional_compliance
 from services.crawler_service import CrawlerService
+from services.async_crawler_service import AsyncCrawlerService
 from services.parser_service import ParserService
 from services.normalizer_service import NormalizerService
+from services.layout_detector import LAYOUT_PARSERS, LayoutDetector
+from services.sheet_cache import ARROW_AVAILABLE, SheetCache
+from services.workbook_loader import EXCEL_ENGINES
 from services.storage_service import StorageService
+from services.pipeline_service import PipelineService
+from services.http_cache import HttpCache
+from services.checkpoint_service import CheckpointService
+from models.crawl_state import CrawlState
+from models.normalization_manifest import NormalizationManifest
+
+# Persistent crawl state for --incremental runs
+CRAWL_STATE_PATH = 'data/state/crawl_state.json'
+# Checkpoint of the current discovery run, used by --resume
+CHECKPOINT_PATH = 'data/state/checkpoint.sqlite'
+# Per-file record of the last normalization (SHA-256, rule-set fingerprint, output storage key)
+NORMALIZATION_MANIFEST_PATH = 'data/state/normalization_manifest.json'
 
 
 def main():
@@ -96,6 +114,66 @@ def main():
         help='Skip file download and only process post content'
     )
 
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=1,
+        help='Maximum in-flight requests per host; values above 1 use the async crawl engine (default: 1)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the persistent caches: HTTP responses (data/cache/http) and parsed sheets (data/cache/sheets)'
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help=f'Only fetch post ids not seen before (tracked in {CRAWL_STATE_PATH}) plus a revisit sample'
+    )
+
+    parser.add_argument(
+        '--revisit',
+        type=int,
+        default=3,
+        help='With --incremental, number of already-seen posts to re-fetch, least recently crawled first (default: 3)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes for spreadsheet normalization (default: 1, no process pool)'
+    )
+
+    parser.add_argument(
+        '--excel-engine',
+        choices=EXCEL_ENGINES,
+        help='Spreadsheet reader engine for normalization (default: MTF_EXCEL_ENGINE or auto: '
+             'calamine if installed, else openpyxl read-only streaming for .xlsx)'
+    )
+
+    parser.add_argument(
+        '--series',
+        action='store_true',
+        help='Keep every parsed value of each property column as float64 arrays in a '
+             '<post>.series.npz file next to the JSON, with summary statistics per property '
+             '(default: MTF_EXTRACT_SERIES)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help=f'Normalize and rewrite every post, ignoring {NORMALIZATION_MANIFEST_PATH}'
+    )
+
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help=f'Resume an interrupted discovery run from {CHECKPOINT_PATH}, skipping completed posts and downloads'
+    )
+
     args = parser.parse_args()
 
     # Validate arguments based on phase
@@ -105,6 +183,15 @@ def main():
     if args.phase == 'normalize' and not args.discovery_report:
         parser.error("--discovery-report is required for normalize phase")
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.revisit < 0:
+        parser.error("--revisit must not be negative")
+
     # Setup logging
     setup_logging(level=args.log_level)
     logger = get_logger("mtf_crawler.main")
@@ -124,32 +211,7 @@ def main():
                    output_dir=args.output_dir,
                    dry_run=args.dry_run)
 
-        # Gentle crawling: respect robots.txt, apply rate limiting, avoid duplicate downloads
-        if args.phase in ['discovery', 'both']:
-            import time
-            from urllib import robotparser
-            rp = robotparser.RobotFileParser()
-            rp.set_url(args.url.rstrip('/') + '/robots.txt')
-            rp.read()
-            user_agent = os.getenv('MTF_USER_AGENT', 'mytechfun-research-bot/1.0 (contact: user@example.com)')
-            if not rp.can_fetch(user_agent, args.url):
-                print(f"Crawling not allowed by robots.txt for user-agent: {user_agent}")
-                return 1
-            # Rate limiting (configurable via .env)
-            rate_limit = float(os.getenv('MTF_RATE_LIMIT_DELAY', '1.0'))
-            # Avoid duplicate downloads: check already downloaded files in data/raw/
-            already_downloaded = set(os.listdir('data/raw')) if os.path.exists('data/raw') else set()
-            posts = CrawlerService().crawl_posts(args.url)
-            for post in posts:
-                files = ParserService().extract_files(post)
-                for file in files:
-                    if file.filename in already_downloaded:
-                        print(f"Skipping already downloaded file: {file.filename}")
-                        continue
-                    print(f"Downloaded: {file.filename}")
-                    time.sleep(rate_limit)
-
-        # Execute based on phase
+        # Execute based on phase (robots.txt, rate limiting and download reuse are handled by the services)
         if args.phase == 'discovery':
             result = run_discovery_phase(args)
         elif args.phase == 'normalize':
@@ -165,7 +227,7 @@ def main():
             return 1
 
     except KeyboardInterrupt:
-        logger.info("Crawler interrupted by user")
+        logger.info("Crawler interrupted by user; rerun with --resume to continue from the checkpoint")
         return 130
     except Exception as e:
         logger.error("Crawler failed with exception", error=str(e), exc_info=True)
@@ -188,8 +250,7 @@ def run_discovery_phase(args) -> dict:
     logger.info("Starting discovery phase")
 
     # Initialize services
-    crawler_service = CrawlerService()
-    parser_service = ParserService()
+    crawler_service, parser_service, cache = create_discovery_services(args)
 
     # Track statistics
     stats = {
@@ -202,11 +263,7 @@ def run_discovery_phase(args) -> dict:
     try:
         # Step 1: Crawl posts
         logger.info("Crawling posts from MyTechFun.com")
-        posts = crawler_service.crawl_posts(args.url)
-
-        if args.max_posts and len(posts) > args.max_posts:
-            posts = posts[:args.max_posts]
-            logger.info("Limited posts for processing", max_posts=args.max_posts)
+        posts = crawler_service.crawl_posts(args.url, max_posts=args.max_posts)
 
         stats['posts_crawled'] = len(posts)
 
@@ -226,9 +283,13 @@ def run_discovery_phase(args) -> dict:
         # Step 3: Generate discovery report
         if not args.dry_run:
             logger.info("Generating discovery report")
-            discovery_report = generate_discovery_report(posts, all_files)
+            if args.incremental:
+                posts, all_files = merge_previous_discovery(posts, all_files)
+            discovery_report = generate_discovery_report(posts, all_files, args.excel_engine,
+                                                         create_sheet_cache(args))
             save_discovery_results(posts, all_files, discovery_report)
             stats['discovery_report_created'] = True
+            complete_run(crawler_service)
 
         stats['success'] = True
         logger.info("Discovery phase completed successfully", **stats)
@@ -239,49 +300,155 @@ def run_discovery_phase(args) -> dict:
         stats['error'] = str(e)
         return stats
 
+    finally:
+        stats.update(summarize_requests(crawler_service, parser_service, cache))
+        logger.info("Run summary", requests=stats['requests'], downloads_skipped=stats['downloads_skipped'],
+                   cache=stats.get('cache'))
+
+
+def create_discovery_services(args):
+    """
+    Build the crawler and parser services.
+
+    Both share one HTTP cache unless --no-cache is given, and one run checkpoint unless
+    this is a dry run; the checkpoint is reset unless --resume is given.
+    """
+    cache = None if args.no_cache else HttpCache()
+    state = CrawlState.load(CRAWL_STATE_PATH) if args.incremental else None
+
+    checkpoint = None
+    if not args.dry_run:
+        checkpoint = CheckpointService(CHECKPOINT_PATH)
+        if args.resume:
+            get_logger("mtf_crawler.discovery").info("Resuming from checkpoint", **checkpoint.progress())
+        else:
+            checkpoint.clear()
+
+    if args.concurrency > 1:
+        crawler_service = AsyncCrawlerService(concurrency=args.concurrency, cache=cache,
+                                              state=state, revisit=args.revisit, checkpoint=checkpoint)
+    else:
+        crawler_service = CrawlerService(cache=cache, state=state, revisit=args.revisit, checkpoint=checkpoint)
+    parser_service = ParserService(cache=cache, checkpoint=checkpoint)
+
+    return crawler_service, parser_service, cache
+
+
+def complete_run(crawler_service):
+    """Persist the incremental crawl state and drop the run checkpoint once discovery results are saved."""
+    logger = get_logger("mtf_crawler.discovery")
+
+    if crawler_service.state is not None:
+        crawler_service.state.save(CRAWL_STATE_PATH)
+        logger.info("Crawl state saved", path=CRAWL_STATE_PATH, state=str(crawler_service.state))
+
+    if crawler_service.checkpoint is not None:
+        crawler_service.checkpoint.clear()
+
+
+def summarize_requests(crawler_service, parser_service, cache=None) -> dict:
+    """Collect HTTP request counts per stage and cache hit/miss statistics from the discovery services."""
+    requests_by_stage = crawler_service.request_counts + parser_service.request_counts
+    summary = {
+        'requests': dict(requests_by_stage),
+        'total_requests': sum(requests_by_stage.values()),
+        'downloads_skipped': parser_service.downloads_skipped
+    }
+    if cache is not None:
+        summary['cache'] = dict(cache.stats)
+    return summary
+
+
+def create_sheet_cache(args) -> Optional[SheetCache]:
+    """
+    Build the parsed-sheet cache shared by layout discovery and normalization.
+
+    Parsed sheets are cached by file hash unless --no-cache is given (or pyarrow is missing).
+    """
+    if args.no_cache:
+        return None
+    if not ARROW_AVAILABLE:
+        get_logger("mtf_crawler.normalize").warning("pyarrow not installed, parsed sheets will not be cached")
+        return None
+    return SheetCache()
+
+
+def create_normalizer_service(args) -> NormalizerService:
+    """Build the normalizer for a run, with the parsed-sheet cache (see create_sheet_cache)."""
+    return NormalizerService(workers=args.workers, reader_engine=args.excel_engine,
+                             sheet_cache=create_sheet_cache(args), extract_series=True if args.series else None)
+
 
 def run_normalize_phase(args) -> dict:
-    """Execute Phase 2: Parsing & Normalization."""
+    """
+    Execute Phase 2: Parsing & Normalization.
+
+    Only posts with new or changed files (or a changed rule set) are normalized and rewritten;
+    the normalization manifest records what each file was last normalized with. --force
+    reprocesses everything.
+    """
     logger = get_logger("mtf_crawler.normalize")
-    logger.info("Starting normalization phase")
+    logger.info("Starting normalization phase", force=args.force)
 
     # Initialize services
-    normalizer_service = NormalizerService()
+    normalizer_service = create_normalizer_service(args)
     storage_service = StorageService()
+    manifest = NormalizationManifest.load(NORMALIZATION_MANIFEST_PATH)
+    rules_fingerprint = normalizer_service.rules_fingerprint()
 
     stats = {
         'success': False,
         'materials_processed': 0,
-        'json_files_created': 0
+        'json_files_created': 0,
+        'posts_skipped': 0,
+        'files_skipped': 0
     }
 
     try:
         # Load discovery results
         posts, files, discovery_report = load_discovery_results(args.discovery_report)
+        normalizer_service.layout_detector.remember(discovery_report.get('layout_decisions', {}))
+
+        # Group files by post and keep only the posts whose outputs are out of date
+        pending = []
+        for post, post_files in group_files_by_post(posts, files):
+            if not args.force and is_post_current(post, post_files, manifest, rules_fingerprint, storage_service):
+                stats['posts_skipped'] += 1
+                stats['files_skipped'] += len(post_files)
+            else:
+                pending.append((post, post_files))
+        pending_files = [file for _, post_files in pending for file in post_files]
 
         # Process materials using discovery insights
-        logger.info("Processing materials with discovery insights")
-        all_materials = normalizer_service.process_materials(files)
+        logger.info("Processing materials with discovery insights", workers=args.workers,
+                   posts=len(pending), files=len(pending_files), posts_skipped=stats['posts_skipped'])
+        try:
+            all_materials = normalizer_service.process_materials(pending_files) if pending_files else []
+        finally:
+            normalizer_service.close()
         stats['materials_processed'] = len(all_materials)
+        if normalizer_service.sheet_cache is not None:
+            stats['sheet_cache'] = dict(normalizer_service.sheet_cache.stats)
+        if normalizer_service.workers == 1:
+            # With a pool the headers and layouts are classified (and cached) in the worker processes
+            stats['property_names'] = normalizer_service.property_classifier.stats
+            stats['layouts'] = dict(normalizer_service.layout_detector.stats)
 
         # Save final JSON files
         if not args.dry_run:
             logger.info("Saving normalized JSON files")
-            for post in posts:
+            for post, post_files in pending:
                 try:
-                    post_url_norm = post.url.rstrip('/').lower()
-                    post_files = [f for f in files if f.source_post_url.rstrip('/').lower() == post_url_norm]
-                    post_materials = [m for m in all_materials if any(f.sha256_hash == m.source_file_hash for f in post_files)]
-                    json_data = storage_service.save_json(post, post_files, post_materials)
+                    post_hashes = {f.sha256_hash for f in post_files}
+                    post_materials = [m for m in all_materials if m.source_file_hash in post_hashes]
+                    storage_service.save_json(post, post_files, post_materials)
                     stats['json_files_created'] += 1
-                    json_data_complete = JSONData.create_complete(post, post_files, post_materials)
-                    output_path = Path('data/processed') / f"{post.id if hasattr(post, 'id') else post.post_hash}.json"
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        import json
-                        json.dump(json_data_complete, f, default=lambda o: o.__dict__, indent=2, ensure_ascii=False)
-                    logger.info(f"Saved normalized JSON for post: {getattr(post, 'id', getattr(post, 'post_hash', None))} → {output_path}")
+                    for file in post_files:
+                        manifest.record(file, rules_fingerprint, post.post_hash)
                 except Exception as e:
-                    logger.error(f"Failed to process post: {getattr(post, 'id', getattr(post, 'post_hash', None))}", error=str(e))
+                    logger.error("Failed to save normalized JSON", post_url=post.url, error=str(e))
+
+            manifest.save(NORMALIZATION_MANIFEST_PATH)
 
         stats['success'] = True
         logger.info("Normalization phase completed successfully", **stats)
@@ -293,43 +460,97 @@ def run_normalize_phase(args) -> dict:
         return stats
 
 
+def group_files_by_post(posts, files):
+    """Pair each post with its downloaded files (matched on the source post URL), in post order."""
+    files_by_post = {}
+    for file in files:
+        files_by_post.setdefault(file.source_post_url.rstrip('/').lower(), []).append(file)
+    return [(post, files_by_post.get(post.url.rstrip('/').lower(), [])) for post in posts]
+
+
+def is_post_current(post, post_files, manifest, rules_fingerprint, storage_service) -> bool:
+    """A post's JSON is up to date when it exists and every one of its files is unchanged in the manifest."""
+    if not storage_service.has_json(post.post_hash):
+        return False
+    return all(manifest.is_current(file, rules_fingerprint, post.post_hash) for file in post_files)
+
+
 def run_both_phases(args) -> dict:
-    """Execute both phases sequentially."""
+    """
+    Execute both phases as one streaming pipeline (crawl → download → normalize → store).
+
+    Every stored post is recorded in the normalization manifest, so a following normalize
+    phase skips it until its files or the rule set change.
+    """
     logger = get_logger("mtf_crawler.both")
     logger.info("Starting both phases")
 
-    # Phase 1: Discovery
-    discovery_result = run_discovery_phase(args)
-    if not discovery_result.get('success'):
-        return discovery_result
-
-    # Phase 2: Normalization (update args with discovery report path)
-    args.discovery_report = 'data/discovery/report.json'
-    normalize_result = run_normalize_phase(args)
-
-    # Combine results
-    combined_stats = {
-        'success': discovery_result.get('success') and normalize_result.get('success'),
-        'posts_crawled': discovery_result.get('posts_crawled', 0),
-        'files_downloaded': discovery_result.get('files_downloaded', 0),
-        'materials_processed': normalize_result.get('materials_processed', 0),
-        'json_files_created': normalize_result.get('json_files_created', 0)
-    }
-
-    return combined_stats
-
+    # Initialize services
+    crawler_service, parser_service, cache = create_discovery_services(args)
+    normalizer_service = create_normalizer_service(args)
+    manifest = NormalizationManifest.load(NORMALIZATION_MANIFEST_PATH)
+    pipeline = PipelineService(
+        crawler_service,
+        parser_service,
+        normalizer_service,
+        StorageService(),
+        skip_files=args.skip_files,
+        dry_run=args.dry_run,
+        manifest=manifest,
+        rules_fingerprint=normalizer_service.rules_fingerprint()
+    )
 
-def generate_discovery_report(posts, files):
-    """Generate discovery report from crawled data."""
-    # Placeholder implementation - will be expanded
+    try:
+        result = pipeline.run(args.url, max_posts=args.max_posts)
+    finally:
+        normalizer_service.close()
+    if not args.dry_run:
+        manifest.save(NORMALIZATION_MANIFEST_PATH)
+    posts = result.pop('posts')
+    files = result.pop('files')
+
+    # Keep the discovery outputs so the normalize phase can be re-run on its own
+    if not args.dry_run and 'error' not in result:
+        if args.incremental:
+            posts, files = merge_previous_discovery(posts, files)
+        discovery_report = generate_discovery_report(posts, files, args.excel_engine,
+                                                     normalizer_service.sheet_cache)
+        save_discovery_results(posts, files, discovery_report)
+        result['discovery_report_created'] = True
+        complete_run(crawler_service)
+
+    result.update(summarize_requests(crawler_service, parser_service, cache))
+    result['success'] = 'error' not in result
+    logger.info("Run summary", requests=result['requests'], downloads_skipped=result['downloads_skipped'],
+               cache=result.get('cache'))
+    return result
+
+
+def generate_discovery_report(posts, files, reader_engine=None, sheet_cache=None):
+    """
+    Generate discovery report from crawled data.
+
+    The layout of every sheet of the downloaded files is detected; the fingerprint → layout
+    decisions are stored in the report so the normalize phase dispatches each sheet to its
+    parser without classifying it again. Sheets go through the normalizer's sheet cache
+    when one is given, so each file is parsed once across both phases.
+    """
+    detector = LayoutDetector()
+    reader_engine = reader_engine or os.getenv('MTF_EXCEL_ENGINE', 'auto')
+    sheet_layouts = []
+    for file in files:
+        if os.path.exists(file.file_path):
+            sheet_layouts.extend(detector.detect_file(file, reader_engine, sheet_cache))
+
+    patterns = sorted({entry['layout'] for entry in sheet_layouts} - {'empty'})
     return {
-        'generation_timestamp': '2025-10-03T14:46:00Z',
+        'generation_timestamp': datetime.utcnow().isoformat() + "Z",
         'total_posts_crawled': len(posts),
         'total_files_downloaded': len(files),
-        'file_structure_patterns': ['single_material_vertical'],
-        'parsing_recommendations': {
-            'single_material_vertical': 'property_value_parser'
-        }
+        'file_structure_patterns': patterns,
+        'parsing_recommendations': {layout: LAYOUT_PARSERS[layout] for layout in patterns},
+        'sheet_layouts': sheet_layouts,
+        'layout_decisions': detector.decisions
     }
 
 
@@ -342,12 +563,26 @@ def save_discovery_results(posts, files, discovery_report):
         json.dump(discovery_report, f, indent=2)
     # Save posts
     with open('data/discovery/posts.json', 'w') as f:
-        json.dump([post.__dict__ for post in posts], f, indent=2)
+        json.dump([post.to_dict() for post in posts], f, indent=2)
     # Save files
     with open('data/discovery/files.json', 'w') as f:
         json.dump([file.__dict__ for file in files], f, indent=2)
 
 
+def merge_previous_discovery(posts, files, discovery_dir='data/discovery'):
+    """Combine this run's posts and files with the previous discovery results; this run wins per URL."""
+    report_path = os.path.join(discovery_dir, 'report.json')
+    if not os.path.exists(report_path):
+        return posts, files
+
+    previous_posts, previous_files, _ = load_discovery_results(report_path)
+    merged_posts = {post.url: post for post in previous_posts}
+    merged_posts.update((post.url, post) for post in posts)
+    merged_files = {file.url: file for file in previous_files}
+    merged_files.update((file.url, file) for file in files)
+    return list(merged_posts.values()), list(merged_files.values())
+
+
 def load_discovery_results(discovery_report_path):
     import json
     # Load discovery report
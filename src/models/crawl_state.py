@@ -0,0 +1,99 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+import json
+import os
+import re
+
+
+_POST_ID_PATTERN = re.compile(r'/video/(\d+)')
+
+
+@dataclass
+class CrawlState:
+    """Persistent record of crawled /video/<id> posts, used to plan incremental crawls."""
+
+    posts: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # post id → url, post_hash, last_crawled
+    high_watermark: int = 0  # Highest post id seen so far
+    updated_at: Optional[str] = None
+
+    @staticmethod
+    def post_id(url: str) -> Optional[str]:
+        """Return the numeric post id of a /video/<id> URL, or None when the URL has no id."""
+        match = _POST_ID_PATTERN.search(url)
+        return match.group(1) if match else None
+
+    def plan(self, post_urls: List[str], revisit: int = 0) -> List[str]:
+        """
+        Select the post URLs an incremental crawl should fetch.
+
+        Args:
+            post_urls: All post URLs found on the listing page, in listing order
+            revisit: Number of already-seen posts to re-fetch, least recently crawled first
+
+        Returns:
+            Unseen post URLs (in listing order) followed by the revisit sample
+        """
+        new_urls = []
+        seen_urls = []
+        for url in post_urls:
+            post_id = self.post_id(url)
+            if post_id is None or post_id not in self.posts:
+                new_urls.append(url)
+            else:
+                seen_urls.append(url)
+
+        seen_urls.sort(key=lambda url: self.posts[self.post_id(url)].get('last_crawled') or '')
+        return new_urls + seen_urls[:max(0, revisit)]
+
+    def record(self, url: str, post_hash: str) -> bool:
+        """
+        Record a crawled post.
+
+        Returns:
+            True when the post is new or its content hash changed since the last crawl
+        """
+        post_id = self.post_id(url)
+        if post_id is None:
+            return True
+
+        previous = self.posts.get(post_id)
+        self.posts[post_id] = {
+            'url': url,
+            'post_hash': post_hash,
+            'last_crawled': datetime.utcnow().isoformat() + "Z"
+        }
+        self.high_watermark = max(self.high_watermark, int(post_id))
+        return previous is None or previous.get('post_hash') != post_hash
+
+    @classmethod
+    def load(cls, path: str) -> 'CrawlState':
+        """Load state from a JSON file; a missing file yields an empty state."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls()
+
+        return cls(
+            posts=data.get('posts', {}),
+            high_watermark=data.get('high_watermark', 0),
+            updated_at=data.get('updated_at')
+        )
+
+    def save(self, path: str):
+        """Write state to a JSON file atomically."""
+        self.updated_at = datetime.utcnow().isoformat() + "Z"
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'high_watermark': self.high_watermark,
+                'updated_at': self.updated_at,
+                'posts': self.posts
+            }, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def __str__(self) -> str:
+        return f"CrawlState(posts={len(self.posts)}, high_watermark={self.high_watermark})"
@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from typing import Optional
+from .page_analysis import PageAnalysis, analyze_html
+
+
+@dataclass
+class FetchedPage:
+    """Raw HTML of a fetched post page and its single-parse analysis, shared between services."""
+
+    url: str
+    html: str
+    _analysis: Optional[PageAnalysis] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def analysis(self) -> PageAnalysis:
+        """Title, links and cleaned text, extracted on first access from one parse and reused afterwards."""
+        if self._analysis is None:
+            self._analysis = analyze_html(self.url, self.html)
+        return self._analysis
+
+    def __str__(self) -> str:
+        return f"FetchedPage(url='{self.url}', size={len(self.html)})"
@@ -22,6 +22,8 @@ class MaterialData:
     quality_rating: QualityRating
     source_file_hash: str
     sheet_position: Optional[str] = None  # e.g., "Sheet1!A1:C10"
+    # Series mode: {property: {"values": float64 array, "units": array}}; stored in a binary sidecar, not in the JSON
+    series: Dict[str, Dict[str, Any]] = field(default_factory=dict, repr=False, compare=False)
 
     def __post_init__(self):
         """Convert string quality rating to enum if necessary."""
@@ -81,7 +83,8 @@ class MaterialData:
     @classmethod
     def create_normalized(cls, material_name: str, source_file_hash: str,
                          properties: Dict[str, Any], quality: QualityRating,
-                         brand: Optional[str] = None) -> 'MaterialData':
+                         brand: Optional[str] = None,
+                         series: Optional[Dict[str, Dict[str, Any]]] = None) -> 'MaterialData':
         """Create MaterialData with normalized properties and specified quality rating."""
         # Separate normalized values from properties dict
         normalized_values = {}
@@ -106,7 +109,8 @@ class MaterialData:
             original_values=original_values,
             normalized_values=normalized_values,
             quality_rating=quality,
-            source_file_hash=source_file_hash
+            source_file_hash=source_file_hash,
+            series=series or {}
         )
 
     def to_dict(self) -> Dict[str, Any]:
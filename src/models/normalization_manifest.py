@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from datetime import datetime
+import json
+import os
+from .valid_file import ValidFile
+
+
+@dataclass
+class NormalizationManifest:
+    """Persistent record of the last normalization of each file, used to skip unchanged files."""
+
+    files: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # file key → sha256_hash, rules_fingerprint, storage_key, normalized_at
+    updated_at: Optional[str] = None
+
+    @staticmethod
+    def file_key(file: ValidFile) -> str:
+        """Identify a file across runs by its download URL (local path when the URL is unknown)."""
+        return file.url or file.file_path
+
+    def is_current(self, file: ValidFile, rules_fingerprint: str, storage_key: str) -> bool:
+        """
+        Check whether a file was already normalized with the same inputs.
+
+        Returns:
+            True when the recorded SHA-256, rule-set fingerprint and output storage key all match
+        """
+        entry = self.files.get(self.file_key(file))
+        return (entry is not None
+                and entry.get('sha256_hash') == file.sha256_hash
+                and entry.get('rules_fingerprint') == rules_fingerprint
+                and entry.get('storage_key') == storage_key)
+
+    def record(self, file: ValidFile, rules_fingerprint: str, storage_key: str):
+        """Record a file whose normalized output was written under storage_key."""
+        self.files[self.file_key(file)] = {
+            'sha256_hash': file.sha256_hash,
+            'rules_fingerprint': rules_fingerprint,
+            'storage_key': storage_key,
+            'normalized_at': datetime.utcnow().isoformat() + "Z"
+        }
+
+    @classmethod
+    def load(cls, path: str) -> 'NormalizationManifest':
+        """Load the manifest from a JSON file; a missing file yields an empty manifest."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls()
+
+        return cls(files=data.get('files', {}), updated_at=data.get('updated_at'))
+
+    def save(self, path: str):
+        """Write the manifest to a JSON file atomically."""
+        self.updated_at = datetime.utcnow().isoformat() + "Z"
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'updated_at': self.updated_at, 'files': self.files}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def __str__(self) -> str:
+        return f"NormalizationManifest(files={len(self.files)})"
@@ -0,0 +1,180 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from urllib.parse import urljoin
+import os
+import re
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+# lxml is the fast C-backed tree builder; without it BeautifulSoup's pure-Python parser is used
+try:
+    import lxml.etree  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Supported BeautifulSoup backends, fastest first (MTF_HTML_PARSER selects one)
+HTML_PARSERS = ('lxml', 'html.parser')
+
+# Link classification rules shared by the crawler (post metadata) and the parser (download links)
+YOUTUBE_PATTERNS = ('youtube.com/watch', 'youtu.be/', 'youtube.com/embed')
+MANUFACTURER_DOMAINS = (
+    'prusament.com', 'polymaker.com', 'hatchbox3d.com',
+    'overture3d.com', 'sunlu.com', 'esun3d.com'
+)
+FILE_LINK_EXTENSIONS = ('.xlsx', '.xls', '.csv', '.stl', '.zip')
+DOWNLOAD_SECTION_CLASSES = frozenset({'download', 'files', 'attachments', 'resources'})
+PROMOTIONAL_KEYWORDS = (
+    'patreon', 'buymeacoffee', 'paypal', 'donation', 'support',
+    'subscribe', 'like and subscribe', 'buy me a coffee'
+)
+PROMOTIONAL_CLASS_PATTERN = re.compile(r'(donation|support|patreon|subscribe)', re.I)
+
+
+@dataclass
+class PageAnalysis:
+    """Everything extracted from one post page, produced by a single parse."""
+
+    title: str
+    youtube_link: Optional[str]
+    manufacturer_links: List[str] = field(default_factory=list)
+    download_links: List[str] = field(default_factory=list)  # Absolute URLs, document order, no duplicates
+    cleaned_text: str = ""
+
+
+def html_parser_backend() -> str:
+    """
+    Return the BeautifulSoup backend to use: MTF_HTML_PARSER (default lxml).
+
+    Falls back to html.parser when lxml is requested but not installed.
+
+    Raises:
+        ValueError: When MTF_HTML_PARSER names an unsupported backend
+    """
+    requested = os.getenv('MTF_HTML_PARSER', 'lxml')
+    if requested not in HTML_PARSERS:
+        raise ValueError(f"Unsupported HTML parser '{requested}'. Must be one of: {HTML_PARSERS}")
+    if requested == 'lxml' and not LXML_AVAILABLE:
+        return 'html.parser'
+    return requested
+
+
+def parse_html(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse HTML with the given backend, or the configured one (see html_parser_backend)."""
+    return BeautifulSoup(html, parser or html_parser_backend())
+
+
+def analyze_html(url: str, html: str, parser: Optional[str] = None) -> PageAnalysis:
+    """
+    Parse a post page once and extract title, links and cleaned text from that single document.
+
+    Links are classified in one traversal of the tree; the cleaning rules then run on
+    the same tree (they remove elements, so they must come last).
+
+    Args:
+        url: URL of the page, used to resolve relative download links
+        html: Raw page HTML
+        parser: Optional BeautifulSoup backend overriding the configured one
+
+    Returns:
+        PageAnalysis with all extracted fields
+    """
+    soup = parse_html(html, parser)
+    analysis = _classify_links(soup, url)
+    analysis.cleaned_text = clean_document(soup)
+    return analysis
+
+
+def _classify_links(soup: BeautifulSoup, url: str) -> PageAnalysis:
+    """Walk the document once in order, picking the title and classifying every <a href>."""
+    title = None
+    youtube_link = None
+    manufacturer_links = []
+    download_links = []
+    seen_downloads = set()
+
+    # Depth-first, document order; the flag tells whether an ancestor is a "Download files" section
+    stack = [(soup, False)]
+    while stack:
+        tag, in_section = stack.pop()
+
+        if tag.name == 'h1' and title is None:
+            # Skip the site-name h1 (MyTechFun.com); the first other h1 is the real title
+            text = tag.get_text()
+            if 'MyTechFun.com' not in text:
+                title = text.strip()
+
+        elif tag.name == 'a' and tag.get('href') is not None:
+            href = tag.get('href')
+            if youtube_link is None and any(pattern in href for pattern in YOUTUBE_PATTERNS):
+                youtube_link = href
+            if any(domain in href for domain in MANUFACTURER_DOMAINS):
+                manufacturer_links.append(href)
+            if in_section or any(ext in href.lower() for ext in FILE_LINK_EXTENSIONS):
+                full_url = urljoin(url, href)
+                if full_url not in seen_downloads:
+                    seen_downloads.add(full_url)
+                    download_links.append(full_url)
+
+        children_in_section = in_section or _is_download_section(tag)
+        stack.extend((child, children_in_section)
+                     for child in reversed(tag.contents) if isinstance(child, Tag))
+
+    return PageAnalysis(
+        title=title if title is not None else "Unknown Title",
+        youtube_link=youtube_link,
+        manufacturer_links=manufacturer_links,
+        download_links=download_links
+    )
+
+
+def _is_download_section(tag: Tag) -> bool:
+    """A section holds download links: it has a download-ish class or its own text mentions 'download'."""
+    if DOWNLOAD_SECTION_CLASSES.intersection(tag.get('class') or ()):
+        return True
+    return any(type(child) in (NavigableString, CData) and 'download' in child.lower()
+               for child in tag.contents)
+
+
+def clean_document(soup: BeautifulSoup) -> str:
+    """
+    Clean a parsed post page in place and return its text, per specification:
+    - Remove header, footer, menu
+    - Remove first h1 containing "MyTechFun.com"
+    - Remove everything after last <hr>
+    - Remove self-promotional sections (Patreon, Buy Me a Coffee, etc.)
+    """
+    # Remove header, navigation, and menu elements
+    for element in soup.find_all(['header', 'nav', 'menu']):
+        element.decompose()
+
+    # Remove first h1 containing "MyTechFun.com"
+    for h1 in soup.find_all('h1'):
+        if 'MyTechFun.com' in h1.get_text():
+            h1.decompose()
+            break
+
+    # Find the last hr and remove everything after it (footer content)
+    hr_elements = soup.find_all('hr')
+    if hr_elements:
+        last_hr = hr_elements[-1]
+        for sibling in list(last_hr.next_siblings):
+            if hasattr(sibling, 'decompose'):
+                sibling.decompose()
+        last_hr.decompose()
+
+    # Remove self-promotional sections
+    for element in soup.find_all(string=True):
+        text_lower = element.lower() if isinstance(element, str) else ''
+        if any(keyword in text_lower for keyword in PROMOTIONAL_KEYWORDS):
+            if hasattr(element, 'parent') and element.parent:
+                element.parent.decompose()
+
+    # Remove common promotional div classes/ids
+    for element in soup.find_all(['div', 'section'], class_=PROMOTIONAL_CLASS_PATTERN):
+        element.decompose()
+
+    # Extract cleaned text and collapse whitespace
+    cleaned_text = soup.get_text(separator=' ', strip=True)
+    cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+
+    return cleaned_text.strip()
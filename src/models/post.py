@@ -1,9 +1,9 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 import hashlib
 from datetime import datetime
-import re
-from bs4 import BeautifulSoup
+from .fetched_page import FetchedPage
+from .page_analysis import clean_document, parse_html
 
 
 @dataclass
@@ -17,6 +17,7 @@ class Post:
     manufacturer_links: List[str]
     download_timestamp: str
     post_hash: Optional[str] = None
+    page: Optional[FetchedPage] = field(default=None, repr=False, compare=False)  # Not serialized
 
     def __post_init__(self):
         """Calculate SHA-256 hash of cleaned content for deduplication."""
@@ -31,7 +32,8 @@ class Post:
 
     @classmethod
     def from_html(cls, url: str, title: str, raw_html: str, youtube_link: Optional[str] = None,
-                  manufacturer_links: Optional[List[str]] = None) -> 'Post':
+                  manufacturer_links: Optional[List[str]] = None,
+                  page: Optional[FetchedPage] = None) -> 'Post':
         """Create Post from raw HTML with cleaning applied."""
         # Clean HTML content (remove header, footer, menu, etc.)
         cleaned_text = cls._clean_html_content(raw_html)
@@ -42,63 +44,41 @@ class Post:
             cleaned_text=cleaned_text,
             youtube_link=youtube_link,
             manufacturer_links=manufacturer_links or [],
-            download_timestamp=datetime.utcnow().isoformat() + "Z"
+            download_timestamp=datetime.utcnow().isoformat() + "Z",
+            page=page
         )
 
-    @staticmethod
-    def _clean_html_content(raw_html: str) -> str:
-        """
-        Clean HTML content per specification:
-        - Remove header, footer, menu
-        - Remove first h1 containing "MyTechFun.com"
-        - Remove everything after last <hr>
-        - Remove self-promotional sections (Patreon, Buy Me a Coffee, etc.)
-        """
-        soup = BeautifulSoup(raw_html, 'html.parser')
-
-        # Remove header, navigation, and menu elements
-        for element in soup.find_all(['header', 'nav', 'menu']):
-            element.decompose()
-
-        # Remove first h1 containing "MyTechFun.com"
-        h1_elements = soup.find_all('h1')
-        for h1 in h1_elements:
-            if 'MyTechFun.com' in h1.get_text():
-                h1.decompose()
-                break
-
-        # Find the last hr and remove everything after it (footer content)
-        hr_elements = soup.find_all('hr')
-        if hr_elements:
-            last_hr = hr_elements[-1]
-            # Remove all siblings after the last hr
-            for sibling in list(last_hr.next_siblings):
-                if hasattr(sibling, 'decompose'):
-                    sibling.decompose()
-            last_hr.decompose()
-
-        # Remove self-promotional sections
-        promotional_keywords = [
-            'patreon', 'buymeacoffee', 'paypal', 'donation', 'support',
-            'subscribe', 'like and subscribe', 'buy me a coffee'
-        ]
-
-        for element in soup.find_all(text=True):
-            text_lower = element.lower() if isinstance(element, str) else ''
-            if any(keyword in text_lower for keyword in promotional_keywords):
-                if hasattr(element, 'parent') and element.parent:
-                    element.parent.decompose()
+    @classmethod
+    def from_page(cls, page: FetchedPage) -> 'Post':
+        """Create Post from a fetched page, using its single-parse analysis."""
+        analysis = page.analysis
 
-        # Remove common promotional div classes/ids
-        for element in soup.find_all(['div', 'section'], class_=re.compile(r'(donation|support|patreon|subscribe)', re.I)):
-            element.decompose()
+        return cls(
+            url=page.url,
+            title=analysis.title,
+            cleaned_text=analysis.cleaned_text,
+            youtube_link=analysis.youtube_link,
+            manufacturer_links=list(analysis.manufacturer_links),
+            download_timestamp=datetime.utcnow().isoformat() + "Z",
+            page=page
+        )
 
-        # Extract and return cleaned text
-        cleaned_text = soup.get_text(separator=' ', strip=True)
-        # Remove extra whitespace
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert Post to dictionary for JSON serialization (the fetched page is not included)."""
+        return {
+            "url": self.url,
+            "title": self.title,
+            "cleaned_text": self.cleaned_text,
+            "youtube_link": self.youtube_link,
+            "manufacturer_links": self.manufacturer_links,
+            "download_timestamp": self.download_timestamp,
+            "post_hash": self.post_hash
+        }
 
-        return cleaned_text.strip()
+    @staticmethod
+    def _clean_html_content(raw_html: str) -> str:
+        """Clean HTML content per specification (see page_analysis.clean_document)."""
+        return clean_document(parse_html(raw_html))
 
     def __str__(self) -> str:
         return f"Post(url='{self.url}', title='{self.title}', hash='{self.post_hash[:8]}...')"
@@ -1,10 +1,14 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
 import hashlib
 import os
+import tempfile
 from datetime import datetime
 
 
+VALID_FILE_TYPES = {'.xlsx', '.xls', '.csv'}
+
+
 @dataclass
 class ValidFile:
     """Represents a downloaded spreadsheet file from a post."""
@@ -26,9 +30,8 @@ class ValidFile:
 
     def _validate_file_type(self):
         """Validate that file type is one of the allowed spreadsheet formats."""
-        valid_types = {'.xlsx', '.xls', '.csv'}
-        if self.file_type not in valid_types:
-            raise ValueError(f"Invalid file type '{self.file_type}'. Must be one of: {valid_types}")
+        if self.file_type not in VALID_FILE_TYPES:
+            raise ValueError(f"Invalid file type '{self.file_type}'. Must be one of: {VALID_FILE_TYPES}")
 
     def _calculate_file_hash(self) -> str:
         """Calculate SHA-256 hash of file content for deduplication."""
@@ -70,6 +73,60 @@ class ValidFile:
             url=url
         )
 
+    @classmethod
+    def from_stream(cls, url: str, filename: str, chunks: Iterable[bytes], source_post_url: str,
+                    storage_dir: str = "data/raw", max_bytes: Optional[int] = None) -> 'ValidFile':
+        """
+        Create ValidFile by streaming downloaded chunks to disk while hashing them.
+
+        Chunks are written to a temporary file in storage_dir and the SHA-256 digest is
+        updated as they arrive; the file is then atomically renamed to
+        <sha256>_<filename>, so memory use does not depend on the file size and a
+        partial download never appears under its final name.
+
+        Raises:
+            ValueError: When the file type is not allowed or the download exceeds max_bytes
+        """
+        file_type = os.path.splitext(filename)[1].lower()
+        if file_type not in VALID_FILE_TYPES:
+            raise ValueError(f"Invalid file type '{file_type}'. Must be one of: {VALID_FILE_TYPES}")
+
+        os.makedirs(storage_dir, exist_ok=True)
+        hash_obj = hashlib.sha256()
+        file_size = 0
+
+        fd, tmp_path = tempfile.mkstemp(dir=storage_dir, prefix=".download-", suffix=".part")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    if not chunk:
+                        continue
+                    file_size += len(chunk)
+                    if max_bytes and file_size > max_bytes:
+                        raise ValueError(f"Download exceeds maximum size of {max_bytes} bytes")
+                    hash_obj.update(chunk)
+                    f.write(chunk)
+
+            file_hash = hash_obj.hexdigest()
+            file_path = os.path.join(storage_dir, f"{file_hash}_{filename}")
+            os.replace(tmp_path, file_path)
+
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return cls(
+            filename=filename,
+            file_type=file_type,
+            sha256_hash=file_hash,
+            file_path=file_path,
+            download_timestamp=datetime.utcnow().isoformat() + "Z",
+            source_post_url=source_post_url,
+            file_size=file_size,
+            url=url
+        )
+
     def validate(self) -> bool:
         """Validate required fields and file existence."""
         required_fields = [
@@ -0,0 +1,249 @@
+import asyncio
+import queue
+import threading
+import time
+from contextlib import asynccontextmanager, nullcontext
+from typing import Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+import aiohttp
+from tenacity import retry, stop_after_attempt, wait_exponential
+import structlog
+from models.post import Post
+from models.crawl_state import CrawlState
+from services.crawler_service import CrawlerService, CrawlerError
+from services.http_cache import HttpCache
+from services.checkpoint_service import CheckpointService
+
+
+class HostScheduler:
+    """Per-host token bucket allowing N in-flight requests with a minimum spacing between request starts."""
+
+    def __init__(self, concurrency: int, min_interval: float):
+        self.concurrency = max(1, concurrency)
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def reset_slots(self):
+        """
+        Drop the hosts' semaphores and locks before a new crawl: they are bound to the event loop
+        of the crawl that first waited on them. Request start spacing carries over.
+        """
+        self._semaphores.clear()
+        self._locks.clear()
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Hold one of the host's in-flight slots for the duration of a request."""
+        host = urlparse(url).netloc
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.concurrency))
+        async with semaphore:
+            await self._take_token(host)
+            yield
+
+    async def _take_token(self, host: str):
+        """Reserve the next start time for this host and sleep until it is reached."""
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, 0.0))
+            self._next_start[host] = start + self.min_interval
+
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class AsyncCrawlerService(CrawlerService):
+    """Concurrent variant of CrawlerService that keeps the same politeness guarantees."""
+
+    def __init__(self, concurrency: int = 4, cache: Optional[HttpCache] = None,
+                 state: Optional[CrawlState] = None, revisit: int = 0,
+                 checkpoint: Optional[CheckpointService] = None):
+        super().__init__(cache=cache, state=state, revisit=revisit, checkpoint=checkpoint)
+        self.logger = structlog.get_logger("mtf_crawler.async_crawler")
+        self.concurrency = max(1, concurrency)
+        self.scheduler = HostScheduler(self.concurrency, self.rate_limit_delay)
+
+    def crawl_posts(self, base_url: str, max_posts: Optional[int] = None) -> List[Post]:
+        """
+        Crawl material test posts concurrently, blocking until the crawl completes.
+
+        Args:
+            base_url: The base URL to start crawling from
+            max_posts: Optional limit on the number of post pages fetched
+
+        Returns:
+            List of Post objects in listing order
+
+        Raises:
+            CrawlerError: When crawling fails or robots.txt violation
+        """
+        return asyncio.run(self.crawl_posts_async(base_url, max_posts))
+
+    def iter_posts(self, base_url: str, max_posts: Optional[int] = None) -> Iterator[Post]:
+        """
+        Yield deduplicated posts in completion order while the async crawl runs in a background thread.
+
+        Posts are handed over through a queue of `concurrency` posts, and no post is fetched
+        while the posts already fetched wait for room in it, so a slow consumer slows the crawl
+        down. Closing the iterator early cancels the crawl.
+
+        Raises:
+            CrawlerError: When crawling fails or robots.txt violation
+        """
+        completed: queue.Queue = queue.Queue(maxsize=self.concurrency)
+        stop = threading.Event()
+        finished = object()
+
+        def hand_over(item):
+            # Blocks the calling worker thread, not the event loop, until the consumer has room
+            while not stop.is_set():
+                try:
+                    completed.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        loop = asyncio.new_event_loop()
+        crawl = loop.create_task(self.crawl_posts_async(base_url, max_posts, on_post=hand_over))
+
+        def run_crawl():
+            try:
+                loop.run_until_complete(crawl)
+                hand_over(finished)
+            except asyncio.CancelledError:
+                pass
+            except BaseException as e:
+                hand_over(e)
+            finally:
+                loop.run_until_complete(loop.shutdown_default_executor())
+                loop.close()
+
+        threading.Thread(target=run_crawl, name="async-crawl", daemon=True).start()
+
+        processed_hashes = set()
+        try:
+            while True:
+                item = completed.get()
+                if item is finished:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                if item.post_hash not in processed_hashes:
+                    processed_hashes.add(item.post_hash)
+                    yield item
+        finally:
+            stop.set()
+            try:
+                loop.call_soon_threadsafe(crawl.cancel)
+            except RuntimeError:
+                pass  # The crawl has finished and its loop is closed
+
+    async def crawl_posts_async(self, base_url: str, max_posts: Optional[int] = None,
+                                on_post: Optional[Callable[[Post], None]] = None) -> List[Post]:
+        """
+        Async implementation of crawl_posts with up to `concurrency` requests in flight per host.
+
+        on_post is called with each post as it completes, in a worker thread so it may block;
+        at most `concurrency` fetched posts wait on it before fetching pauses.
+        """
+        self.logger.info("Starting async post crawling", base_url=base_url, concurrency=self.concurrency)
+        # Each crawl runs in its own event loop (asyncio.run)
+        self.scheduler.reset_slots()
+
+        # Check robots.txt compliance
+        if not await asyncio.to_thread(self._check_robots_txt, base_url):
+            raise CrawlerError("Robots.txt disallows crawling this URL")
+
+        try:
+            headers = {'User-Agent': self.session.headers.get('User-Agent')}
+            timeout = aiohttp.ClientTimeout(total=30)
+            async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+                post_urls = self._checkpointed_frontier()
+                if not post_urls:
+                    listing_html = await self._fetch(session, base_url, stage='listing')
+                    post_urls = self._parse_post_urls(listing_html, base_url)
+                    self.logger.info("Found post URLs", count=len(post_urls))
+                    post_urls = self._select_post_urls(post_urls, max_posts)
+
+                restored, remaining = self._restore_posts(post_urls)
+                if on_post:
+                    for post in restored:
+                        await asyncio.to_thread(on_post, post)
+
+                pending = asyncio.Semaphore(self.concurrency) if on_post else None
+                fetched = await asyncio.gather(
+                    *(self._crawl_post_async(session, url, on_post, pending) for url in remaining)
+                )
+                results = dict(zip(remaining, fetched))
+                results.update((post.url, post) for post in restored)
+
+        except Exception as e:
+            self.logger.error("Crawling failed", error=str(e))
+            raise CrawlerError(f"Failed to crawl posts: {str(e)}")
+
+        # Deduplicate in listing order so output matches the sequential engine
+        posts = []
+        processed_hashes = set()
+        for url in post_urls:
+            post = results.get(url)
+            if post is None:
+                continue
+            if post.post_hash in processed_hashes:
+                self.logger.info("Duplicate post skipped", url=url, hash=post.post_hash[:8])
+                continue
+            posts.append(post)
+            processed_hashes.add(post.post_hash)
+
+        self.logger.info("Crawling completed", total_posts=len(posts))
+        return posts
+
+    async def _crawl_post_async(self, session: aiohttp.ClientSession, url: str,
+                                on_post: Optional[Callable[[Post], None]] = None,
+                                pending: Optional[asyncio.Semaphore] = None) -> Optional[Post]:
+        """
+        Fetch a single post and build it off the event loop; failures are logged, not raised.
+
+        `pending` is held from the fetch until on_post returns, bounding the posts fetched ahead
+        of the consumer.
+        """
+        try:
+            async with pending or nullcontext():
+                html = await self._fetch(session, url)
+                post = await asyncio.to_thread(self._build_post, url, html)
+                self._record_post(post)
+                self.logger.info("Post processed", url=url, hash=post.post_hash[:8])
+                if on_post:
+                    await asyncio.to_thread(on_post, post)
+            return post
+
+        except Exception as e:
+            self.logger.error("Failed to process post", url=url, error=str(e))
+            return None
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        reraise=True
+    )
+    async def _fetch(self, session: aiohttp.ClientSession, url: str, stage: str = 'post') -> str:
+        """Make a scheduled HTTP GET with retry logic, returning the response body (revalidated via the cache)."""
+        cached = self.cache.get_text(url) if self.cache else None
+        headers = self.cache.conditional_headers(url) if cached is not None else None
+
+        async with self.scheduler.slot(url):
+            self.logger.debug("Making request", url=url, stage=stage)
+            self.request_counts[stage] += 1
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and cached is not None:
+                    self.cache.record_hit(url, len(cached.encode('utf-8')))
+                    return cached
+
+                response.raise_for_status()
+                text = await response.text()
+
+        if self.cache:
+            self.cache.record_miss(url)
+            self.cache.store(url, response.headers, text)
+        return text
@@ -0,0 +1,122 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+import structlog
+from models.post import Post
+from models.valid_file import ValidFile
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    url TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending'
+);
+CREATE TABLE IF NOT EXISTS posts (
+    url TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    files_done INTEGER NOT NULL DEFAULT 0,
+    completed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    url TEXT NOT NULL,
+    source_post_url TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (url, source_post_url)
+);
+"""
+
+
+class CheckpointService:
+    """SQLite checkpoint of a discovery run (frontier, completed posts, downloaded files) for --resume."""
+
+    def __init__(self, db_path: str = "data/state/checkpoint.sqlite"):
+        self.logger = structlog.get_logger("mtf_crawler.checkpoint")
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+
+        # Shared by the crawl, download and pipeline threads; every write commits immediately
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def clear(self):
+        """Forget all checkpointed work (start of a fresh run, or after results are saved)."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM frontier")
+            self._connection.execute("DELETE FROM posts")
+            self._connection.execute("DELETE FROM files")
+        self.logger.info("Checkpoint cleared", path=self.db_path)
+
+    def save_frontier(self, post_urls: List[str]):
+        """Record the post URLs planned for this run, keeping the status of URLs already known."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO frontier (url, position) VALUES (?, ?)",
+                [(url, position) for position, url in enumerate(post_urls)]
+            )
+
+    def load_frontier(self) -> List[str]:
+        """Return the checkpointed post URLs in their original order (empty when nothing is stored)."""
+        with self._lock:
+            rows = self._connection.execute("SELECT url FROM frontier ORDER BY position").fetchall()
+        return [url for (url,) in rows]
+
+    def record_post(self, post: Post):
+        """Store a crawled post and mark its frontier entry as done."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO posts (url, data, files_done, completed_at) VALUES (?, ?, 0, ?)",
+                (post.url, json.dumps(post.to_dict()), datetime.utcnow().isoformat() + "Z")
+            )
+            self._connection.execute("UPDATE frontier SET status = 'done' WHERE url = ?", (post.url,))
+
+    def completed_posts(self) -> Dict[str, Post]:
+        """Return the checkpointed posts keyed by URL."""
+        with self._lock:
+            rows = self._connection.execute("SELECT url, data FROM posts").fetchall()
+        return {url: Post(**json.loads(data)) for url, data in rows}
+
+    def record_files(self, post_url: str, files: List[ValidFile]):
+        """Store the files extracted from a post and mark the post's downloads as finished."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO files (url, source_post_url, data) VALUES (?, ?, ?)",
+                [(file.url, post_url, json.dumps(file.__dict__)) for file in files]
+            )
+            self._connection.execute("UPDATE posts SET files_done = 1 WHERE url = ?", (post_url,))
+
+    def files_for(self, post_url: str) -> Optional[List[ValidFile]]:
+        """
+        Return the checkpointed files of a post.
+
+        Returns:
+            The post's files when its downloads finished in a previous run, otherwise None
+        """
+        with self._lock:
+            done = self._connection.execute(
+                "SELECT 1 FROM posts WHERE url = ? AND files_done = 1", (post_url,)
+            ).fetchone()
+            if not done:
+                return None
+            rows = self._connection.execute(
+                "SELECT data FROM files WHERE source_post_url = ?", (post_url,)
+            ).fetchall()
+
+        return [ValidFile(**json.loads(data)) for (data,) in rows]
+
+    def progress(self) -> Dict[str, int]:
+        """Count frontier URLs, completed posts and checkpointed files."""
+        with self._lock:
+            frontier = self._connection.execute("SELECT COUNT(*) FROM frontier").fetchone()[0]
+            posts = self._connection.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+            files = self._connection.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        return {'frontier': frontier, 'posts_completed': posts, 'files_completed': files}
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
@@ -1,31 +1,44 @@
+import os
 import time
 import requests
-from bs4 import BeautifulSoup
-from typing import List
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
 from urllib.robotparser import RobotFileParser
 from tenacity import retry, stop_after_attempt, wait_exponential
 import structlog
 from models.post import Post
+from models.fetched_page import FetchedPage
+from models.page_analysis import parse_html
+from models.crawl_state import CrawlState
+from services.http_cache import HttpCache
+from services.checkpoint_service import CheckpointService
 
 
 class CrawlerService:
     """Service for crawling material test posts from MyTechFun.com with constitutional compliance."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[HttpCache] = None, state: Optional[CrawlState] = None,
+                 revisit: int = 0, checkpoint: Optional[CheckpointService] = None):
         self.logger = structlog.get_logger("mtf_crawler.crawler")
+        self.cache = cache  # Optional persistent HTTP cache for listing and post pages
+        self.state = state  # Incremental mode: only unseen post ids plus a revisit sample are fetched
+        self.revisit = revisit
+        self.checkpoint = checkpoint  # Completed posts are checkpointed and restored instead of re-fetched
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'mytechfun-research-bot/1.0 (contact: research@example.com)'
         })
-        self.rate_limit_delay = 1.0  # Minimum delay between requests (seconds)
+        self.rate_limit_delay = float(os.getenv('MTF_RATE_LIMIT_DELAY', '1.0'))  # Minimum delay between requests (seconds)
         self.last_request_time = 0.0
+        self.request_counts = Counter()  # HTTP requests issued per stage (robots, listing, post)
 
-    def crawl_posts(self, base_url: str) -> List[Post]:
+    def crawl_posts(self, base_url: str, max_posts: Optional[int] = None) -> List[Post]:
         """
         Crawl material test posts from MyTechFun.com per constitutional requirements.
 
         Args:
             base_url: The base URL to start crawling from
+            max_posts: Optional limit on the number of post pages fetched
 
         Returns:
             List of Post objects with extracted content
@@ -34,49 +47,124 @@ class CrawlerService:
             CrawlerError: When crawling fails or robots.txt violation
             RateLimitError: When rate limiting is required
         """
+        return list(self.iter_posts(base_url, max_posts))
+
+    def iter_posts(self, base_url: str, max_posts: Optional[int] = None) -> Iterator[Post]:
+        """
+        Crawl posts like crawl_posts, yielding each deduplicated Post as soon as it is built.
+
+        Raises:
+            CrawlerError: When crawling fails or robots.txt violation
+        """
         self.logger.info("Starting post crawling", base_url=base_url)
 
         # Check robots.txt compliance
         if not self._check_robots_txt(base_url):
             raise CrawlerError("Robots.txt disallows crawling this URL")
 
-        posts = []
+        posts_count = 0
         processed_hashes = set()  # For deduplication
 
         try:
-            # Get list of post URLs from main page
-            post_urls = self._extract_post_urls(base_url)
-            self.logger.info("Found post URLs", count=len(post_urls))
+            # Get list of post URLs from main page, unless an interrupted run's frontier is checkpointed
+            post_urls = self._checkpointed_frontier()
+            if not post_urls:
+                post_urls = self._extract_post_urls(base_url)
+                self.logger.info("Found post URLs", count=len(post_urls))
+                post_urls = self._select_post_urls(post_urls, max_posts)
+
+            restored, post_urls = self._restore_posts(post_urls)
+            for post in restored:
+                if post.post_hash not in processed_hashes:
+                    processed_hashes.add(post.post_hash)
+                    posts_count += 1
+                    yield post
 
             for url in post_urls:
                 self._apply_rate_limiting()
 
                 try:
                     post = self._crawl_single_post(url)
-                    if post and post.post_hash not in processed_hashes:
-                        posts.append(post)
-                        processed_hashes.add(post.post_hash)
-                        self.logger.info("Post processed", url=url, hash=post.post_hash[:8])
-                    elif post:
-                        self.logger.info("Duplicate post skipped", url=url, hash=post.post_hash[:8])
-
                 except Exception as e:
                     self.logger.error("Failed to process post", url=url, error=str(e))
                     continue
 
-            self.logger.info("Crawling completed", total_posts=len(posts))
-            return posts
+                if post:
+                    # Duplicates are recorded too, so the incremental plan does not fetch them again
+                    self._record_post(post)
+                if post and post.post_hash not in processed_hashes:
+                    processed_hashes.add(post.post_hash)
+                    posts_count += 1
+                    self.logger.info("Post processed", url=url, hash=post.post_hash[:8])
+                    yield post
+                elif post:
+                    self.logger.info("Duplicate post skipped", url=url, hash=post.post_hash[:8])
+
+            self.logger.info("Crawling completed", total_posts=posts_count)
 
         except Exception as e:
             self.logger.error("Crawling failed", error=str(e))
             raise CrawlerError(f"Failed to crawl posts: {str(e)}")
 
+    def _select_post_urls(self, post_urls: List[str], max_posts: Optional[int] = None) -> List[str]:
+        """Apply the incremental crawl plan (when a crawl state is set) and the max_posts limit."""
+        if self.state is not None:
+            total = len(post_urls)
+            post_urls = self.state.plan(post_urls, self.revisit)
+            self.logger.info("Incremental crawl planned",
+                             total_found=total,
+                             to_fetch=len(post_urls),
+                             revisit=self.revisit,
+                             high_watermark=self.state.high_watermark)
+
+        if max_posts and len(post_urls) > max_posts:
+            post_urls = post_urls[:max_posts]
+            self.logger.info("Limited posts for processing", max_posts=max_posts)
+
+        if self.checkpoint is not None:
+            self.checkpoint.save_frontier(post_urls)
+
+        return post_urls
+
+    def _checkpointed_frontier(self) -> List[str]:
+        """Return the frontier of an interrupted run being resumed (empty when there is none)."""
+        if self.checkpoint is None:
+            return []
+
+        post_urls = self.checkpoint.load_frontier()
+        if post_urls:
+            self.logger.info("Resuming checkpointed frontier", count=len(post_urls))
+        return post_urls
+
+    def _restore_posts(self, post_urls: List[str]) -> Tuple[List[Post], List[str]]:
+        """Split the frontier into posts completed by an interrupted run and URLs still to fetch."""
+        if self.checkpoint is None:
+            return [], post_urls
+
+        completed = self.checkpoint.completed_posts()
+        restored = [completed[url] for url in post_urls if url in completed]
+        remaining = [url for url in post_urls if url not in completed]
+        if restored:
+            self.logger.info("Restored posts from checkpoint", restored=len(restored), remaining=len(remaining))
+
+        for post in restored:
+            self._record_post(post, restored=True)
+        return restored, remaining
+
+    def _record_post(self, post: Post, restored: bool = False):
+        """Record a crawled post in the incremental crawl state and the run checkpoint."""
+        if self.state is not None and not self.state.record(post.url, post.post_hash) and not restored:
+            self.logger.info("Revisited post unchanged", url=post.url)
+        if self.checkpoint is not None and not restored:
+            self.checkpoint.record_post(post)
+
     def _check_robots_txt(self, base_url: str) -> bool:
         """Check robots.txt compliance per constitutional requirements."""
         try:
             robots_url = f"{base_url.split('/')[0]}//{base_url.split('//')[1].split('/')[0]}/robots.txt"
             rp = RobotFileParser()
             rp.set_url(robots_url)
+            self.request_counts['robots'] += 1
             rp.read()
 
             user_agent = self.session.headers.get('User-Agent', '*')
@@ -106,17 +194,29 @@ class CrawlerService:
         wait=wait_exponential(multiplier=1, min=4, max=10),
         reraise=True
     )
-    def _make_request(self, url: str) -> requests.Response:
+    def _make_request(self, url: str, stage: str = 'post',
+                      headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """Make HTTP request with retry logic and jitter."""
-        self.logger.debug("Making request", url=url)
-        response = self.session.get(url, timeout=30)
+        self.logger.debug("Making request", url=url, stage=stage)
+        self.request_counts[stage] += 1
+        response = self.session.get(url, timeout=30, headers=headers)
         response.raise_for_status()
         return response
 
+    def _fetch_text(self, url: str, stage: str = 'post') -> str:
+        """GET a page body, revalidating against the HTTP cache when one is configured."""
+        if self.cache is None:
+            return self._make_request(url, stage).text
+        return self.cache.fetch_text(url, lambda headers: self._make_request(url, stage, headers))
+
     def _extract_post_urls(self, base_url: str) -> List[str]:
         """Extract individual post URLs from the main material test page."""
-        response = self._make_request(base_url)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        html = self._fetch_text(base_url, stage='listing')
+        return self._parse_post_urls(html, base_url)
+
+    def _parse_post_urls(self, html: str, base_url: str) -> List[str]:
+        """Parse post URLs out of the listing page HTML."""
+        soup = parse_html(html)
 
         post_urls = []
 
@@ -157,69 +257,12 @@ class CrawlerService:
 
     def _crawl_single_post(self, url: str) -> Post:
         """Crawl a single post and extract relevant information."""
-        response = self._make_request(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Extract title - skip first h1 (MyTechFun.com) and use second h1
-        title = "Unknown Title"
-        h1_elements = soup.find_all('h1')
-        for h1 in h1_elements:
-            # Skip the first h1 if it contains "MyTechFun.com"
-            if 'MyTechFun.com' in h1.get_text():
-                continue
-            # Use the first h1 that doesn't contain "MyTechFun.com" (which is the real title)
-            title = h1.get_text().strip()
-            break
-
-        # Find and extract YouTube link
-        youtube_link = self._extract_youtube_link(soup)
-
-        # Find manufacturer links
-        manufacturer_links = self._extract_manufacturer_links(soup)
-
-        # Create Post with cleaned content
-        post = Post.from_html(
-            url=url,
-            title=title,
-            raw_html=response.text,
-            youtube_link=youtube_link,
-            manufacturer_links=manufacturer_links
-        )
-
-        return post
-
-    def _extract_youtube_link(self, soup: BeautifulSoup) -> str:
-        """Extract YouTube review link from post content."""
-        # Look for YouTube links in various formats
-        youtube_patterns = [
-            'youtube.com/watch',
-            'youtu.be/',
-            'youtube.com/embed'
-        ]
-
-        for link in soup.find_all('a', href=True):
-            href = link.get('href')
-            if any(pattern in href for pattern in youtube_patterns):
-                return href
-
-        return None
-
-    def _extract_manufacturer_links(self, soup: BeautifulSoup) -> List[str]:
-        """Extract filament manufacturer links from post content."""
-        manufacturer_links = []
-
-        # Common manufacturer domains to look for
-        manufacturer_domains = [
-            'prusament.com', 'polymaker.com', 'hatchbox3d.com',
-            'overture3d.com', 'sunlu.com', 'esun3d.com'
-        ]
-
-        for link in soup.find_all('a', href=True):
-            href = link.get('href')
-            if any(domain in href for domain in manufacturer_domains):
-                manufacturer_links.append(href)
+        html = self._fetch_text(url)
+        return self._build_post(url, html)
 
-        return manufacturer_links
+    def _build_post(self, url: str, html: str) -> Post:
+        """Build a Post from the HTML of a single post page (parsed once, shared with the parser)."""
+        return Post.from_page(FetchedPage(url=url, html=html))
 
 
 class CrawlerError(Exception):
@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Mapping, Optional
+import structlog
+
+
+class HttpCache:
+    """On-disk HTTP cache revalidated with ETag / Last-Modified conditional requests."""
+
+    def __init__(self, cache_dir: str = "data/cache/http"):
+        self.logger = structlog.get_logger("mtf_crawler.http_cache")
+        self.cache_dir = cache_dir
+        self.stats = Counter()  # hits (304 revalidated), misses, bytes_saved
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def fetch_text(self, url: str, fetch: Callable[[Dict[str, str]], Any]) -> str:
+        """
+        Fetch a page body through the cache.
+
+        Args:
+            url: URL being fetched (the cache key)
+            fetch: Callable performing the GET with the given extra headers and
+                returning a requests-style response (status_code, headers, text)
+
+        Returns:
+            The cached body on 304 Not Modified, otherwise the fresh body (which is stored)
+        """
+        cached = self.get_text(url)
+        response = fetch(self.conditional_headers(url) if cached is not None else {})
+
+        if response.status_code == 304 and cached is not None:
+            self.record_hit(url, len(cached.encode('utf-8')))
+            return cached
+
+        self.record_miss(url)
+        self.store(url, response.headers, response.text)
+        return response.text
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from the stored validators."""
+        entry = self._read_entry(url)
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def get_text(self, url: str) -> Optional[str]:
+        """Return the cached body for a URL, or None when nothing usable is stored."""
+        entry = self._read_entry(url)
+        if not entry or not entry.get('has_body'):
+            return None
+
+        try:
+            with open(self._path(url, '.body'), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def store(self, url: str, headers: Mapping[str, str], text: Optional[str] = None):
+        """Store a response's validators and, for pages, its body; responses without validators are not cached."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        if text is not None:
+            self._write(self._path(url, '.body'), text)
+
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'has_body': text is not None,
+            'stored_at': datetime.utcnow().isoformat() + "Z"
+        }
+        self._write(self._path(url, '.json'), json.dumps(entry, indent=2))
+
+    def record_hit(self, url: str, size: int = 0):
+        """Count a 304 revalidation served from the cache."""
+        with self._lock:
+            self.stats['hits'] += 1
+            self.stats['bytes_saved'] += size
+        self.logger.debug("Cache hit", url=url)
+
+    def record_miss(self, url: str):
+        """Count a request that had to transfer the full body."""
+        with self._lock:
+            self.stats['misses'] += 1
+        self.logger.debug("Cache miss", url=url)
+
+    def _read_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(url, '.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + suffix)
+
+    def _write(self, path: str, content: str):
+        """Write atomically so concurrent readers never see a partial entry."""
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
@@ -0,0 +1,207 @@
+import hashlib
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import numpy as np
+import pandas as pd
+import structlog
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from models.valid_file import ValidFile
+from services.sheet_cache import SheetCache
+from services.workbook_loader import Workbook
+
+# Sheet layouts and the parser that handles each one
+#   horizontal  - header row of properties, one row per material
+#   vertical    - property labels down one column, values in the next (a single material)
+#   matrix      - no header row: titled blocks of material rows x test columns scattered over the sheet
+#   time_series - all-numeric channels (time, force, displacement, ...) over many rows (one test's raw data)
+#   empty       - nothing to parse
+LAYOUT_PARSERS: Dict[str, Optional[str]] = {
+    'horizontal': 'table_row_parser',
+    'vertical': 'property_value_parser',
+    'matrix': 'table_row_parser',
+    'time_series': 'series_parser',
+    'empty': None
+}
+
+# Rows looked at to fingerprint a sheet
+SAMPLE_ROWS = 20
+
+# Bump when the fingerprint features or the classification rules change; cached decisions are then ignored
+LAYOUT_RULES_VERSION = "1"
+
+_NUMERIC_TEXT = re.compile(r'^\s*[-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?\s*$')
+
+
+@dataclass(frozen=True)
+class SheetFingerprint:
+    """
+    Cheap structural summary of a sheet, taken from its header and first rows only.
+
+    The layout is a function of these features alone, so sheets built from the same
+    template share a fingerprint and the decision made for one applies to all.
+    """
+
+    header_kinds: str   # per column: 'h' named, 'u' unnamed/empty, 'n' numeric header
+    column_kinds: str   # per column over the sampled rows: 'n' numeric, 't' text, 'm' mixed, '-' empty
+    rows_bucket: int    # floor(log2(rows + 1))
+    monotonic_first_numeric: bool  # first all-numeric column never decreases in the sample
+
+    @property
+    def key(self) -> str:
+        """Stable identifier of the fingerprint, used as the decision cache key."""
+        signature = (f"{LAYOUT_RULES_VERSION}|{self.header_kinds}|{self.column_kinds}|"
+                     f"{self.rows_bucket}|{int(self.monotonic_first_numeric)}")
+        return hashlib.sha1(signature.encode('utf-8')).hexdigest()[:16]
+
+    @classmethod
+    def of(cls, df: pd.DataFrame) -> 'SheetFingerprint':
+        """Fingerprint a sheet from its header row, dtypes, shape and first SAMPLE_ROWS rows."""
+        sample = df.iloc[:SAMPLE_ROWS]
+        header_kinds = ''.join(_header_kind(column) for column in df.columns)
+        column_kinds = ''.join(_column_kind(sample.iloc[:, position]) for position in range(sample.shape[1]))
+
+        monotonic = False
+        first_numeric = column_kinds.find('n')
+        if first_numeric >= 0:
+            values = pd.to_numeric(sample.iloc[:, first_numeric], errors='coerce').dropna().to_numpy(dtype=float)
+            monotonic = len(values) > 1 and bool(np.all(np.diff(values) >= 0))
+
+        return cls(header_kinds, column_kinds, int(math.log2(len(df) + 1)), monotonic)
+
+
+@dataclass(frozen=True)
+class SheetLayout:
+    """Layout decision for one sheet."""
+
+    layout: str
+    fingerprint: str
+
+    @property
+    def parser(self) -> Optional[str]:
+        return LAYOUT_PARSERS[self.layout]
+
+
+class LayoutDetector:
+    """
+    Labels sheets as horizontal, vertical, matrix, time_series or empty.
+
+    Decisions are cached per fingerprint, so a sheet matching a known template is
+    dispatched without re-classifying it; decisions made during discovery are stored in
+    the discovery report and preloaded by the normalize phase.
+    """
+
+    def __init__(self, decisions: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            decisions: Previously made fingerprint key → layout decisions
+        """
+        self.logger = structlog.get_logger("mtf_crawler.layout_detector")
+        self.decisions: Dict[str, str] = {}
+        self.stats = Counter()  # hits (decision reused), misses (sheet classified)
+        if decisions:
+            self.remember(decisions)
+
+    def remember(self, decisions: Dict[str, str]):
+        """Add decisions from an earlier run; unknown layout labels are ignored."""
+        self.decisions.update((key, layout) for key, layout in decisions.items() if layout in LAYOUT_PARSERS)
+
+    def detect(self, df: pd.DataFrame) -> SheetLayout:
+        """Return the layout of a sheet, reusing the decision for its fingerprint when there is one."""
+        fingerprint = SheetFingerprint.of(df)
+        key = fingerprint.key
+        layout = self.decisions.get(key)
+        if layout is not None:
+            self.stats['hits'] += 1
+        else:
+            self.stats['misses'] += 1
+            layout = classify_layout(fingerprint)
+            self.decisions[key] = layout
+        return SheetLayout(layout, key)
+
+    def detect_file(self, file: ValidFile, reader_engine: str = 'auto',
+                    sheet_cache: Optional[SheetCache] = None) -> List[Dict[str, Any]]:
+        """
+        Detect the layout of every sheet of a downloaded file.
+
+        Sheets are read as the normalizer reads them, table only (see Workbook.table), and
+        through the same sheet cache, so normalization does not parse the file again.
+
+        Returns:
+            One entry per sheet: file name, hash, sheet name, layout, parser, fingerprint key,
+            the range read and the regions skipped; an unreadable file yields no entries
+        """
+        try:
+            with Workbook(file.file_path, file.file_type, reader_engine,
+                          cache=sheet_cache, sha256_hash=file.sha256_hash) as workbook:
+                tables = {name: workbook.table(name) for name in workbook.sheet_names}
+        except Exception as e:
+            self.logger.warning("Could not read file for layout detection", filename=file.filename, error=str(e))
+            return []
+
+        entries = []
+        for sheet_name, (df, bounds) in tables.items():
+            layout = self.detect(df)
+            entries.append({
+                'filename': file.filename,
+                'sha256_hash': file.sha256_hash,
+                'sheet': sheet_name,
+                'layout': layout.layout,
+                'parser': layout.parser,
+                'fingerprint': layout.fingerprint,
+                'read_range': bounds.read_range(df),
+                'skipped_regions': bounds.skipped_regions
+            })
+        return entries
+
+    def __str__(self) -> str:
+        return f"LayoutDetector(decisions={len(self.decisions)}, hits={self.stats['hits']}, misses={self.stats['misses']})"
+
+
+def classify_layout(fingerprint: SheetFingerprint) -> str:
+    """Decide a sheet's layout from its fingerprint."""
+    filled = [position for position, kind in enumerate(fingerprint.column_kinds) if kind != '-']
+    if not filled:
+        return 'empty'
+
+    kinds = [fingerprint.column_kinds[position] for position in filled]
+    named = sum(1 for position in filled if fingerprint.header_kinds[position] != 'u')
+
+    if (len(filled) >= 2 and all(kind == 'n' for kind in kinds)
+            and fingerprint.rows_bucket >= 5 and fingerprint.monotonic_first_numeric):
+        return 'time_series'
+    if named * 2 >= len(filled) and len(filled) >= 2 and fingerprint.header_kinds[filled[0]] != 'n':
+        return 'horizontal'
+    if 2 <= len(filled) <= 3 and kinds[0] == 't' and fingerprint.rows_bucket >= 2:
+        return 'vertical'
+    return 'matrix'
+
+
+def _header_kind(column: Any) -> str:
+    if isinstance(column, (int, float, np.number)) and not isinstance(column, bool):
+        return 'n'
+    text = str(column).strip()
+    if not text or text.startswith('Unnamed'):
+        return 'u'
+    return 'n' if _NUMERIC_TEXT.match(text) else 'h'
+
+
+def _column_kind(values: pd.Series) -> str:
+    if is_numeric_dtype(values) and not is_bool_dtype(values):
+        return 'n' if values.notna().any() else '-'
+
+    numeric = text = 0
+    for value in values.dropna():
+        if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+            numeric += 1
+        elif isinstance(value, str) and not value.strip():
+            continue
+        elif isinstance(value, str) and _NUMERIC_TEXT.match(value):
+            numeric += 1
+        else:
+            text += 1
+    if numeric and text:
+        return 'm'
+    return 'n' if numeric else ('t' if text else '-')
@@ -1,18 +1,180 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import numpy as np
 import pandas as pd
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from typing import List, Dict, Any, Optional, Tuple
 import structlog
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 from models.valid_file import ValidFile
 from models.material_data import MaterialData, QualityRating
+from services.layout_detector import LayoutDetector, SheetLayout
+from services.property_classifier import PropertyNameClassifier
+from services.sheet_cache import SheetCache
+from services.unit_registry import UnitRegistry
+from services.workbook_loader import EXCEL_ENGINES, Workbook
+
+
+# First number in a cell and the text after it (its unit); the lazy prefix finds the same
+# leftmost number as re.search, DOTALL lets the unit span line breaks
+_NUMBER_WITH_UNIT_PATTERN = re.compile(r'^.*?([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)(.*)$', re.DOTALL)
+
+# Polymer names seen in MyTechFun files (PLA, PETG-CF, PA6-CF, PPA-CF, PC blend, TPU95A, ...): a base
+# polymer, an optional grade or Shore hardness, and an optional blend/fibre/flow suffix, not glued to
+# other letters. The words filament and material mark material rows too; only polymers have a 'base' group.
+_MATERIAL_NAME_PATTERN = re.compile(
+    r'(?<![A-Za-z])(?P<base>PETG|PEEK|HIPS|PLA|PET|ABS|ASA|TPU|PPA|PA|PC|Nylon)(?P<grade>\d++[AD]?)?'
+    r'(?:[- ]?(?P<blend>blend))?(?:[- ]?(?P<suffix>CF|GF|HF))?(?![A-Za-z])'
+    r'|filament|material',
+    re.IGNORECASE
+)
+
+# Sheets longer than this are split from a growing window of leading rows when only the first cells are needed
+_SPLIT_WINDOW_ROWS = 256
+
+# Cell types read as numbers without parsing their text: str() of these round-trips exactly
+# (bool is excluded since str(True) holds no digits, float32 since its str() is rounded)
+_NUMBER_TYPES = frozenset({int, float, np.float64} | {np.dtype(code).type for code in np.typecodes['AllInteger']})
+
+
+def _property_row(labels: List[str], values: List[Any]) -> pd.DataFrame:
+    """One row with a column per property: the shape the table parser extracts from."""
+    return pd.DataFrame([pd.Series(values, dtype=object).to_numpy()], columns=labels)
+
+
+def _split_window(df: pd.DataFrame, positions: List[int], limit: int) -> int:
+    """
+    Leading rows of a sheet that hold the first `limit` non-null cells of each given column.
+
+    The window starts at _SPLIT_WINDOW_ROWS rows and doubles until every column has `limit`
+    non-null cells in it, or all of its cells when it has fewer; other columns (spacers,
+    sparse notes) do not widen it.
+    """
+    present = df.iloc[:, positions].notna().to_numpy()
+    needed = np.minimum(present.sum(axis=0), limit)
+    rows = _SPLIT_WINDOW_ROWS
+    while rows < len(df) and (present[:rows].sum(axis=0) < needed).any():
+        rows *= 2
+    return min(rows, len(df))
+
+
+def _single_unit_series(column_series: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Keep the values of a converted column that are in its most common unit, so a stored series
+    holds a single scale ("50" next to "52.5 MPa" would otherwise mix MPa and Pa). On a tie a
+    unit wins over unit-less cells.
+    """
+    units = column_series["units"]
+    candidates, counts = np.unique(units.astype(str), return_counts=True)
+    unit = candidates[np.lexsort((candidates == "", -counts))[0]]
+    keep = units == unit
+    return {"values": column_series["values"][keep], "units": units[keep]}
+
+
+def _summary_statistics(samples: List[np.ndarray]) -> List[Dict[str, Any]]:
+    """
+    Summarize many small samples with one set of segmented NumPy reductions instead of one set per sample.
+
+    Returns:
+        One dict per sample (count, mean, std, min, max, median); empty for an empty sample
+    """
+    counts = np.array([len(sample) for sample in samples], dtype=np.int64)
+    non_empty = np.flatnonzero(counts)
+    results: List[Dict[str, Any]] = [{} for _ in samples]
+    if len(non_empty) == 0:
+        return results
+
+    counts = counts[non_empty]
+    values = np.concatenate([samples[i] for i in non_empty])
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    segment = np.repeat(np.arange(len(counts)), counts)
+
+    means = np.add.reduceat(values, starts) / counts
+    squared_deviations = np.add.reduceat((values - means[segment]) ** 2, starts)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stds = np.sqrt(squared_deviations / (counts - 1))
+    minimums = np.minimum.reduceat(values, starts)
+    maximums = np.maximum.reduceat(values, starts)
+
+    # Medians: sort within each segment, then average the one or two middle values
+    ordered = values[np.lexsort((values, segment))]
+    medians = (ordered[starts + (counts - 1) // 2] + ordered[starts + counts // 2]) / 2
+
+    for k, i in enumerate(non_empty):
+        results[i] = {
+            "count": int(counts[k]),
+            "mean": float(means[k]),
+            "std": float(stds[k]) if counts[k] > 1 else None,
+            "min": float(minimums[k]),
+            "max": float(maximums[k]),
+            "median": float(medians[k])
+        }
+    return results
+
+
+# Per-process service used by pool workers (built once per process rather than pickled with every task)
+_worker_service: Optional['NormalizerService'] = None
+
+
+def _process_file_in_worker(file: ValidFile, reader_engine: str, sheet_cache_dir: Optional[str],
+                            extract_series: bool,
+                            layout_decisions: Dict[str, str]) -> Tuple[Optional[List[MaterialData]], Optional[str]]:
+    """Process-pool entry point: normalize one file with this worker process's service."""
+    global _worker_service
+    if _worker_service is None:
+        sheet_cache = SheetCache(sheet_cache_dir) if sheet_cache_dir else None
+        _worker_service = NormalizerService(reader_engine=reader_engine, sheet_cache=sheet_cache,
+                                            extract_series=extract_series,
+                                            layout_detector=LayoutDetector(layout_decisions))
+    return _worker_service._try_process_file(file)
 
 
 class NormalizerService:
     """Service for extracting and normalizing material data from spreadsheet files per constitutional requirements."""
 
-    def __init__(self):
+    def __init__(self, workers: int = 1, reader_engine: Optional[str] = None,
+                 sheet_cache: Optional[SheetCache] = None, extract_series: Optional[bool] = None,
+                 layout_detector: Optional[LayoutDetector] = None):
+        """
+        Args:
+            workers: Files are normalized in a process pool when > 1
+            reader_engine: Spreadsheet reader engine (see workbook_loader.EXCEL_ENGINES);
+                defaults to MTF_EXCEL_ENGINE, or 'auto' to pick the fastest available per file type
+            sheet_cache: Optional cache of parsed sheets keyed by file hash; cached files are not re-parsed
+            extract_series: Also keep every parsed value of each column (in its most common unit)
+                as float64 arrays in MaterialData.series and add count/mean/std/min/max/median to each normalized
+                property; defaults to MTF_EXTRACT_SERIES
+            layout_detector: Sheet layout detector, e.g. preloaded with the discovery phase's decisions
+
+        Raises:
+            ValueError: When the reader engine is not supported
+        """
         self.logger = structlog.get_logger("mtf_crawler.normalizer")
-        self.unit_mappings = self._load_unit_mappings()
-        self.property_mappings = self._load_property_mappings()
+        self.unit_registry = UnitRegistry()
+        self.property_classifier = PropertyNameClassifier(self._load_property_mappings())
+        self.workers = max(1, workers)
+        self.reader_engine = reader_engine or os.getenv('MTF_EXCEL_ENGINE', 'auto')
+        if self.reader_engine not in EXCEL_ENGINES:
+            raise ValueError(f"Unsupported reader engine '{self.reader_engine}'. Must be one of: {EXCEL_ENGINES}")
+        self.sheet_cache = sheet_cache
+        if extract_series is None:
+            extract_series = os.getenv('MTF_EXTRACT_SERIES', 'false').lower() in ('1', 'true', 'yes')
+        self.extract_series = extract_series
+        self.layout_detector = layout_detector or LayoutDetector()
+        # Parser names (see layout_detector.LAYOUT_PARSERS) → extraction method
+        self._parsers = {
+            'table_row_parser': self._extract_materials_from_df,
+            'property_value_parser': self._extract_vertical_materials,
+            'series_parser': self._extract_series_material,
+            None: self._extract_materials_from_df
+        }
+        self._executor: Optional[ProcessPoolExecutor] = None
 
     def process_materials(self, files: List[ValidFile]) -> List[MaterialData]:
         """
@@ -28,120 +190,293 @@ class NormalizerService:
             NormalizationError: When data extraction/normalization fails
             FileFormatError: When file format is unsupported
         """
-        self.logger.info("Processing materials from files", file_count=len(files))
+        self.logger.info("Processing materials from files", file_count=len(files), workers=self.workers,
+                         reader_engine=self.reader_engine)
 
         all_materials = []
 
-        for file in files:
-            try:
-                materials = self._process_single_file(file)
+        if self.workers > 1 and len(files) > 1:
+            results = self._process_files_parallel(files)
+        else:
+            results = (self._try_process_file(file) for file in files)
+
+        # Results arrive in input order whether or not the pool was used
+        for file, (materials, error) in zip(files, results):
+            if error is None:
                 all_materials.extend(materials)
                 self.logger.info("File processed",
                                filename=file.filename,
                                materials_found=len(materials))
-
-            except Exception as e:
+            else:
                 self.logger.error("Failed to process file",
                                 filename=file.filename,
-                                error=str(e))
+                                error=error)
                 # Create RAW quality material as fallback
                 fallback_material = MaterialData.create_raw(
                     material_name=f"Unknown ({file.filename})",
                     source_file_hash=file.sha256_hash,
-                    properties={"error": str(e)}
+                    properties={"error": error}
                 )
                 all_materials.append(fallback_material)
 
-        self.logger.info("Materials processing completed", total_materials=len(all_materials))
+        # Headers are classified in the worker processes when the pool is used; their caches are not reported
+        classifier_stats = {} if self._executor is not None else {'property_names': self.property_classifier.stats}
+        self.logger.info("Materials processing completed", total_materials=len(all_materials), **classifier_stats)
         return all_materials
 
+    def rules_fingerprint(self) -> str:
+        """
+        Fingerprint of everything that shapes the normalized output of a file.
+
+        Covers the unit and property mappings, the source of this module, the unit registry,
+        the property classifier, the layout detector, the workbook loader (which cells are read
+        and how CSV files are decoded), the sheet cache and the MaterialData model (code
+        version), and the configured reader engine and series mode.
+        """
+        units = {unit: [c.si_unit, c.scale, c.offset] for unit, c in self.unit_registry.conversions.items()}
+        digest = hashlib.sha256()
+        digest.update(json.dumps({
+            'units': units,
+            'unit_aliases': self.unit_registry.aliases,
+            'properties': dict(self.property_classifier.property_mappings),
+            'reader_engine': self.reader_engine,
+            'extract_series': self.extract_series
+        }, sort_keys=True).encode('utf-8'))
+        for module_name in (__name__, UnitRegistry.__module__, PropertyNameClassifier.__module__,
+                            LayoutDetector.__module__, Workbook.__module__, SheetCache.__module__,
+                            MaterialData.__module__):
+            with open(sys.modules[module_name].__file__, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def close(self):
+        """Shut down the worker process pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _process_files_parallel(self, files: List[ValidFile]) -> List[Tuple[Optional[List[MaterialData]], Optional[str]]]:
+        """Fan files out to the process pool, returning one (materials, error) result per file in input order."""
+        results = []
+        try:
+            if self._executor is None:
+                # Never fork: the pipeline creates the pool from its normalize thread while the crawl
+                # thread, the async loop and the checkpoint lock are live, and forked children can deadlock
+                start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     mp_context=multiprocessing.get_context(start_method))
+            for result in self._executor.map(_process_file_in_worker, files, repeat(self.reader_engine),
+                                             repeat(self.sheet_cache.cache_dir if self.sheet_cache else None),
+                                             repeat(self.extract_series),
+                                             repeat(self.layout_detector.decisions)):
+                results.append(result)
+
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed for memory); finish the remaining files in this process
+            self.logger.warning("Worker pool failed, processing remaining files serially",
+                              error=str(e), completed=len(results))
+            self._executor = None
+            results.extend(self._try_process_file(file) for file in files[len(results):])
+
+        return results
+
+    def _try_process_file(self, file: ValidFile) -> Tuple[Optional[List[MaterialData]], Optional[str]]:
+        """Process one file, returning (materials, None) on success or (None, error message) on failure."""
+        try:
+            return self._process_single_file(file), None
+        except Exception as e:
+            return None, str(e)
+
     def _process_single_file(self, file: ValidFile) -> List[MaterialData]:
         """Process a single spreadsheet file to extract material data."""
         try:
             # Read the file based on its type
-            if file.file_type == '.csv':
-                df = pd.read_csv(file.file_path)
-            elif file.file_type in ['.xlsx', '.xls']:
-                # Try to read all sheets and find the one with material data
-                excel_file = pd.ExcelFile(file.file_path)
-                df = self._find_material_sheet(excel_file)
-            else:
+            if file.file_type not in ['.csv', '.xlsx', '.xls']:
                 raise FileFormatError(f"Unsupported file type: {file.file_type}")
 
-            # Extract material data from the dataframe
-            materials = self._extract_materials_from_df(df, file)
+            # Open the workbook once and pick the sheet with material data
+            with Workbook(file.file_path, file.file_type, self.reader_engine,
+                          cache=self.sheet_cache, sha256_hash=file.sha256_hash) as workbook:
+                df, layout = self._find_material_sheet(workbook)
+
+            # Extract material data with the parser for the sheet's layout
+            self.logger.debug("Sheet layout", filename=file.filename, layout=layout.layout, parser=layout.parser)
+            materials = self._parsers[layout.parser](df, file)
             return materials
 
         except Exception as e:
             self.logger.error("File processing failed", filename=file.filename, error=str(e))
             raise NormalizationError(f"Failed to process {file.filename}: {str(e)}")
 
-    def _find_material_sheet(self, excel_file: pd.ExcelFile) -> pd.DataFrame:
-        """Find the sheet containing material test data."""
-        # Common sheet names that contain material data
-        material_keywords = ['material', 'test', 'data', 'results', 'properties']
+    def _find_material_sheet(self, workbook: Workbook) -> Tuple[pd.DataFrame, SheetLayout]:
+        """
+        Find the sheet containing material test data, together with its layout.
 
-        for sheet_name in excel_file.sheet_names:
-            sheet_name_lower = sheet_name.lower()
-            if any(keyword in sheet_name_lower for keyword in material_keywords):
-                return pd.read_excel(excel_file, sheet_name=sheet_name)
+        Only the table of each sheet is read (see Workbook.table); regions left out are logged.
+        """
+        # Common sheet names that contain material data; they are tried first, then the others in order
+        material_keywords = ['material', 'test', 'data', 'results', 'properties']
+        named = [name for name in workbook.sheet_names if any(keyword in name.lower() for keyword in material_keywords)]
+        candidates = named + [name for name in workbook.sheet_names if name not in named]
+
+        for sheet_name in candidates:
+            df, bounds = workbook.table(sheet_name)
+            layout = self.layout_detector.detect(df)
+            if layout.layout != 'empty':
+                break
+        else:
+            # Every sheet is empty; use the first one
+            sheet_name = workbook.sheet_names[0]
+            df, bounds = workbook.table(sheet_name)
+            layout = self.layout_detector.detect(df)
 
-        # If no specific sheet found, use the first one
-        return pd.read_excel(excel_file, sheet_name=0)
+        if bounds.skipped_regions:
+            self.logger.info("Read sheet table only", path=workbook.path, sheet=sheet_name,
+                             read_range=bounds.read_range(df), skipped_regions=bounds.skipped_regions)
+        return df, layout
 
     def _extract_materials_from_df(self, df: pd.DataFrame, file: ValidFile) -> List[MaterialData]:
-        """Extract material data from a pandas DataFrame."""
-        materials = []
+        """
+        Extract material data from a pandas DataFrame: one material per block of rows or
+        columns of a comparison sheet (see _material_blocks), otherwise the whole sheet as a
+        single material named after the file.
+        """
+        blocks = self._material_blocks(df)
+        if not blocks:
+            material_name = self._extract_material_name_from_file(file.filename)
+            return [self._extract_single_material(df, material_name, file)]
 
-        # Look for material names in the first column or header
-        material_names = self._identify_materials(df)
+        return [self._extract_single_material(block, material_name, file) for material_name, block in blocks]
 
-        if not material_names:
-            # Single material file - extract all properties
-            material_name = self._extract_material_name_from_file(file.filename)
-            material = self._extract_single_material(df, material_name, file)
-            materials.append(material)
-        else:
-            # Multiple materials - process each one
-            for material_name in material_names:
-                material = self._extract_single_material(df, material_name, file)
-                materials.append(material)
+    def _extract_vertical_materials(self, df: pd.DataFrame, file: ValidFile) -> List[MaterialData]:
+        """
+        Extract the single material of a vertical sheet: property labels in the first filled
+        column, values in the next one.
+        """
+        filled = [position for position in range(df.shape[1]) if df.iloc[:, position].notna().any()]
+        label_position, value_position = filled[0], filled[1]
+        pairs = df.iloc[:, [label_position, value_position]].dropna()
+        labels = [str(label).strip() for label in pairs.iloc[:, 0]]
+        values = list(pairs.iloc[:, 1])
+
+        # The header row holds the first pair unless it is a "Property | Value" style caption
+        header_label, header_value = df.columns[label_position], df.columns[value_position]
+        if not str(header_label).startswith('Unnamed') and re.search(r'[0-9]', str(header_value)):
+            labels.insert(0, str(header_label).strip())
+            values.insert(0, header_value)
+
+        material_name = self._extract_material_name_from_file(file.filename)
+        return [self._extract_single_material(_property_row(labels, values), material_name, file)]
+
+    def _extract_series_material(self, df: pd.DataFrame, file: ValidFile) -> List[MaterialData]:
+        """
+        Extract the single material of a time_series sheet: every channel (time, force,
+        displacement, ...) is kept whole as a series whatever the series mode, and its peak
+        value, with summary statistics, is the normalized property.
+        """
+        channels = [(position, str(col)) for position, col in enumerate(df.columns)
+                    if not str(col).lower().strip().startswith('unnamed')]
+        split_columns = self._split_numbers_and_units(df, [position for position, _ in channels])
+
+        properties = {}
+        series = {}
+        summarized = []
+        for (_, header), (numbers, units) in zip(channels, split_columns):
+            column_series = self._column_series(header, numbers, units)
+            if not column_series:
+                continue
+            (name, values), = column_series.items()
+            series[name] = _single_unit_series(values)
+
+            # Peak over the cells in the stored series' unit
+            parsed = ~np.isnan(numbers)
+            kept = np.flatnonzero(values["units"] == series[name]["units"][0])
+            peak = kept[np.argmax(values["values"][kept])]
+            properties[name] = {
+                "value": float(values["values"][peak]),
+                "unit": values["units"][peak],
+                "original_value": float(numbers[parsed][peak]),
+                "original_unit": units[parsed][peak]
+            }
+            summarized.append((properties[name], values))
+
+        if summarized:
+            self._add_summary_statistics(summarized)
 
-        return materials
+        return [MaterialData.create_normalized(
+            material_name=self._extract_material_name_from_file(file.filename),
+            source_file_hash=file.sha256_hash,
+            properties=properties,
+            quality=QualityRating.OK if len(properties) >= 3 else QualityRating.WARN,
+            series=series
+        )]
 
     def _identify_materials(self, df: pd.DataFrame) -> List[str]:
-        """Identify material names in the dataframe."""
-        material_names = []
+        """Identify material names in the first column, in the order they first appear."""
+        return list(dict.fromkeys(self._material_name_cells(df)))
 
-        # Look in first column for material names
-        if not df.empty and len(df.columns) > 0:
-            first_col = df.iloc[:, 0].dropna().astype(str)
+    def _material_name_cells(self, df: pd.DataFrame) -> pd.Series:
+        """The first-column cells naming a material, stripped and indexed by their row."""
+        if df.empty or len(df.columns) == 0:
+            return pd.Series(dtype=object)
 
-            # Common patterns for material names
-            material_patterns = [
-                r'(PLA|ABS|PETG|TPU|HIPS)\b.*',
-                r'.*filament.*',
-                r'.*material.*'
-            ]
+        first_col = df.iloc[:, 0].dropna().astype(str)
+        return first_col[first_col.map(_MATERIAL_NAME_PATTERN.search).notna()].str.strip()
 
-            for value in first_col:
-                for pattern in material_patterns:
-                    if re.search(pattern, value, re.IGNORECASE):
-                        material_names.append(value.strip())
-                        break
+    def _material_blocks(self, df: pd.DataFrame) -> List[Tuple[str, pd.DataFrame]]:
+        """
+        Group a comparison sheet once into one block per material, so each material is
+        extracted from its own cells only.
 
-        return list(set(material_names))  # Remove duplicates
+        Row blocks: a material named in the first column owns its row and the rows below it
+        (e.g. per-specimen results) up to the next material's row; rows above the first one
+        belong to no material, and the blocks of a name repeated further down are merged.
+        The name column is left out of the blocks, so a grade like 'PA6-CF' is not read as a value.
+        Column blocks: when no row names a material but at least two column headers name a
+        polymer and the first column holds text labels ("PLA | PETG | ASA" columns next to
+        property names), each such column is paired with the labels, as in a vertical sheet.
+
+        Returns:
+            (material name, block) pairs in the order the materials first appear; empty for
+            a single-material sheet
+        """
+        names = self._material_name_cells(df)
+        if not names.empty:
+            owner = names.reindex(df.index).ffill()
+            return [(name, block.iloc[:, 1:]) for name, block in df.groupby(owner, sort=False)]
+
+        if df.shape[1] < 3:
+            return []
+        material_columns = []
+        for position, header in enumerate(df.columns[1:], start=1):
+            match = _MATERIAL_NAME_PATTERN.search(str(header))
+            if match and match.group('base'):
+                material_columns.append(position)
+        labels = df.iloc[:, 0].dropna()
+        if len(material_columns) < 2 or labels.empty or pd.to_numeric(labels, errors='coerce').notna().any():
+            return []
+
+        blocks = []
+        for position in material_columns:
+            pairs = df.iloc[:, [0, position]].dropna()
+            row = _property_row([str(label).strip() for label in pairs.iloc[:, 0]], list(pairs.iloc[:, 1]))
+            blocks.append((str(df.columns[position]).strip(), row))
+        return blocks
 
     def _extract_material_name_from_file(self, filename: str) -> str:
-        """Extract material name from filename."""
+        """Extract material name from filename: the first polymer named in it (e.g. 'PA6-CF Material')."""
         # Remove file extension
         name = filename.rsplit('.', 1)[0]
 
-        # Look for common material types
-        material_types = ['PLA', 'ABS', 'PETG', 'TPU', 'HIPS', 'ASA', 'PC', 'PEEK']
-        for mat_type in material_types:
-            if mat_type.lower() in name.lower():
-                return f"{mat_type} Material"
+        for match in _MATERIAL_NAME_PATTERN.finditer(name):
+            if match.group('base'):
+                base = match.group('base')
+                material = ('Nylon' if base.lower() == 'nylon' else base.upper()) + (match.group('grade') or '').upper()
+                if match.group('blend'):
+                    material += ' blend'
+                if match.group('suffix'):
+                    material += f"-{match.group('suffix').upper()}"
+                return f"{material} Material"
 
         return name
 
@@ -151,25 +486,36 @@ class NormalizerService:
         quality = QualityRating.OK
 
         try:
-            # Extract properties from the dataframe
-            for col in df.columns:
-                col_name = str(col).lower().strip()
-
-                # Skip empty or index columns
+            # Property columns: skip empty or index columns
+            property_columns = []
+            for position, col in enumerate(df.columns):
+                header = str(col)
+                col_name = header.lower().strip()
                 if col_name in ['', 'unnamed', 'index'] or col_name.startswith('unnamed'):
                     continue
+                property_columns.append((position, header))
 
-                # Get the values for this property
-                values = df[col].dropna()
-                if len(values) == 0:
-                    continue
+            # Split the first 3 non-null cells of those columns (every cell in series mode) into
+            # number and unit in one vectorized pass
+            split_columns = self._split_numbers_and_units(df, [position for position, _ in property_columns],
+                                                          limit=None if self.extract_series else 3)
 
-                # Try to extract numerical values with units
-                for value in values[:3]:  # Check first 3 non-null values
-                    normalized_prop = self._normalize_property(col_name, value)
-                    if normalized_prop:
-                        properties.update(normalized_prop)
-                        break
+            series = {}
+            summarized = []  # (property entry, the column's series) pairs that get summary statistics
+            for (_, header), (numbers, units) in zip(property_columns, split_columns):
+                if len(numbers) == 0:
+                    continue
+                normalized_prop = self._normalize_column(header, numbers, units)
+                if normalized_prop:
+                    properties.update(normalized_prop)
+                if self.extract_series:
+                    column_series = self._column_series(header, numbers, units)
+                    series.update({name: _single_unit_series(values) for name, values in column_series.items()})
+                    if normalized_prop and column_series:
+                        summarized.extend((entry, column_series[name]) for name, entry in normalized_prop.items())
+
+            if summarized:
+                self._add_summary_statistics(summarized)
 
             # If we couldn't extract much, mark as WARN quality
             if len(properties) < 3:
@@ -179,7 +525,8 @@ class NormalizerService:
                 material_name=material_name,
                 source_file_hash=file.sha256_hash,
                 properties=properties,
-                quality=quality
+                quality=quality,
+                series=series
             )
 
         except Exception as e:
@@ -191,128 +538,136 @@ class NormalizerService:
                 properties={"raw_data": df.to_dict()}
             )
 
-    def _normalize_property(self, property_name: str, value: Any) -> Optional[Dict[str, Any]]:
-        """Normalize a single property value with unit conversion."""
-        try:
-            # Convert value to string for processing
-            value_str = str(value).strip()
+    def _normalize_column(self, property_name: str, numbers: np.ndarray,
+                          units: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        Normalize a column's property from its first parseable value among the first 3 non-null cells.
 
-            # Try to extract number and unit
-            number_match = re.search(r'([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)', value_str)
-            if not number_match:
-                return None
+        Args:
+            property_name: Column header as written in the sheet
+            numbers: The column's non-null cells as numbers (NaN where a cell holds no number)
+            units: The unit text following each number
+        """
+        # Check first 3 non-null values
+        parsed = np.flatnonzero(~np.isnan(numbers[:3]))
+        if len(parsed) == 0:
+            return None
+        first = parsed[0]
 
-            original_value = float(number_match.group(1))
+        normalized_name = self.property_classifier.classify(property_name)
+        si_values, si_units = self.unit_registry.convert(numbers[first:first + 1], units[first:first + 1])
 
-            # Extract unit (everything after the number)
-            unit_part = value_str[number_match.end():].strip()
-            original_unit = unit_part if unit_part else ""
+        return {
+            normalized_name: {
+                "value": float(si_values[0]),
+                "unit": si_units[0],
+                "original_value": float(numbers[first]),
+                "original_unit": units[first]
+            }
+        }
 
-            # Normalize property name
-            normalized_name = self._normalize_property_name(property_name)
+    def _column_series(self, property_name: str, numbers: np.ndarray,
+                       units: np.ndarray) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Convert every parsed value of a column to SI, for series mode.
 
-            # Convert to SI units if mapping exists
-            si_value, si_unit = self._convert_to_si(original_value, original_unit, normalized_name)
+        Cells without a unit, or with one the unit registry does not know, keep their number
+        as written, so the values of a column can be on different scales (see _single_unit_series).
 
-            return {
-                normalized_name: {
-                    "value": si_value,
-                    "unit": si_unit,
-                    "original_value": original_value,
-                    "original_unit": original_unit
-                }
-            }
+        Returns:
+            {property: {"values": float64 values, "units": unit of each value}}, empty when no
+            cell of the column holds a number
+        """
+        parsed = ~np.isnan(numbers)
+        if not parsed.any():
+            return {}
 
-        except (ValueError, AttributeError) as e:
-            self.logger.debug("Property normalization failed",
-                            property=property_name, value=value, error=str(e))
-            return None
+        si_values, si_units = self.unit_registry.convert(numbers[parsed], units[parsed])
+        return {self.property_classifier.classify(property_name): {"values": si_values, "units": si_units}}
 
-    def _normalize_property_name(self, name: str) -> str:
-        """Normalize property names to standard terms."""
-        name_lower = name.lower().strip()
-
-        # Use mapping if available
-        if name_lower in self.property_mappings:
-            return self.property_mappings[name_lower]
-
-        # Common normalizations
-        if any(term in name_lower for term in ['tensile', 'tension']):
-            return "tensile_strength"
-        elif 'young' in name_lower or 'elastic' in name_lower:
-            return "elastic_modulus"
-        elif 'elongation' in name_lower or 'strain' in name_lower:
-            return "elongation_at_break"
-        elif 'impact' in name_lower:
-            return "impact_strength"
-        elif 'flexural' in name_lower:
-            return "flexural_strength"
-        elif 'density' in name_lower:
-            return "density"
-        elif 'temperature' in name_lower and 'glass' in name_lower:
-            return "glass_transition_temperature"
-
-        # Clean up the name
-        cleaned = re.sub(r'[^a-z0-9_]', '_', name_lower)
-        cleaned = re.sub(r'_+', '_', cleaned).strip('_')
-
-        return cleaned
-
-    def _convert_to_si(self, value: float, unit: str, property_name: str) -> Tuple[float, str]:
-        """Convert value to SI units if mapping exists."""
-        unit_lower = unit.lower().strip()
-
-        # Get SI unit for this property
-        si_unit = self._get_si_unit(property_name)
-
-        # Apply conversion if mapping exists
-        if unit_lower in self.unit_mappings:
-            conversion_factor = self.unit_mappings[unit_lower]
-            converted_value = value * conversion_factor
-            return converted_value, si_unit
-
-        # No conversion needed/available
-        return value, unit
-
-    def _get_si_unit(self, property_name: str) -> str:
-        """Get the standard SI unit for a property."""
-        si_units = {
-            "tensile_strength": "Pa",
-            "elastic_modulus": "Pa",
-            "flexural_strength": "Pa",
-            "impact_strength": "J/m",
-            "density": "kg/m³",
-            "elongation_at_break": "%",
-            "glass_transition_temperature": "K"
-        }
+    def _add_summary_statistics(self, summarized: List[Tuple[Dict[str, Any], Dict[str, np.ndarray]]]):
+        """
+        Add count/mean/std/min/max/median to normalized property entries, from their column's series.
+
+        Only the values in the entry's unit are summarized (a column can mix converted and
+        unit-less cells); std is the sample standard deviation and None for a single value.
+        """
+        samples = [column_series["values"][(column_series["units"] == entry["unit"])
+                                           & np.isfinite(column_series["values"])]
+                   for entry, column_series in summarized]
+        for (entry, _), statistics in zip(summarized, _summary_statistics(samples)):
+            entry.update(statistics)
+
+    def _split_numbers_and_units(self, df: pd.DataFrame, positions: List[int],
+                                 limit: Optional[int] = None) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Split the non-null cells of the given columns into their first number and the text after it (the unit).
 
-        return si_units.get(property_name, "")
+        Numeric columns and numeric cells are taken as they are; the text cells of the whole
+        sheet go through a single vectorized regex extraction, so a sheet costs one pass
+        rather than one Python regex call per cell.
 
-    def _load_unit_mappings(self) -> Dict[str, float]:
-        """Load unit conversion mappings."""
-        return {
-            # Pressure/Stress conversions to Pa
-            "mpa": 1e6,
-            "gpa": 1e9,
-            "kpa": 1e3,
-            "psi": 6894.76,
-            "ksi": 6.89476e6,
-
-            # Temperature conversions to Kelvin
-            "°c": lambda c: c + 273.15,
-            "celsius": lambda c: c + 273.15,
-            "°f": lambda f: (f - 32) * 5/9 + 273.15,
-
-            # Density conversions to kg/m³
-            "g/cm³": 1000,
-            "g/cm^3": 1000,
-
-            # Length conversions to meters
-            "mm": 0.001,
-            "cm": 0.01,
-            "in": 0.0254,
-            "ft": 0.3048
-        }
+        Args:
+            df: Sheet
+            positions: Column positions to split
+            limit: Only split the first `limit` non-null cells of each column (all when None)
+
+        Returns:
+            One (numbers, units) pair per position, over the column's non-null cells in order:
+            float64 numbers (NaN where a cell holds no number) and an object array of unit strings
+        """
+        if limit is not None and len(df) > _SPLIT_WINDOW_ROWS:
+            # Only leading rows matter
+            df = df.iloc[:_split_window(df, positions, limit)]
+
+        columns: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        other_positions = []
+        other_values = []
+
+        for position in positions:
+            values = df.iloc[:, position]
+            if is_numeric_dtype(values) and not is_bool_dtype(values):
+                numbers = values.to_numpy(dtype=float, na_value=np.nan)
+                numbers = numbers[~np.isnan(numbers)][:limit]
+                numbers[np.isinf(numbers)] = np.nan  # inf prints as text without digits
+                columns[position] = (numbers, np.full(len(numbers), "", dtype=object))
+            else:
+                other_positions.append(position)
+                other_values.append(values.to_numpy(dtype=object))
+
+        if other_positions:
+            # Non-null cells of all other columns, column by column
+            block = np.empty((len(other_values), len(df)), dtype=object)
+            for index, values in enumerate(other_values):
+                block[index] = values
+            present = ~pd.isna(block)
+            if limit is not None:
+                present &= np.cumsum(present, axis=1) <= limit
+            cells = block[present]
+            counts = present.sum(axis=1)
+
+            numbers = np.full(len(cells), np.nan)
+            units = np.full(len(cells), "", dtype=object)
+            is_number = np.fromiter(map(_NUMBER_TYPES.__contains__, map(type, cells)), dtype=bool, count=len(cells))
+            numbers[is_number] = cells[is_number].astype(float)
+            numbers[np.isinf(numbers)] = np.nan
+
+            is_text = ~is_number
+            if is_text.any():
+                texts = cells[is_text]
+                if not all(type(text) is str for text in texts):
+                    texts = texts.astype(str)  # Dates and other values are parsed as printed
+                # Leading/trailing whitespace needs no strip: the lazy prefix skips it and units are stripped
+                parts = pd.Series(texts, dtype=object).str.extract(_NUMBER_WITH_UNIT_PATTERN)
+                numbers[is_text] = parts[0].astype(float).to_numpy()
+                units[is_text] = parts[1].fillna("").str.strip().to_numpy(dtype=object)
+
+            bounds = np.cumsum(counts)[:-1]
+            for position, column_numbers, column_units in zip(other_positions, np.split(numbers, bounds),
+                                                              np.split(units, bounds)):
+                columns[position] = (column_numbers, column_units)
+
+        return [columns[position] for position in positions]
 
     def _load_property_mappings(self) -> Dict[str, str]:
         """Load property name mappings to standard terms."""
@@ -1,24 +1,38 @@
+import json
 import os
+import time
 import requests
-from bs4 import BeautifulSoup
-from typing import List
-from urllib.parse import urljoin, urlparse
+from collections import Counter
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
 import structlog
 from models.post import Post
 from models.valid_file import ValidFile
+from models.fetched_page import FetchedPage
+from services.http_cache import HttpCache
+from services.checkpoint_service import CheckpointService
 
 
 class ParserService:
     """Service for extracting and downloading valid files from posts per constitutional requirements."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[HttpCache] = None, checkpoint: Optional[CheckpointService] = None):
         self.logger = structlog.get_logger("mtf_crawler.parser")
+        self.cache = cache  # Optional persistent HTTP cache; downloads are revalidated instead of skipped
+        self.checkpoint = checkpoint  # Posts whose downloads finished in an interrupted run are not revisited
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'mytechfun-research-bot/1.0 (contact: research@example.com)'
         })
         self.valid_extensions = {'.xlsx', '.xls', '.csv'}
         self.ignored_extensions = {'.stl', '.zip', '.jpg', '.jpeg', '.png', '.gif', '.pdf'}
+        self.raw_dir = "data/raw"
+        self.rate_limit_delay = float(os.getenv('MTF_RATE_LIMIT_DELAY', '1.0'))  # Minimum delay between requests (seconds)
+        self.last_request_time = 0.0
+        self.request_counts = Counter()  # HTTP requests issued per stage (post, download)
+        self.max_download_bytes = int(os.getenv('MTF_MAX_DOWNLOAD_BYTES', '0')) or None  # 0 = unlimited
+        self.downloads_skipped = 0
+        self._download_index: Optional[Dict[str, dict]] = None
 
     def extract_files(self, post: Post) -> List[ValidFile]:
         """
@@ -36,9 +50,16 @@ class ParserService:
         """
         self.logger.info("Extracting files from post", url=post.url)
 
+        if self.checkpoint is not None:
+            checkpointed = self.checkpoint.files_for(post.url)
+            if checkpointed is not None:
+                self.downloads_skipped += len(checkpointed)
+                self.logger.info("Restored files from checkpoint", post_url=post.url, count=len(checkpointed))
+                return checkpointed
+
         try:
-            # Parse the post content to find download section
-            download_links = self._find_download_links(post.url)
+            # Parse the post content to find download section, reusing the crawler's page when available
+            download_links = self._find_download_links(post.url, post.page)
 
             # Filter for valid file types only
             valid_links = self._filter_valid_files(download_links)
@@ -48,8 +69,25 @@ class ParserService:
             valid_files = []
             for link in valid_links:
                 try:
-                    valid_file = self._download_file(link, post.url)
-                    if valid_file:
+                    existing = self._load_existing_download(link, post.url)
+                    # Indexed files are only requested again when the HTTP cache can revalidate them
+                    if existing and (self.cache is None or not self.cache.conditional_headers(link)):
+                        self.downloads_skipped += 1
+                        self.logger.info("Skipping already downloaded file",
+                                       filename=existing.filename,
+                                       path=existing.file_path)
+                        valid_files.append(existing)
+                        continue
+
+                    valid_file = self._download_file(link, post.url, existing)
+                    if valid_file is existing:
+                        self.downloads_skipped += 1
+                        self.logger.info("Download not modified, reusing local file",
+                                       filename=existing.filename,
+                                       path=existing.file_path)
+                        valid_files.append(existing)
+                    elif valid_file:
+                        self._record_download(valid_file)
                         valid_files.append(valid_file)
                         self.logger.info("File downloaded successfully",
                                        filename=valid_file.filename,
@@ -61,51 +99,28 @@ class ParserService:
             self.logger.info("File extraction completed",
                            total_files=len(valid_files),
                            post_url=post.url)
+            if self.checkpoint is not None:
+                self.checkpoint.record_files(post.url, valid_files)
             return valid_files
 
         except Exception as e:
             self.logger.error("File extraction failed", post_url=post.url, error=str(e))
             raise ParserError(f"Failed to extract files from post: {str(e)}")
 
-    def _find_download_links(self, post_url: str) -> List[str]:
-        """Find download links in the 'Download files' section of a post."""
-        try:
-            response = self.session.get(post_url, timeout=30)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            download_links = []
-
-            # Look for "Download files" section - common patterns
-            download_sections = []
-
-            # Method 1: Find by text content
-            for element in soup.find_all(text=lambda text: text and 'download' in text.lower()):
-                parent = element.parent
-                if parent and any(keyword in parent.get_text().lower() for keyword in ['download', 'files', 'attachment']):
-                    download_sections.append(parent)
-
-            # Method 2: Find by common class names
-            for selector in ['.download', '.files', '.attachments', '.resources']:
-                sections = soup.select(selector)
-                download_sections.extend(sections)
-
-            # Method 3: Look for links that point to file extensions
-            all_links = soup.find_all('a', href=True)
-            for link in all_links:
-                href = link.get('href')
-                if any(ext in href.lower() for ext in ['.xlsx', '.xls', '.csv', '.stl', '.zip']):
-                    download_links.append(urljoin(post_url, href))
+    def _find_download_links(self, post_url: str, page: Optional[FetchedPage] = None) -> List[str]:
+        """
+        Find download links in the 'Download files' section of a post.
 
-            # Extract links from identified download sections
-            for section in download_sections:
-                for link in section.find_all('a', href=True):
-                    href = link.get('href')
-                    full_url = urljoin(post_url, href)
-                    if full_url not in download_links:
-                        download_links.append(full_url)
+        Links come from the page's single-parse analysis: links to file extensions anywhere
+        in the post plus every link inside a download section (found by its text or class).
+        """
+        try:
+            if page is None:
+                page = FetchedPage(url=post_url, html=self._fetch_page_text(post_url))
+            else:
+                self.logger.debug("Reusing fetched page", post_url=post_url)
 
-            return list(set(download_links))  # Remove duplicates
+            return list(page.analysis.download_links)
 
         except Exception as e:
             self.logger.error("Failed to find download links", post_url=post_url, error=str(e))
@@ -142,38 +157,113 @@ class ParserService:
         url_lower = url.lower()
         return any(indicator in url_lower for indicator in gated_indicators)
 
-    def _download_file(self, url: str, source_post_url: str) -> ValidFile:
-        """Download a file and create a ValidFile object."""
+    def _fetch_page_text(self, url: str) -> str:
+        """GET a post page, revalidating against the HTTP cache when one is configured."""
+        def fetch(headers: Optional[Dict[str, str]] = None) -> requests.Response:
+            self._apply_rate_limiting()
+            self.request_counts['post'] += 1
+            response = self.session.get(url, timeout=30, headers=headers)
+            response.raise_for_status()
+            return response
+
+        if self.cache is None:
+            return fetch().text
+        return self.cache.fetch_text(url, fetch)
+
+    def _download_file(self, url: str, source_post_url: str,
+                       existing: Optional[ValidFile] = None) -> ValidFile:
+        """
+        Download a file and create a ValidFile object.
+
+        When an existing local copy is given and the HTTP cache holds validators for the URL,
+        a conditional request is made and the existing ValidFile is returned on 304.
+        """
         try:
-            response = self.session.get(url, timeout=60, stream=True)
+            headers = self.cache.conditional_headers(url) if self.cache and existing else None
+
+            self._apply_rate_limiting()
+            self.request_counts['download'] += 1
+            response = self.session.get(url, timeout=60, stream=True, headers=headers)
+
+            if existing and headers and response.status_code == 304:
+                response.close()
+                self.cache.record_hit(url, existing.file_size)
+                return existing
+
             response.raise_for_status()
 
             # Extract filename
             filename = self._extract_filename(url, response)
 
-            # Read file content
-            file_content = b''
-            file_size = 0
-
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    file_content += chunk
-                    file_size += len(chunk)
+            # Reject oversized files before reading the body when the server announces the size
+            content_length = int(response.headers.get('Content-Length') or 0)
+            if self.max_download_bytes and content_length > self.max_download_bytes:
+                raise DownloadError(f"File size {content_length} exceeds limit of {self.max_download_bytes} bytes")
 
-            # Create ValidFile object
-            valid_file = ValidFile.from_download(
+            # Stream to disk with incremental hashing
+            valid_file = ValidFile.from_stream(
                 url=url,
                 filename=filename,
-                content=file_content,
-                source_post_url=source_post_url
+                chunks=response.iter_content(chunk_size=65536),
+                source_post_url=source_post_url,
+                storage_dir=self.raw_dir,
+                max_bytes=self.max_download_bytes
             )
 
+            if self.cache:
+                self.cache.record_miss(url)
+                self.cache.store(url, response.headers)
+
             return valid_file
 
         except Exception as e:
             self.logger.error("File download failed", url=url, error=str(e))
             raise DownloadError(f"Failed to download file {url}: {str(e)}")
 
+    def _apply_rate_limiting(self):
+        """Apply the same minimum spacing between requests as the crawler."""
+        current_time = time.time()
+        time_since_last = current_time - self.last_request_time
+
+        if time_since_last < self.rate_limit_delay:
+            sleep_time = self.rate_limit_delay - time_since_last
+            self.logger.debug("Rate limiting applied", sleep_time=sleep_time)
+            time.sleep(sleep_time)
+
+        self.last_request_time = time.time()
+
+    def _load_existing_download(self, url: str, source_post_url: str) -> Optional[ValidFile]:
+        """Return a ValidFile for a URL already downloaded into data/raw, or None."""
+        entry = self._get_download_index().get(url)
+        if not entry or not os.path.exists(entry['file_path']):
+            return None
+
+        return ValidFile(**{**entry, 'source_post_url': source_post_url})
+
+    def _record_download(self, valid_file: ValidFile):
+        """Add a completed download to the data/raw URL index."""
+        index = self._get_download_index()
+        index[valid_file.url] = dict(valid_file.__dict__)
+
+        os.makedirs(self.raw_dir, exist_ok=True)
+        index_path = os.path.join(self.raw_dir, "index.json")
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, index_path)
+
+    def _get_download_index(self) -> Dict[str, dict]:
+        """Load the URL → downloaded file index for data/raw (once per service instance)."""
+        if self._download_index is None:
+            index_path = os.path.join(self.raw_dir, "index.json")
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    self._download_index = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._download_index = {}
+
+        return self._download_index
+
     def _extract_filename(self, url: str, response: requests.Response) -> str:
         """Extract filename from URL or Content-Disposition header."""
         # Try Content-Disposition header first
@@ -0,0 +1,178 @@
+import queue
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+import structlog
+from models.normalization_manifest import NormalizationManifest
+from models.post import Post
+from models.valid_file import ValidFile
+
+
+# Marks the end of a stage's output stream
+_DONE = object()
+
+
+class PipelineService:
+    """Streams posts through crawl → download → normalize → store stages connected by bounded queues."""
+
+    def __init__(self, crawler_service, parser_service, normalizer_service, storage_service,
+                 queue_size: int = 4, skip_files: bool = False, dry_run: bool = False,
+                 manifest: Optional[NormalizationManifest] = None, rules_fingerprint: Optional[str] = None):
+        self.logger = structlog.get_logger("mtf_crawler.pipeline")
+        self.crawler_service = crawler_service
+        self.parser_service = parser_service
+        self.normalizer_service = normalizer_service
+        self.storage_service = storage_service
+        self.queue_size = queue_size
+        self.skip_files = skip_files
+        self.dry_run = dry_run
+        # Stored posts are recorded here, so a later normalize phase skips what this run wrote
+        self.manifest = manifest
+        self.rules_fingerprint = rules_fingerprint
+
+    def run(self, base_url: str, max_posts: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run the full crawl → download → normalize → store pipeline with overlapping stages.
+
+        Each stage runs in its own thread and hands work to the next through a bounded
+        queue, so normalization of one post proceeds while later posts are still being
+        crawled and at most `queue_size` items wait between any two stages.
+
+        Args:
+            base_url: The base URL to start crawling from
+            max_posts: Optional limit on the number of post pages fetched
+
+        Returns:
+            Dictionary with run statistics plus the crawled posts and downloaded files
+            (needed to write the discovery results)
+        """
+        self.logger.info("Starting streaming pipeline", base_url=base_url, queue_size=self.queue_size)
+
+        started = time.monotonic()
+        posts_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        files_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        materials_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+
+        # Each thread counts into its own stats; they are merged once every stage has finished
+        stats: Dict[str, Any] = {
+            'posts_crawled': 0,
+            'files_downloaded': 0,
+            'materials_processed': 0,
+            'json_files_created': 0,
+            'stage_errors': 0,
+            'first_output_seconds': None
+        }
+        crawl_stats: Dict[str, Any] = Counter()
+        download_stats: Dict[str, Any] = Counter()
+        normalize_stats: Dict[str, Any] = Counter()
+        posts: List[Post] = []
+        files: List[ValidFile] = []
+
+        threads = [
+            threading.Thread(target=self._crawl_stage, args=(base_url, max_posts, posts_queue, crawl_stats),
+                             name="pipeline-crawl", daemon=True),
+            threading.Thread(target=self._run_stage,
+                             args=("download", self._download, posts_queue, files_queue, download_stats),
+                             name="pipeline-download", daemon=True),
+            threading.Thread(target=self._run_stage,
+                             args=("normalize", self._normalize, files_queue, materials_queue, normalize_stats),
+                             name="pipeline-normalize", daemon=True)
+        ]
+        for thread in threads:
+            thread.start()
+
+        # The store stage runs on the calling thread so results are collected here
+        while True:
+            item = materials_queue.get()
+            if item is _DONE:
+                break
+
+            post, post_files, materials = item
+            posts.append(post)
+            files.extend(post_files)
+            stats['files_downloaded'] += len(post_files)
+            stats['materials_processed'] += len(materials)
+
+            if self.dry_run:
+                continue
+
+            try:
+                self.storage_service.save_json(post, post_files, materials)
+                stats['json_files_created'] += 1
+                if self.manifest is not None:
+                    for file in post_files:
+                        self.manifest.record(file, self.rules_fingerprint, post.post_hash)
+                if stats['first_output_seconds'] is None:
+                    stats['first_output_seconds'] = round(time.monotonic() - started, 3)
+                    self.logger.info("First processed JSON stored", seconds=stats['first_output_seconds'])
+            except Exception as e:
+                stats['stage_errors'] += 1
+                self.logger.error("Store stage failed", post_url=post.url, error=str(e))
+
+        for thread in threads:
+            thread.join()
+        for stage_stats in (crawl_stats, download_stats, normalize_stats):
+            for key, value in stage_stats.items():
+                # Counts add up; the crawl stage's error message is kept as is
+                stats[key] = value if key == 'error' else stats.get(key, 0) + value
+
+        stats['elapsed_seconds'] = round(time.monotonic() - started, 3)
+        stats['posts'] = posts
+        stats['files'] = files
+        self.logger.info("Streaming pipeline completed",
+                         **{k: v for k, v in stats.items() if k not in ('posts', 'files')})
+        return stats
+
+    def _crawl_stage(self, base_url: str, max_posts: Optional[int], outbox: queue.Queue, stats: Dict[str, Any]):
+        """Producer: push posts downstream as the crawler yields them."""
+        try:
+            for post in self.crawler_service.iter_posts(base_url, max_posts=max_posts):
+                stats['posts_crawled'] += 1
+                outbox.put(post)
+        except Exception as e:
+            stats['error'] = str(e)
+            self.logger.error("Crawl stage failed", error=str(e))
+        finally:
+            outbox.put(_DONE)
+
+    def _run_stage(self, name: str, work: Callable[[Any], Any], inbox: queue.Queue,
+                   outbox: queue.Queue, stats: Dict[str, Any]):
+        """Consume items from inbox, apply work and forward results; per-item failures are logged and skipped."""
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                outbox.put(_DONE)
+                return
+
+            try:
+                outbox.put(work(item))
+            except Exception as e:
+                stats['stage_errors'] += 1
+                self.logger.error("Pipeline stage failed", stage=name, error=str(e))
+
+    def _download(self, post: Post):
+        """Download stage: extract the post's spreadsheet files."""
+        post_files = []
+        if not self.skip_files and not self.dry_run:
+            try:
+                post_files = self.parser_service.extract_files(post)
+            except Exception as e:
+                # Keep the post: it is still stored without files, as in the sequential flow
+                self.logger.error("Failed to process post files", post_url=post.url, error=str(e))
+
+        # The parsed page is no longer needed once download links are known
+        post.page = None
+        return post, post_files
+
+    def _normalize(self, item):
+        """Normalize stage: extract materials from the post's files."""
+        post, post_files = item
+        materials = []
+        if post_files:
+            try:
+                materials = self.normalizer_service.process_materials(post_files)
+            except Exception as e:
+                # Keep the post: it is still stored without materials, as in the sequential flow
+                self.logger.error("Failed to normalize post files", post_url=post.url, error=str(e))
+        return post, post_files, materials
@@ -0,0 +1,86 @@
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+# Keyword rules for headers without an exact mapping, checked in order; the first match wins
+_KEYWORD_RULES = [
+    (re.compile(r'tensile|tension'), "tensile_strength"),
+    (re.compile(r'young|elastic'), "elastic_modulus"),
+    (re.compile(r'elongation|strain'), "elongation_at_break"),
+    (re.compile(r'impact'), "impact_strength"),
+    (re.compile(r'flexural'), "flexural_strength"),
+    (re.compile(r'density'), "density"),
+    (re.compile(r'^(?=.*temperature)(?=.*glass)', re.DOTALL), "glass_transition_temperature"),
+]
+
+# Runs of anything but lower-case letters and digits (underscores included) collapse to one underscore
+_NON_IDENTIFIER = re.compile(r'[^a-z0-9]+')
+
+
+class PropertyNameClassifier:
+    """
+    Maps column headers to standard property names.
+
+    Headers such as "Tensile strength (MPa)" recur across materials, sheets and files, so
+    results are memoized per raw header text in an LRU cache.
+    """
+
+    def __init__(self, property_mappings: Dict[str, str], cache_size: Optional[int] = 4096):
+        """
+        Args:
+            property_mappings: Lower-case header → standard property name (copied)
+            cache_size: Maximum number of memoized headers; None for unbounded
+        """
+        self._property_mappings = dict(property_mappings)
+        self._classify_cached = lru_cache(maxsize=cache_size)(self._classify)
+
+    @property
+    def property_mappings(self) -> Mapping[str, str]:
+        """Read-only view of the exact mappings; change them with update_mappings."""
+        return MappingProxyType(self._property_mappings)
+
+    def update_mappings(self, property_mappings: Mapping[str, str]):
+        """Add or replace exact mappings, forgetting memoized headers they may change."""
+        self._property_mappings.update(property_mappings)
+        self._classify_cached.cache_clear()
+
+    def classify(self, header: str) -> str:
+        """
+        Return the standard property name for a column header.
+
+        Exact mappings win, then the keyword rules; any other header is turned into a
+        snake_case identifier.
+        """
+        return self._classify_cached(header)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Cache statistics: hits, misses, cached headers and hit rate."""
+        info = self._classify_cached.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'cached': info.currsize,
+            'hit_rate': round(info.hits / lookups, 4) if lookups else 0.0
+        }
+
+    def clear_cache(self):
+        """Forget memoized headers and reset the statistics."""
+        self._classify_cached.cache_clear()
+
+    def _classify(self, header: str) -> str:
+        name_lower = header.lower().strip()
+
+        if name_lower in self._property_mappings:
+            return self._property_mappings[name_lower]
+
+        for pattern, property_name in _KEYWORD_RULES:
+            if pattern.search(name_lower):
+                return property_name
+
+        return _NON_IDENTIFIER.sub('_', name_lower).strip('_')
+
+    def __str__(self) -> str:
+        return f"PropertyNameClassifier(mappings={len(self.property_mappings)}, cached={self.stats['cached']})"
@@ -0,0 +1,209 @@
+import json
+import os
+import shutil
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import structlog
+
+# pyarrow writes the Feather (Arrow IPC) files; without it the normalizer parses every workbook on each run
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# Bump when the on-disk layout or the cell encoding changes; older entries are then ignored
+CACHE_FORMAT_VERSION = "1"
+
+# Schema metadata key listing the object columns stored as typed parts
+_ENCODED_COLUMNS_KEY = b'mtf_encoded_columns'
+
+# Schema metadata key holding the bounds a stored table was cut to (absent for a whole sheet)
+_TABLE_BOUNDS_KEY = b'mtf_table_bounds'
+
+# Spreadsheet object columns mix str, int and float cells (plus NaN/None), which Arrow cannot
+# store in one column. Each such column is split into a type-code column plus one typed column
+# per kind, and reassembled with numpy on load.
+_KINDS = (str, int, float, bool, type(None))
+_KIND_CODES = {kind: code for code, kind in enumerate(_KINDS)}
+_KIND_ARROW_TYPES = (pa.string(), pa.int64(), pa.float64(), pa.bool_()) if ARROW_AVAILABLE else ()
+
+
+class SheetCache:
+    """
+    Content-addressed on-disk cache of parsed sheets, keyed by workbook hash and reader version.
+
+    Sheets are stored as compressed Feather (Arrow IPC) files: columnar like Parquet, about
+    as compact for these sheets, and several times faster to read back.
+    """
+
+    def __init__(self, cache_dir: str = "data/cache/sheets"):
+        self.logger = structlog.get_logger("mtf_crawler.sheet_cache")
+        self.cache_dir = cache_dir
+        self.stats = Counter()  # hits, misses, uncacheable
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def key(self, sha256_hash: str, reader_version: str) -> str:
+        """Cache key for a workbook: its content hash plus the reader that parsed it."""
+        safe_version = ''.join(c if c.isalnum() or c in '.-' else '_' for c in reader_version)
+        return f"{sha256_hash}-v{CACHE_FORMAT_VERSION}-{safe_version}"
+
+    def sheet_names(self, key: str) -> Optional[List[str]]:
+        """Return the workbook's sheet names, or None when the workbook has not been cached."""
+        try:
+            with open(os.path.join(self.cache_dir, key, 'index.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)['sheet_names']
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+
+    def store_sheet_names(self, key: str, sheet_names: List[str]):
+        """Record the sheet names of a workbook so later runs need not open it."""
+        os.makedirs(os.path.join(self.cache_dir, key), exist_ok=True)
+        content = json.dumps({'sheet_names': sheet_names}, ensure_ascii=False)
+        tmp_path = self._tmp_path(os.path.join(self.cache_dir, key, 'index.json'))
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, os.path.join(self.cache_dir, key, 'index.json'))
+
+    def load(self, key: str, sheet_index: int) -> Optional[pd.DataFrame]:
+        """Return a cached sheet, or None on a miss (or an unreadable entry, or only the sheet's table cached)."""
+        cached = self._load(key, sheet_index, whole_only=True)
+        return cached[0] if cached is not None else None
+
+    def load_table(self, key: str, sheet_index: int) -> Optional[Tuple[pd.DataFrame, Optional[Dict[str, Any]]]]:
+        """
+        Return a cached sheet or table, with the bounds the table was cut to.
+
+        Returns:
+            (frame, bounds): bounds is None for a whole sheet, else {'columns': positions or None,
+            'rows': count or None} as passed to store(); None on a miss
+        """
+        return self._load(key, sheet_index, whole_only=False)
+
+    def _load(self, key: str, sheet_index: int,
+              whole_only: bool) -> Optional[Tuple[pd.DataFrame, Optional[Dict[str, Any]]]]:
+        path = self._sheet_path(key, sheet_index)
+        try:
+            table = feather.read_table(path)
+        except FileNotFoundError:
+            self.stats['misses'] += 1
+            return None
+        except Exception as e:
+            self.logger.warning("Discarding unreadable cached sheet", path=path, error=str(e))
+            self.stats['misses'] += 1
+            return None
+
+        table_bounds = (table.schema.metadata or {}).get(_TABLE_BOUNDS_KEY)
+        if table_bounds is not None and whole_only:
+            self.stats['misses'] += 1
+            return None
+
+        encoded_columns = json.loads((table.schema.metadata or {}).get(_ENCODED_COLUMNS_KEY, b'[]'))
+        encoded_columns_by_position = dict(encoded_columns)
+        part_names = [f"{position}:{kind.__name__}" for position, _ in encoded_columns for kind in _KINDS[:-1]]
+        part_names += [f"{position}:kind" for position, _ in encoded_columns]
+        df = table.drop_columns(part_names).to_pandas() if part_names else table.to_pandas()
+        if encoded_columns:
+            # Rebuild in one go; inserting columns one by one copies the frame each time
+            decoded = {position: _decode_column(table, position) for position, _ in encoded_columns}
+            typed_columns = iter(df.columns)
+            names = []
+            data = {}
+            for position in range(len(df.columns) + len(encoded_columns)):
+                name = encoded_columns_by_position[position] if position in decoded else next(typed_columns)
+                names.append(name)
+                data[name] = decoded[position] if position in decoded else df[name]
+            df = pd.DataFrame(data, index=df.index, columns=names)
+
+        self.stats['hits'] += 1
+        return df, json.loads(table_bounds) if table_bounds is not None else None
+
+    def store(self, key: str, sheet_index: int, df: pd.DataFrame,
+              table_bounds: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Store a parsed sheet.
+
+        Args:
+            key: Workbook cache key (see key())
+            sheet_index: Zero-based sheet position
+            df: The whole sheet, or only its table when table_bounds is given
+            table_bounds: {'columns': positions or None, 'rows': count or None} the table was cut to
+
+        Returns:
+            False when the sheet holds values that cannot be stored losslessly (it is then
+            simply parsed again next time), True otherwise
+        """
+        try:
+            table = _encode_frame(df)
+            if table is not None and table_bounds is not None:
+                metadata = dict(table.schema.metadata or {})
+                metadata[_TABLE_BOUNDS_KEY] = json.dumps(table_bounds).encode('utf-8')
+                table = table.replace_schema_metadata(metadata)
+        except (pa.ArrowException, ValueError, TypeError) as e:
+            self.logger.debug("Sheet not cacheable", key=key, sheet_index=sheet_index, error=str(e))
+            table = None
+        if table is None:
+            self.stats['uncacheable'] += 1
+            return False
+
+        path = self._sheet_path(key, sheet_index)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = self._tmp_path(path)
+        feather.write_feather(table, tmp_path)
+        os.replace(tmp_path, path)
+        return True
+
+    def clear(self):
+        """Remove every cached workbook."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _sheet_path(self, key: str, sheet_index: int) -> str:
+        return os.path.join(self.cache_dir, key, f"{sheet_index}.arrow")
+
+    def _tmp_path(self, path: str) -> str:
+        # Unique per process and thread, so pool workers caching the same workbook never collide
+        return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _encode_frame(df: pd.DataFrame) -> Optional['pa.Table']:
+    """Convert a sheet to an Arrow table; None when a header or cell value cannot round-trip exactly."""
+    if not all(isinstance(column, str) for column in df.columns) or not df.columns.is_unique:
+        return None
+
+    object_positions = [position for position in range(df.shape[1]) if df.dtypes.iloc[position] == object]
+    typed_df = df.drop(columns=[df.columns[position] for position in object_positions])
+    table = pa.Table.from_pandas(typed_df)
+
+    encoded_columns = []
+    for position in object_positions:
+        values = df.iloc[:, position].to_numpy()
+        codes = np.fromiter((_KIND_CODES.get(type(value), -1) for value in values), dtype=np.int8, count=len(values))
+        if (codes < 0).any():
+            return None
+        for code, kind in enumerate(_KINDS[:-1]):
+            mask = codes == code
+            part = pa.array(np.where(mask, values, None).tolist(), type=_KIND_ARROW_TYPES[code])
+            table = table.append_column(f"{position}:{kind.__name__}", part)
+        table = table.append_column(f"{position}:kind", pa.array(codes))
+        encoded_columns.append((position, df.columns[position]))
+
+    metadata = dict(table.schema.metadata or {})
+    metadata[_ENCODED_COLUMNS_KEY] = json.dumps(encoded_columns).encode('utf-8')
+    return table.replace_schema_metadata(metadata)
+
+
+def _decode_column(table: 'pa.Table', position: int) -> np.ndarray:
+    """Reassemble an object column from its type codes and typed parts."""
+    codes = table.column(f"{position}:kind").to_numpy()
+    values = np.full(len(codes), None, dtype=object)
+    for code, kind in enumerate(_KINDS[:-1]):
+        mask = codes == code
+        if mask.any():
+            part = table.column(f"{position}:{kind.__name__}").to_pylist()
+            values[mask] = np.array(part, dtype=object)[mask]
+    return values
@@ -1,7 +1,8 @@
 import json
 import os
-from typing import List
+from typing import Dict, List, Optional
 from datetime import datetime
+import numpy as np
 import structlog
 from models.post import Post
 from models.valid_file import ValidFile
@@ -50,8 +51,11 @@ class StorageService:
             if not json_data.validate():
                 raise ValidationError("JSONData failed constitutional validation")
 
+            # Save the series sidecar first, so a JSON file never points at a missing one
+            series_file = self._save_series(json_data.post.post_hash, materials)
+
             # Save to file
-            output_path = self._save_to_file(json_data)
+            output_path = self._save_to_file(json_data, series_file)
 
             self.logger.info("JSON data saved successfully",
                            output_path=output_path,
@@ -83,7 +87,7 @@ class StorageService:
 
         self.logger.debug("Input validation passed")
 
-    def _save_to_file(self, json_data: JSONData) -> str:
+    def _save_to_file(self, json_data: JSONData, series_file: Optional[str] = None) -> str:
         """Save JSONData to file with proper encoding and error handling."""
         # Generate output filename
         filename = f"{json_data.post.post_hash}.json"
@@ -103,6 +107,8 @@ class StorageService:
                 'generator': 'mtf-crawler/1.0.0',
                 'constitutional_compliance_verified': True
             }
+            if series_file:
+                data_dict['_metadata']['series_file'] = series_file
 
             # Add licensing information per constitution
             data_dict['_licensing'] = {
@@ -122,6 +128,74 @@ class StorageService:
             self.logger.error("File write failed", path=output_path, error=str(e))
             raise StorageError(f"Failed to write JSON file: {str(e)}")
 
+    def _series_path(self, storage_key: str) -> str:
+        return os.path.join(self.output_dir, f"{storage_key}.series.npz")
+
+    def _save_series(self, storage_key: str, materials: List[MaterialData]) -> Optional[str]:
+        """
+        Write the materials' full value series to a compressed .npz sidecar next to the JSON.
+
+        Arrays are keyed "<material name>/<property>/values" (float64, in the column's most common
+        unit, SI when that unit is known) and ".../units";
+        repeated material names get a " #2", " #3", ... suffix in material order.
+
+        Returns:
+            The sidecar's file name, or None when no material has series (a stale sidecar is removed)
+        """
+        arrays = {}
+        seen_names: Dict[str, int] = {}
+        for material in materials:
+            if not material.series:
+                continue
+            seen_names[material.material_name] = seen_names.get(material.material_name, 0) + 1
+            name = material.material_name
+            if seen_names[name] > 1:
+                name = f"{name} #{seen_names[name]}"
+            for property_name, series in material.series.items():
+                arrays[f"{name}/{property_name}/values"] = np.asarray(series["values"], dtype=np.float64)
+                arrays[f"{name}/{property_name}/units"] = np.asarray(series["units"], dtype=str)
+
+        path = self._series_path(storage_key)
+        if not arrays:
+            if os.path.exists(path):
+                os.remove(path)
+            return None
+
+        try:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.error("Series write failed", path=path, error=str(e))
+            raise StorageError(f"Failed to write series file: {str(e)}")
+
+        self.logger.debug("Series written", path=path, arrays=len(arrays), size_bytes=os.path.getsize(path))
+        return os.path.basename(path)
+
+    def load_series(self, storage_key: str) -> Dict[str, Dict[str, Dict[str, np.ndarray]]]:
+        """
+        Load the value series stored next to a JSON file.
+
+        Returns:
+            {material name: {property: {"values": float64 array, "units": str array}}};
+            empty when the post was normalized without series
+        """
+        path = self._series_path(storage_key)
+        if not os.path.exists(path):
+            return {}
+
+        series: Dict[str, Dict[str, Dict[str, np.ndarray]]] = {}
+        try:
+            with np.load(path) as arrays:
+                for key in arrays.files:
+                    material_name, property_name, field = key.rsplit('/', 2)
+                    series.setdefault(material_name, {}).setdefault(property_name, {})[field] = arrays[key]
+        except Exception as e:
+            self.logger.error("Failed to load series", storage_key=storage_key, error=str(e))
+            raise StorageError(f"Failed to load series: {str(e)}")
+        return series
+
     def load_json(self, storage_key: str) -> JSONData:
         """Load JSONData from file by storage key."""
         try:
@@ -146,6 +220,10 @@ class StorageService:
             self.logger.error("Failed to load JSON data", storage_key=storage_key, error=str(e))
             raise StorageError(f"Failed to load JSON data: {str(e)}")
 
+    def has_json(self, storage_key: str) -> bool:
+        """Check whether a JSON file is stored under a storage key."""
+        return os.path.exists(os.path.join(self.output_dir, f"{storage_key}.json"))
+
     def list_stored_data(self) -> List[str]:
         """List all stored JSON files by their storage keys."""
         try:
@@ -170,6 +248,8 @@ class StorageService:
 
             if os.path.exists(file_path):
                 os.remove(file_path)
+                if os.path.exists(self._series_path(storage_key)):
+                    os.remove(self._series_path(storage_key))
                 self.logger.info("JSON data deleted", storage_key=storage_key)
                 return True
             else:
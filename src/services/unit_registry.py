@@ -0,0 +1,165 @@
+import re
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class UnitConversion:
+    """Affine conversion of a source unit to its SI unit: si_value = value * scale + offset."""
+
+    si_unit: str
+    scale: float
+    offset: float = 0.0
+
+    def apply(self, values):
+        """Convert a number or a NumPy array of numbers."""
+        return values * self.scale + self.offset
+
+
+# Source units (canonical spelling, see _canonical) → SI unit, scale, offset
+_DEFAULT_UNITS: Dict[str, Tuple[str, float, float]] = {
+    # Pressure/Stress conversions to Pa
+    "mpa": ("Pa", 1e6, 0.0),
+    "gpa": ("Pa", 1e9, 0.0),
+    "kpa": ("Pa", 1e3, 0.0),
+    "psi": ("Pa", 6894.76, 0.0),
+    "ksi": ("Pa", 6.89476e6, 0.0),
+
+    # Temperature conversions to Kelvin
+    "°c": ("K", 1.0, 273.15),
+    "°f": ("K", 5 / 9, 273.15 - 32 * 5 / 9),
+
+    # Density conversions to kg/m³
+    "g/cm³": ("kg/m³", 1000.0, 0.0),
+
+    # Length conversions to meters
+    "mm": ("m", 0.001, 0.0),
+    "cm": ("m", 0.01, 0.0),
+    "in": ("m", 0.0254, 0.0),
+    "ft": ("m", 0.3048, 0.0),
+}
+
+# Alternative spellings (canonical form) → source unit
+_DEFAULT_ALIASES: Dict[str, str] = {
+    "n/mm²": "mpa",
+    "celsius": "°c",
+    "degc": "°c",
+    "deg c": "°c",
+    "fahrenheit": "°f",
+    "degf": "°f",
+    "deg f": "°f",
+    "g/cm3": "g/cm³",
+    "g/cc": "g/cm³",
+    "inch": "in",
+    "inches": "in",
+}
+
+# Spelling variants folded before lookup: ordinal and ring signs typed for the degree sign, ^2/^3 for ²/³
+_DEGREE_SIGNS = re.compile(r'[º˚]')
+_POWERS = {"^2": "²", "^3": "³"}
+_WHITESPACE = re.compile(r'\s+')
+
+# Shorter unit arrays are resolved value by value rather than factorized into distinct units
+_FACTORIZE_MIN_VALUES = 64
+
+
+def _canonical(unit: str) -> str:
+    """Fold a unit's spelling: lower case, single spaces, one degree sign, superscript powers."""
+    canonical = _WHITESPACE.sub(' ', unit.strip().lower())
+    canonical = _DEGREE_SIGNS.sub('°', canonical)
+    for power, superscript in _POWERS.items():
+        canonical = canonical.replace(power, superscript)
+    return canonical
+
+
+class UnitRegistry:
+    """
+    Unit conversions to SI, precompiled to a scale and offset per source unit.
+
+    Unit strings are resolved once (spelling folded, aliases followed) and remembered in an
+    interned table, so converting a column costs one lookup per distinct unit and a single
+    array multiply-add.
+    """
+
+    def __init__(self, units: Optional[Dict[str, Tuple[str, float, float]]] = None,
+                 aliases: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            units: Source unit → (SI unit, scale, offset); defaults to the built-in table
+            aliases: Alternative spelling → source unit; defaults to the built-in table
+        """
+        self.conversions: Dict[str, UnitConversion] = {}
+        self.aliases: Dict[str, str] = {}
+        self._resolved: Dict[str, Optional[UnitConversion]] = {}
+
+        for unit, (si_unit, scale, offset) in (_DEFAULT_UNITS if units is None else units).items():
+            self.define(unit, si_unit, scale, offset)
+        for alias, unit in (_DEFAULT_ALIASES if aliases is None else aliases).items():
+            self.alias(alias, unit)
+
+    def define(self, unit: str, si_unit: str, scale: float, offset: float = 0.0, aliases: Iterable[str] = ()):
+        """Register (or replace) the conversion of a source unit, optionally with alternative spellings."""
+        self.conversions[_canonical(unit)] = UnitConversion(si_unit, float(scale), float(offset))
+        for alias in aliases:
+            self.alias(alias, unit)
+        self._resolved.clear()
+
+    def alias(self, alias: str, unit: str):
+        """
+        Register an alternative spelling of a source unit.
+
+        Raises:
+            KeyError: When the unit has not been defined
+        """
+        if _canonical(unit) not in self.conversions:
+            raise KeyError(f"Unknown unit '{unit}'")
+        self.aliases[_canonical(alias)] = _canonical(unit)
+        self._resolved.clear()
+
+    def resolve(self, unit: str) -> Optional[UnitConversion]:
+        """Return the conversion for a unit as written in a sheet, or None when it has no SI mapping."""
+        try:
+            return self._resolved[unit]
+        except KeyError:
+            pass
+
+        canonical = _canonical(unit)
+        conversion = self.conversions.get(self.aliases.get(canonical, canonical))
+        self._resolved[sys.intern(unit)] = conversion
+        return conversion
+
+    def convert(self, values: np.ndarray, units: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert an array of values, each with its own unit, to SI in bulk.
+
+        Args:
+            values: float64 values
+            units: Unit text of each value (object array of str)
+
+        Returns:
+            Tuple of (SI values, SI units); values without a known unit are returned unchanged
+            with their original unit
+        """
+        if len(values) == 0:
+            return values.astype(float), units.copy()
+
+        if len(units) <= _FACTORIZE_MIN_VALUES:
+            # A handful of values (the normalizer's default sampling): resolving each is cheaper than factorizing
+            conversions = [self.resolve(unit) for unit in units]
+            codes = slice(None)
+            distinct = units
+        else:
+            codes, distinct = pd.factorize(units)
+            conversions = [self.resolve(unit) for unit in distinct]
+
+        scales = np.array([c.scale if c else 1.0 for c in conversions])
+        offsets = np.array([c.offset if c else 0.0 for c in conversions])
+        si_units = np.array([c.si_unit if c else unit for c, unit in zip(conversions, distinct)], dtype=object)
+
+        return values * scales[codes] + offsets[codes], si_units[codes]
+
+    def __str__(self) -> str:
+        return f"UnitRegistry(units={len(self.conversions)}, aliases={len(self.aliases)})"
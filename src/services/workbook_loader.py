@@ -0,0 +1,681 @@
+import codecs
+import csv
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+
+if TYPE_CHECKING:
+    from services.sheet_cache import SheetCache
+
+# python-calamine (Rust, values only) is optional; without it .xlsx files are streamed with openpyxl
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# pyarrow's multithreaded CSV reader is optional; without it CSV files are read with pandas' C parser
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    ARROW_CSV_AVAILABLE = True
+except ImportError:
+    ARROW_CSV_AVAILABLE = False
+
+# Spreadsheet reader engines (MTF_EXCEL_ENGINE); 'auto' picks the fastest available for the file type
+EXCEL_ENGINES = ('auto', 'calamine', 'openpyxl-stream', 'pandas')
+
+# Cell error values; openpyxl returns them as strings when reading values only, pandas reads them as NaN
+_EXCEL_ERRORS = frozenset({'#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!', '#N/A'})
+
+# Resolved engines reading CSV files
+CSV_ENGINES = ('csv', 'csv-arrow')
+
+# Cells read as missing by pandas, and so by the Arrow CSV reader too
+_NA_VALUES = sorted(STR_NA_VALUES)
+
+# Bytes read from the start of a CSV file to sniff its encoding and delimiter
+CSV_SNIFF_BYTES = 65536
+_CSV_DELIMITERS = ',;\t|'
+
+# Rows read below the header to locate a sheet's table before reading it (covers the layout detector's sample)
+SNIFF_ROWS = 20
+
+# Sheet limits of .xlsx files, used to write open-ended skipped regions as A1 ranges
+_MAX_ROWS = 1048576
+_MAX_COLUMN = 'XFD'
+
+
+def resolve_engine(file_type: str, engine: str = 'auto') -> str:
+    """
+    Pick the reader engine for a file type.
+
+    Args:
+        file_type: File extension ('.xlsx', '.xls' or '.csv')
+        engine: One of EXCEL_ENGINES
+
+    Returns:
+        For CSV files 'csv-arrow' (pyarrow's multithreaded reader) when pyarrow is installed
+        and the engine is 'auto', otherwise 'csv' (pandas' C parser); the concrete engine
+        name for spreadsheets
+
+    Raises:
+        WorkbookError: When the engine is unknown or its dependency is missing
+    """
+    if engine not in EXCEL_ENGINES:
+        raise WorkbookError(f"Unknown reader engine '{engine}'. Must be one of: {EXCEL_ENGINES}")
+    if file_type == '.csv':
+        return 'csv-arrow' if engine == 'auto' and ARROW_CSV_AVAILABLE else 'csv'
+
+    if engine == 'auto':
+        if CALAMINE_AVAILABLE:
+            return 'calamine'
+        return 'openpyxl-stream' if file_type == '.xlsx' else 'pandas'
+    if engine == 'calamine' and not CALAMINE_AVAILABLE:
+        raise WorkbookError("Reader engine 'calamine' requires the python-calamine package")
+    if engine == 'openpyxl-stream' and file_type != '.xlsx':
+        # openpyxl cannot read legacy .xls files; pandas falls back to xlrd
+        return 'pandas'
+    return engine
+
+
+@lru_cache(maxsize=None)
+def engine_version(engine: str) -> str:
+    """
+    Identify a resolved engine together with the library versions that shape its output.
+
+    Parsed sheets are only reused from the sheet cache for the same identifier.
+    """
+    libraries = {'calamine': 'python-calamine', 'openpyxl-stream': 'openpyxl', 'pandas': 'openpyxl',
+                 'csv-arrow': 'pyarrow'}
+    parts = [engine, f"pandas{pd.__version__}"]
+    if engine in libraries:
+        try:
+            parts.append(f"{libraries[engine]}{version(libraries[engine])}")
+        except PackageNotFoundError:
+            pass
+    return '-'.join(parts)
+
+
+@dataclass(frozen=True)
+class TableBounds:
+    """
+    Region of a sheet holding its table, found by sniffing the header and first rows.
+
+    Positions and counts are relative to the sheet as pandas reads it: the header is row 1
+    and the first data row is row 2.
+    """
+
+    columns: Optional[Tuple[int, ...]] = None  # column positions read; None for every column
+    rows: Optional[int] = None  # data rows read below the header; None for every row
+
+    @property
+    def complete(self) -> bool:
+        """Whether the whole sheet is read."""
+        return self.columns is None and self.rows is None
+
+    def read_range(self, table: pd.DataFrame) -> str:
+        """A1 range spanning the cells read into a table, header included (e.g. 'A1:E26')."""
+        last_column = max(self.columns) if self.columns is not None else table.shape[1] - 1
+        return f"A1:{_column_letter(max(last_column, 0))}{len(table) + 1}"
+
+    @property
+    def skipped_regions(self) -> List[str]:
+        """
+        A1 ranges of the sheet that are not read: runs of skipped columns (e.g. 'C:H', or
+        'F:XFD' for everything right of the table) and the rows below the table (e.g. '27:1048576').
+        """
+        regions = []
+        if self.columns is not None:
+            read = set(self.columns)
+            position = 0
+            while position <= max(read):
+                if position in read:
+                    position += 1
+                    continue
+                start = position
+                while position not in read:
+                    position += 1
+                regions.append(f"{_column_letter(start)}:{_column_letter(position - 1)}")
+            regions.append(f"{_column_letter(max(read) + 1)}:{_MAX_COLUMN}")
+        if self.rows is not None:
+            regions.append(f"{self.rows + 2}:{_MAX_ROWS}")
+        return regions
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cut the table out of a fully read sheet."""
+        if self.complete:
+            return df
+        columns = list(self.columns) if self.columns is not None else slice(None)
+        return df.iloc[:self.rows, columns]
+
+
+def find_table_bounds(sniff: pd.DataFrame) -> TableBounds:
+    """
+    Locate the table of a sheet from its header and first rows.
+
+    A sheet whose first row names at least two columns holds a table: the run of columns
+    around the named header cells, bounded by the first column left blank in the header
+    and the sniffed rows, and ending at the first blank row after its data. Columns beyond
+    a blank column (side blocks such as raw test data) and rows below the table are not
+    read. Column A is always read since material names are looked up there. Other sheets,
+    including those whose first row is a lone title or caption ("Settings:") over titled
+    blocks scattered across the sheet, are read whole.
+
+    Args:
+        sniff: The header and first rows of the sheet
+
+    Returns:
+        The bounds to read; complete bounds when the whole sheet is needed
+    """
+    return _table_bounds(list(sniff.columns), sniff.notna().to_numpy())
+
+
+def _table_bounds(header: List[Any], filled: np.ndarray) -> TableBounds:
+    """find_table_bounds on header labels and the rows × columns mask of filled cells."""
+    width = len(header)
+    named = np.array([_is_named_header(column) for column in header], dtype=bool)
+    if named.sum() < 2:
+        return TableBounds()
+
+    filled_columns = filled.any(axis=0) | named
+    start = end = int(np.argmax(named))
+    while start > 0 and filled_columns[start - 1]:
+        start -= 1
+    while end + 1 < width and filled_columns[end + 1]:
+        end += 1
+
+    # The table ends at the first blank row following its data; blank rows right under the header do not count
+    data_rows = filled[:, start:end + 1].any(axis=1)
+    rows = None
+    if data_rows.any():
+        first_data_row = int(np.argmax(data_rows))
+        blank_after = ~data_rows[first_data_row:]
+        if blank_after.any():
+            rows = first_data_row + int(np.argmax(blank_after))
+
+    return TableBounds(tuple(sorted({0} | set(range(start, end + 1)))), rows)
+
+
+@dataclass(frozen=True)
+class CsvFormat:
+    """Encoding and delimiter of a CSV file, and the blank lines above its header row."""
+
+    encoding: str = 'utf-8'
+    delimiter: str = ','
+    header_row: int = 0
+
+    @property
+    def arrow_encoding(self) -> str:
+        """The encoding as pyarrow names it; pyarrow skips a UTF-8 byte order mark by itself."""
+        return 'utf8' if self.encoding in ('utf-8', 'utf-8-sig') else self.encoding
+
+
+def sniff_csv_format(path: str) -> CsvFormat:
+    """
+    Guess the format of a CSV file from its first CSV_SNIFF_BYTES bytes.
+
+    The encoding comes from a byte order mark if there is one, otherwise it is UTF-8 when
+    the sample decodes as UTF-8 and cp1252 (Excel's CSV export on Windows) or latin-1 when
+    it does not. The delimiter is the one of ',', ';', tab and '|' that splits the sampled
+    lines most consistently, defaulting to ','.
+
+    Args:
+        path: Path to the CSV file
+
+    Returns:
+        The sniffed CsvFormat
+    """
+    with open(path, 'rb') as handle:
+        sample = handle.read(CSV_SNIFF_BYTES)
+
+    if sample.startswith(codecs.BOM_UTF8):
+        encoding = 'utf-8-sig'
+    elif sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        encoding = 'utf-16'
+    else:
+        encoding = 'latin-1'
+        for candidate in ('utf-8', 'cp1252'):
+            try:
+                # Incremental, so a multi-byte character cut off by the sample does not count as an error
+                codecs.getincrementaldecoder(candidate)().decode(sample, final=False)
+            except UnicodeDecodeError:
+                continue
+            encoding = candidate
+            break
+
+    lines = codecs.getincrementaldecoder(encoding)(errors='replace').decode(sample).splitlines()
+    if len(sample) == CSV_SNIFF_BYTES:
+        lines = lines[:-1]  # The last line may be cut off by the sample
+    header_row = 0
+    while header_row < len(lines) and not lines[header_row].strip():
+        header_row += 1
+    try:
+        delimiter = csv.Sniffer().sniff('\n'.join(lines[header_row:]), delimiters=_CSV_DELIMITERS).delimiter
+    except csv.Error:
+        delimiter = ','
+    return CsvFormat(encoding, delimiter, header_row)
+
+
+class Workbook:
+    """A spreadsheet opened once; sheets are parsed on first access and then served from memory."""
+
+    def __init__(self, path: str, file_type: Optional[str] = None, engine: str = 'auto',
+                 cache: Optional['SheetCache'] = None, sha256_hash: Optional[str] = None):
+        """
+        Open a spreadsheet file.
+
+        Args:
+            path: Path to an .xlsx, .xls or .csv file
+            file_type: File extension (e.g. '.xlsx'); derived from the path when omitted
+            engine: Reader engine, one of EXCEL_ENGINES:
+                calamine - values-only Rust reader (python-calamine)
+                openpyxl-stream - openpyxl read-only mode, streaming plain cell values
+                pandas - pandas' default engine (openpyxl cell objects, xlrd for .xls)
+                CSV files are read with pyarrow's multithreaded reader under 'auto' when
+                pyarrow is installed, otherwise with pandas' C parser (see resolve_engine)
+            cache: Optional SheetCache; sheets found there are served without opening the file
+            sha256_hash: Content hash of the file, required to use the cache
+
+        Raises:
+            WorkbookError: When the file cannot be opened
+        """
+        self.path = path
+        self.file_type = (file_type or os.path.splitext(path)[1]).lower()
+        self.engine = resolve_engine(self.file_type, engine)
+        self._sheets: Dict[str, pd.DataFrame] = {}
+        self._tables: Dict[str, Tuple[pd.DataFrame, TableBounds]] = {}
+        self._excel_file: Optional[pd.ExcelFile] = None
+        self._book = None  # openpyxl workbook for the openpyxl-stream engine
+        self._loaded_sheets: Dict[str, Any] = {}  # sheets kept loaded from a sniff for the read that follows
+        self._csv_format: Optional[CsvFormat] = None
+        self._opened = False
+        self._closed = False
+
+        self._cache = cache if sha256_hash else None
+        self._cache_key = cache.key(sha256_hash, engine_version(self.engine)) if self._cache else None
+
+        cached_names = self._cache.sheet_names(self._cache_key) if self._cache else None
+        if cached_names is not None:
+            # The file itself is only opened if a sheet turns out to be missing from the cache
+            self.sheet_names: List[str] = cached_names
+        else:
+            self._open()
+            if self._cache:
+                self._cache.store_sheet_names(self._cache_key, self.sheet_names)
+
+    def _open(self):
+        """Open the file and read its sheet names."""
+        try:
+            if self.engine in CSV_ENGINES:
+                # A CSV file is a workbook with a single sheet named after the file
+                self.sheet_names = [os.path.splitext(os.path.basename(self.path))[0]]
+                self._csv_format = sniff_csv_format(self.path)
+            elif self.engine == 'openpyxl-stream':
+                from openpyxl import load_workbook
+                self._book = load_workbook(self.path, read_only=True, data_only=True, keep_links=False)
+                self.sheet_names = list(self._book.sheetnames)
+            else:
+                # The archive, shared strings and styles are read once here, not once per sheet
+                self._excel_file = pd.ExcelFile(self.path, engine='calamine' if self.engine == 'calamine' else None)
+                self.sheet_names = list(self._excel_file.sheet_names)
+        except Exception as e:
+            raise WorkbookError(f"Failed to open workbook {self.path}: {str(e)}")
+        self._opened = True
+
+    def sheet(self, sheet: Union[str, int] = 0) -> pd.DataFrame:
+        """
+        Return one sheet as a DataFrame, parsing it only on first access.
+
+        Args:
+            sheet: Sheet name or zero-based position
+
+        Raises:
+            WorkbookError: When the sheet does not exist or cannot be parsed
+        """
+        name = self.sheet_names[sheet] if isinstance(sheet, int) else sheet
+        if name not in self._sheets:
+            if name not in self.sheet_names:
+                raise WorkbookError(f"Sheet '{name}' not found in {self.path}")
+
+            if self._closed:
+                raise WorkbookError(f"Workbook {self.path} is closed")
+
+            sheet_index = self.sheet_names.index(name)
+            if self._cache:
+                cached = self._cache.load(self._cache_key, sheet_index)
+                if cached is not None:
+                    self._sheets[name] = cached
+                    return cached
+
+            self._sheets[name] = self._read(name)
+
+            if self._cache:
+                self._cache.store(self._cache_key, sheet_index, self._sheets[name])
+
+        return self._sheets[name]
+
+    def sheets(self) -> Dict[str, pd.DataFrame]:
+        """Return every sheet, in workbook order."""
+        return {name: self.sheet(name) for name in self.sheet_names}
+
+    def table(self, sheet: Union[str, int] = 0) -> Tuple[pd.DataFrame, TableBounds]:
+        """
+        Return only the table of a sheet, read in two steps: a sniff of the header and first
+        SNIFF_ROWS rows locates the table (see find_table_bounds), then just its columns
+        and rows are read.
+
+        Sheets already parsed, and sheets read with the pandas engine, are read whole and cut
+        to the same bounds instead. With a sheet cache, the cached sheet or table is served
+        when there is one; otherwise the table read here is stored with its bounds.
+
+        Args:
+            sheet: Sheet name or zero-based position
+
+        Returns:
+            The table and its bounds; bounds.skipped_regions lists what was not read
+
+        Raises:
+            WorkbookError: When the sheet does not exist or cannot be parsed
+        """
+        name = self.sheet_names[sheet] if isinstance(sheet, int) else sheet
+        if name in self._tables:
+            return self._tables[name]
+        if name not in self.sheet_names:
+            raise WorkbookError(f"Sheet '{name}' not found in {self.path}")
+
+        # pandas' default engine loads the whole workbook when opening it, so there is nothing to save
+        # there: its sheets are read (and cached) whole by sheet()
+        sheet_index = self.sheet_names.index(name)
+        cached = None
+        if self._cache and name not in self._sheets and self.engine != 'pandas':
+            cached = self._cache.load_table(self._cache_key, sheet_index)
+            if cached is not None and cached[1] is None:
+                self._sheets[name] = cached[0]
+
+        if cached is not None and cached[1] is not None:
+            table = cached[0]
+            columns = cached[1]['columns']
+            bounds = TableBounds(tuple(columns) if columns is not None else None, cached[1]['rows'])
+        elif name in self._sheets or self.engine == 'pandas':
+            df = self.sheet(name)
+            bounds = find_table_bounds(df.iloc[:SNIFF_ROWS])
+            table = bounds.apply(df)
+        else:
+            if self._closed:
+                raise WorkbookError(f"Workbook {self.path} is closed")
+            if not self._opened:
+                self._open()
+            if self.engine not in CSV_ENGINES:
+                # Sniff the cell values as read, without building a DataFrame for them
+                try:
+                    data, complete = self._sheet_rows(name, SNIFF_ROWS, keep_loaded=True)
+                except Exception as e:
+                    raise WorkbookError(f"Failed to read sheet '{name}' of {self.path}: {str(e)}")
+                header = [_header_label(value) for value in data[0]] if data else []
+                bounds = _table_bounds(header, _filled_cells(data[1:], len(header)))
+                sniff = None
+            else:
+                sniff = self._read(name, nrows=SNIFF_ROWS)
+                complete = len(sniff) < SNIFF_ROWS
+                bounds = find_table_bounds(sniff)
+
+            if complete:
+                # A sheet shorter than the sniff has been read whole already
+                df = sniff if sniff is not None else self._parse_rows(name, data)
+                self._sheets.setdefault(name, df)
+                table = bounds.apply(df)
+            elif bounds.complete:
+                df = table = self._sheets[name] = self._read(name)
+            else:
+                df = None
+                table = self._read(name, usecols=bounds.columns, nrows=bounds.rows)
+            self._loaded_sheets.pop(name, None)
+
+            if self._cache and df is not None:
+                self._cache.store(self._cache_key, sheet_index, df)
+            elif self._cache:
+                self._cache.store(self._cache_key, sheet_index, table, {
+                    'columns': [int(position) for position in bounds.columns] if bounds.columns is not None else None,
+                    'rows': bounds.rows
+                })
+
+        self._tables[name] = (table, bounds)
+        return table, bounds
+
+    def close(self):
+        """Release the underlying file handle; already parsed sheets stay available."""
+        if self._excel_file is not None:
+            self._excel_file.close()
+            self._excel_file = None
+        self._loaded_sheets.clear()
+        if self._book is not None:
+            self._book.close()
+            self._book = None
+        self._closed = True
+
+    def _read(self, name: str, usecols: Optional[Sequence[int]] = None, nrows: Optional[int] = None) -> pd.DataFrame:
+        """
+        Parse a sheet with the workbook's engine.
+
+        Args:
+            name: Sheet name
+            usecols: Column positions to read; all when None
+            nrows: Data rows to read below the header; all when None
+        """
+        if not self._opened:
+            self._open()
+
+        usecols = list(usecols) if usecols is not None else None
+        try:
+            if self.engine == 'csv-arrow' and nrows is None:
+                return self._read_csv_arrow(usecols)
+            if self.engine in CSV_ENGINES:
+                return self._read_csv(usecols, nrows)
+            if self.engine in ('calamine', 'openpyxl-stream'):
+                data, _ = self._sheet_rows(name, nrows)
+                return self._parse_rows(name, data, usecols)
+            return self._excel_file.parse(sheet_name=name, usecols=usecols, nrows=nrows)
+        except WorkbookError:
+            raise
+        except Exception as e:
+            raise WorkbookError(f"Failed to read sheet '{name}' of {self.path}: {str(e)}")
+
+    def _read_csv(self, usecols: Optional[List[int]] = None, nrows: Optional[int] = None) -> pd.DataFrame:
+        """Read the CSV file with pandas' C parser, in the sniffed encoding and delimiter."""
+        csv_format = self._csv_format
+        # Bounded reads of the csv-arrow engine parse floats as exactly as pyarrow does
+        options = {'float_precision': 'round_trip'} if self.engine == 'csv-arrow' else {}
+        return pd.read_csv(self.path, sep=csv_format.delimiter, encoding=csv_format.encoding,
+                           usecols=usecols, nrows=nrows, **options)
+
+    def _read_csv_arrow(self, usecols: Optional[List[int]] = None) -> pd.DataFrame:
+        """
+        Read the whole CSV file with pyarrow's multithreaded reader, typed and labelled the way
+        pd.read_csv reads it, so the extraction code sees the same DataFrame.
+
+        Column labels are taken from pandas (blank headers become 'Unnamed: n', repeated ones get
+        a '.1' suffix), dates and times stay text, and columns without any value are float NaN.
+        Files pyarrow rejects, such as rows with fewer or more cells than the header, are read
+        with pandas' C parser instead.
+        """
+        csv_format = self._csv_format
+        header = pd.read_csv(self.path, sep=csv_format.delimiter, encoding=csv_format.encoding, nrows=0)
+        names = list(header.columns)
+        include_columns = [names[position] for position in usecols] if usecols is not None else None
+
+        read_options = pa_csv.ReadOptions(column_names=names, skip_rows=csv_format.header_row + 1,
+                                          encoding=csv_format.arrow_encoding, use_threads=True)
+        parse_options = pa_csv.ParseOptions(delimiter=csv_format.delimiter)
+
+        def convert_options(column_types: Dict[str, Any]) -> 'pa_csv.ConvertOptions':
+            return pa_csv.ConvertOptions(null_values=_NA_VALUES, strings_can_be_null=True,
+                                         include_columns=include_columns, column_types=column_types)
+
+        try:
+            table = pa_csv.read_csv(self.path, read_options, parse_options, convert_options({}))
+            temporal = {field.name: pa.string() for field in table.schema if pa.types.is_temporal(field.type)}
+            if temporal:
+                # pandas leaves dates and times as text; read those columns again without converting them
+                table = pa_csv.read_csv(self.path, read_options, parse_options, convert_options(temporal))
+        except pa.ArrowInvalid:
+            return self._read_csv(usecols)
+        if not table.num_rows:
+            return header.iloc[:, usecols] if usecols is not None else header
+
+        for position, field in enumerate(table.schema):
+            if pa.types.is_null(field.type):
+                table = table.set_column(position, field.name, table.column(position).cast(pa.float64()))
+        df = table.to_pandas()
+        for field in table.schema:
+            if pa.types.is_boolean(field.type) and table.column(field.name).null_count:
+                # pandas keeps booleans with missing values as objects holding NaN, not None
+                values = df[field.name].to_numpy(dtype=object, copy=True)
+                values[pd.isna(values)] = np.nan
+                df[field.name] = values
+        return df
+
+    def _sheet_rows(self, name: str, nrows: Optional[int] = None,
+                    keep_loaded: bool = False) -> Tuple[List[List[Any]], bool]:
+        """
+        Read a sheet's cells as plain values (no cell objects), converted and trimmed the way
+        pandas' reader for the engine does.
+
+        With keep_loaded (a sniff), the read that follows reuses what was loaded: calamine
+        parses a whole sheet when loading it, and the openpyxl stream continues where the
+        sniff stopped.
+
+        Args:
+            name: Sheet name
+            nrows: Data rows to read below the header row; all when None
+            keep_loaded: Keep the sheet loaded for a further read
+
+        Returns:
+            The rows, header row first and padded to one width, and whether they are the whole sheet
+        """
+        max_rows = nrows + 1 if nrows is not None else None  # Header row plus nrows
+
+        if self.engine == 'calamine':
+            sheet = self._loaded_sheets.pop(name, None) or self._excel_file.book.get_sheet_by_name(name)
+            if keep_loaded:
+                self._loaded_sheets[name] = sheet
+            rows = sheet.to_python(skip_empty_area=False, nrows=max_rows)
+            data = [[_convert_calamine_value(value) for value in row] for row in rows]
+            return data, max_rows is None or len(rows) < max_rows
+
+        # openpyxl streams rows; a sniff keeps the stream and the rows it converted so far
+        loaded = self._loaded_sheets.pop(name, None)
+        if loaded is None:
+            worksheet = self._book[name]
+            worksheet.reset_dimensions()  # Stored dimensions can be wrong in read-only mode
+            loaded = (worksheet.iter_rows(values_only=True), [])
+        row_iterator, converted = loaded
+        missing = max_rows - len(converted) if max_rows is not None else None
+        if missing is None or missing > 0:
+            converted.extend([_convert_value(value) for value in row] for row in islice(row_iterator, missing))
+        if keep_loaded:
+            self._loaded_sheets[name] = loaded
+        complete = max_rows is None or len(converted) < max_rows
+
+        data = []
+        last_row_with_data = -1
+        for row_number, row in enumerate(converted[:max_rows]):
+            row = row[:]
+            while row and row[-1] == "":
+                row.pop()
+            if row:
+                last_row_with_data = row_number
+            data.append(row)
+        data = data[:last_row_with_data + 1]
+
+        max_width = max((len(row) for row in data), default=0)
+        return [row + [""] * (max_width - len(row)) for row in data], complete
+
+    def _parse_rows(self, name: str, data: List[List[Any]], usecols: Optional[List[int]] = None) -> pd.DataFrame:
+        """
+        Build the DataFrame of rows from _sheet_rows with the same TextParser pandas' readers
+        use, so the result matches pd.read_excel for the same usecols/nrows.
+        """
+        if not data:
+            return pd.DataFrame()
+        if usecols and max(usecols) >= len(data[0]):
+            # Rows kept by nrows can end before a requested column that only holds values further down
+            data = [row + [""] * (max(usecols) + 1 - len(row)) for row in data]
+        try:
+            return TextParser(data, header=0, usecols=usecols, skip_blank_lines=False).read()
+        except EmptyDataError:
+            return pd.DataFrame()
+        except Exception as e:
+            raise WorkbookError(f"Failed to read sheet '{name}' of {self.path}: {str(e)}")
+
+    def __enter__(self) -> 'Workbook':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self) -> str:
+        return f"Workbook(path='{self.path}', sheets={len(self.sheet_names)}, loaded={len(self._sheets)})"
+
+
+def _is_named_header(column: Any) -> bool:
+    text = str(column).strip()
+    return bool(text) and not text.startswith('Unnamed')
+
+
+def _column_letter(position: int) -> str:
+    """Spreadsheet column letter of a zero-based position (0 → 'A', 27 → 'AB')."""
+    letters = ''
+    position += 1
+    while position:
+        position, remainder = divmod(position - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def _header_label(value: Any) -> Any:
+    """A raw header cell as a column label; empty cells are unnamed."""
+    return "" if value is None or (isinstance(value, float) and np.isnan(value)) else value
+
+
+def _filled_cells(rows: List[List[Any]], width: int) -> np.ndarray:
+    """Mask of the raw cells pandas would not read as missing (empty, NaN or a default NA string)."""
+    return np.array([[not (value is None or (isinstance(value, float) and np.isnan(value))
+                           or (isinstance(value, str) and value in STR_NA_VALUES)) for value in row]
+                     for row in rows], dtype=bool).reshape(len(rows), width)
+
+
+def _convert_calamine_value(value: Any) -> Any:
+    """Convert a python-calamine cell as pandas' calamine reader does (integral floats → int, dates → datetime)."""
+    if isinstance(value, float):
+        as_int = int(value)
+        return as_int if as_int == value else value
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def _convert_value(value: Any) -> Any:
+    """Convert a raw cell value as pandas' openpyxl reader does (empty → "", integral floats → int)."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        as_int = int(value)
+        return as_int if as_int == value else value
+    if isinstance(value, str) and value in _EXCEL_ERRORS:
+        return np.nan
+    return value
+
+
+class WorkbookError(Exception):
+    """Exception raised when a workbook or one of its sheets cannot be read."""
+    pass
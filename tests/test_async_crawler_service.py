@@ -0,0 +1,240 @@
+import asyncio
+import hashlib
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from src.models.crawl_state import CrawlState
+from src.models.fetched_page import FetchedPage
+from src.models.post import Post
+from src.services.async_crawler_service import AsyncCrawlerService, HostScheduler
+from src.services.crawler_service import CrawlerService
+
+
+LISTING_HTML = """
+<html><body>
+<a href="/video/1">Post 1</a>
+<a href="/video/2">Post 2</a>
+<a href="/video/3">Post 3</a>
+<a href="/videos/material_test">Listing</a>
+</body></html>
+"""
+
+
+def post_html(title):
+    return f"<html><body><h1>MyTechFun.com</h1><h1>{title}</h1><p>{title} body</p></body></html>"
+
+
+class TestHostScheduler:
+    """Tests for the per-host politeness scheduler."""
+
+    def test_spaces_request_starts_by_min_interval(self):
+        """Request starts on the same host are at least min_interval apart."""
+        scheduler = HostScheduler(concurrency=3, min_interval=0.05)
+        starts = []
+
+        async def request():
+            async with scheduler.slot("https://www.mytechfun.com/video/1"):
+                starts.append(time.monotonic())
+
+        async def run():
+            await asyncio.gather(*(request() for _ in range(4)))
+
+        asyncio.run(run())
+
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    def test_limits_in_flight_requests_per_host(self):
+        """No more than `concurrency` requests run at once on a host."""
+        scheduler = HostScheduler(concurrency=2, min_interval=0.0)
+        in_flight = 0
+        peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            async with scheduler.slot("https://www.mytechfun.com/video/1"):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        async def run():
+            await asyncio.gather(*(request() for _ in range(6)))
+
+        asyncio.run(run())
+        assert peak == 2
+
+    def test_hosts_are_scheduled_independently(self):
+        """A slow host does not delay requests to another host."""
+        scheduler = HostScheduler(concurrency=1, min_interval=0.5)
+
+        async def run():
+            async with scheduler.slot("https://a.example.com/x"):
+                pass
+            start = time.monotonic()
+            async with scheduler.slot("https://b.example.com/x"):
+                pass
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) < 0.1
+
+
+class TestAsyncCrawlerService:
+    """Tests for the async crawl engine."""
+
+    def setup_method(self):
+        self.crawler_service = AsyncCrawlerService(concurrency=3)
+        self.crawler_service.scheduler.min_interval = 0.0
+        self.base_url = "https://www.mytechfun.com/videos/material_test"
+
+    def _fake_fetch(self, pages):
+        async def fetch(session, url, stage="post"):
+            return pages[url]
+        return fetch
+
+    def test_crawl_posts_returns_posts_in_listing_order(self):
+        """The sync wrapper returns the same Post list the sequential engine would."""
+        pages = {
+            self.base_url: LISTING_HTML,
+            "https://www.mytechfun.com/video/1": post_html("First"),
+            "https://www.mytechfun.com/video/2": post_html("Second"),
+            "https://www.mytechfun.com/video/3": post_html("Third"),
+        }
+
+        with patch.object(self.crawler_service, '_check_robots_txt', return_value=True), \
+                patch.object(self.crawler_service, '_fetch', side_effect=self._fake_fetch(pages)):
+            posts = self.crawler_service.crawl_posts(self.base_url)
+
+        assert [post.title for post in posts] == ["First", "Second", "Third"]
+        assert [post.url for post in posts] == [
+            "https://www.mytechfun.com/video/1",
+            "https://www.mytechfun.com/video/2",
+            "https://www.mytechfun.com/video/3",
+        ]
+
+    def test_failed_post_is_skipped(self):
+        """A post that fails to fetch is logged and left out of the results."""
+        pages = {
+            self.base_url: LISTING_HTML,
+            "https://www.mytechfun.com/video/1": post_html("First"),
+            "https://www.mytechfun.com/video/3": post_html("Third"),
+        }
+
+        with patch.object(self.crawler_service, '_check_robots_txt', return_value=True), \
+                patch.object(self.crawler_service, '_fetch', side_effect=self._fake_fetch(pages)):
+            posts = self.crawler_service.crawl_posts(self.base_url)
+
+        assert [post.title for post in posts] == ["First", "Third"]
+
+    def test_respects_robots_txt(self):
+        """Crawling is refused when robots.txt disallows the base URL."""
+        with patch.object(self.crawler_service, '_check_robots_txt', return_value=False):
+            with pytest.raises(Exception) as exc_info:
+                self.crawler_service.crawl_posts(self.base_url)
+
+            assert "robots.txt" in str(exc_info.value).lower()
+
+    def test_iter_posts_streams_all_posts(self):
+        """iter_posts yields every post while the async crawl runs in the background."""
+        pages = {
+            self.base_url: LISTING_HTML,
+            "https://www.mytechfun.com/video/1": post_html("First"),
+            "https://www.mytechfun.com/video/2": post_html("Second"),
+            "https://www.mytechfun.com/video/3": post_html("Third"),
+        }
+
+        with patch.object(self.crawler_service, '_check_robots_txt', return_value=True), \
+                patch.object(self.crawler_service, '_fetch', side_effect=self._fake_fetch(pages)):
+            titles = {post.title for post in self.crawler_service.iter_posts(self.base_url)}
+
+        assert titles == {"First", "Second", "Third"}
+
+    def test_crawl_posts_can_run_twice_with_contended_slots(self):
+        """A second crawl on the same service gets slots bound to its own event loop."""
+        crawler_service = AsyncCrawlerService(concurrency=1)
+        crawler_service.scheduler.min_interval = 0.0
+        pages = {
+            self.base_url: LISTING_HTML,
+            "https://www.mytechfun.com/video/1": post_html("First"),
+            "https://www.mytechfun.com/video/2": post_html("Second"),
+            "https://www.mytechfun.com/video/3": post_html("Third"),
+        }
+
+        async def fetch(session, url, stage="post"):
+            async with crawler_service.scheduler.slot(url):
+                await asyncio.sleep(0.01)
+                return pages[url]
+
+        with patch.object(crawler_service, '_check_robots_txt', return_value=True), \
+                patch.object(crawler_service, '_fetch', side_effect=fetch):
+            first = crawler_service.crawl_posts(self.base_url)
+            second = crawler_service.crawl_posts(self.base_url)
+
+        assert [post.title for post in first] == ["First", "Second", "Third"]
+        assert [post.title for post in second] == ["First", "Second", "Third"]
+
+    def test_iter_posts_is_bounded_and_stops_when_closed(self):
+        """A slow consumer holds the crawl back, and closing the iterator stops further requests."""
+        crawler_service = AsyncCrawlerService(concurrency=1)
+        crawler_service.scheduler.min_interval = 0.0
+        urls = [f"https://www.mytechfun.com/video/{i}" for i in range(1, 11)]
+        listing = "".join(f'<a href="/video/{i}">Post {i}</a>' for i in range(1, 11))
+        pages = {self.base_url: listing, **{url: post_html(f"Post {i}") for i, url in enumerate(urls, 1)}}
+        fetched = []
+
+        async def fetch(session, url, stage="post"):
+            fetched.append(url)
+            return pages[url]
+
+        with patch.object(crawler_service, '_check_robots_txt', return_value=True), \
+                patch.object(crawler_service, '_fetch', side_effect=fetch):
+            posts = crawler_service.iter_posts(self.base_url)
+            next(posts)
+            time.sleep(0.3)
+            # The listing, the post consumed, one in the queue and one waiting for room
+            assert len(fetched) <= 4
+            posts.close()
+            time.sleep(0.3)
+            stopped_at = len(fetched)
+            time.sleep(0.3)
+
+        assert len(fetched) == stopped_at < 1 + len(urls)
+        assert not any(thread.name == "async-crawl" for thread in threading.enumerate())
+
+    def test_both_engines_record_duplicates_in_the_crawl_state(self):
+        """Both engines record every fetched post, duplicates included, so the next plan skips them."""
+        pages = {
+            self.base_url: LISTING_HTML,
+            "https://www.mytechfun.com/video/1": post_html("First"),
+            "https://www.mytechfun.com/video/2": post_html("First"),
+            "https://www.mytechfun.com/video/3": post_html("Third"),
+        }
+        sequential = CrawlerService(state=CrawlState())
+        sequential.rate_limit_delay = 0
+        concurrent = AsyncCrawlerService(concurrency=3, state=CrawlState())
+
+        def build_post(url, html):
+            # Hash the content only, so the two "First" pages are duplicates
+            post = Post.from_page(FetchedPage(url=url, html=html))
+            post.post_hash = hashlib.sha256(post.cleaned_text.encode('utf-8')).hexdigest()
+            return post
+
+        with patch.object(sequential, '_check_robots_txt', return_value=True), \
+                patch.object(sequential, '_build_post', side_effect=build_post), \
+                patch.object(sequential, '_fetch_text', side_effect=lambda url, stage="post": pages[url]):
+            sequential_titles = [post.title for post in sequential.crawl_posts(self.base_url)]
+        with patch.object(concurrent, '_check_robots_txt', return_value=True), \
+                patch.object(concurrent, '_build_post', side_effect=build_post), \
+                patch.object(concurrent, '_fetch', side_effect=self._fake_fetch(pages)):
+            concurrent_titles = [post.title for post in concurrent.crawl_posts(self.base_url)]
+
+        def recorded(state):
+            return {post_id: (entry['url'], entry['post_hash']) for post_id, entry in state.posts.items()}
+
+        assert sequential_titles == concurrent_titles == ["First", "Third"]
+        assert sorted(recorded(sequential.state)) == ["1", "2", "3"]
+        assert recorded(sequential.state) == recorded(concurrent.state)
+        assert sequential.state.high_watermark == concurrent.state.high_watermark
+        assert sequential.state.plan(list(pages)[1:]) == []
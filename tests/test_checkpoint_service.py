@@ -0,0 +1,82 @@
+import tempfile
+import os
+from unittest.mock import Mock, patch
+from src.services.checkpoint_service import CheckpointService
+from src.services.crawler_service import CrawlerService
+from src.services.parser_service import ParserService
+from src.models.post import Post
+from src.models.valid_file import ValidFile
+
+
+class TestCheckpointService:
+    """Tests for checkpointing and resuming discovery runs."""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.checkpoint = CheckpointService(os.path.join(self.temp_dir, "checkpoint.sqlite"))
+        self.base_url = "https://www.mytechfun.com/videos/material_test"
+        self.post = Post(
+            url="https://www.mytechfun.com/video/1",
+            title="PLA Test",
+            cleaned_text="Tensile strength test",
+            youtube_link=None,
+            manufacturer_links=[],
+            download_timestamp="2025-10-03T14:46:00Z"
+        )
+        self.file = ValidFile(
+            url="https://www.mytechfun.com/files/pla_test.xlsx",
+            filename="pla_test.xlsx",
+            file_type=".xlsx",
+            sha256_hash="a" * 64,
+            file_path=os.path.join(self.temp_dir, "pla_test.xlsx"),
+            file_size=100,
+            download_timestamp="2025-10-03T14:46:00Z",
+            source_post_url=self.post.url
+        )
+
+    def test_round_trip_of_frontier_posts_and_files(self):
+        """Test that checkpointed work is read back unchanged."""
+        self.checkpoint.save_frontier([self.post.url, "https://www.mytechfun.com/video/2"])
+        self.checkpoint.record_post(self.post)
+        assert self.checkpoint.files_for(self.post.url) is None
+
+        self.checkpoint.record_files(self.post.url, [self.file])
+
+        assert self.checkpoint.load_frontier() == [self.post.url, "https://www.mytechfun.com/video/2"]
+        assert self.checkpoint.completed_posts()[self.post.url].post_hash == self.post.post_hash
+        assert [f.__dict__ for f in self.checkpoint.files_for(self.post.url)] == [self.file.__dict__]
+        assert self.checkpoint.progress() == {'frontier': 2, 'posts_completed': 1, 'files_completed': 1}
+
+        self.checkpoint.clear()
+        assert self.checkpoint.progress() == {'frontier': 0, 'posts_completed': 0, 'files_completed': 0}
+
+    def test_resumed_crawl_skips_listing_and_completed_posts(self):
+        """Test that a resumed crawl only fetches the posts the interrupted run did not finish."""
+        self.checkpoint.save_frontier([self.post.url, "https://www.mytechfun.com/video/2"])
+        self.checkpoint.record_post(self.post)
+
+        crawler = CrawlerService(checkpoint=self.checkpoint)
+        crawler.rate_limit_delay = 0
+        page = Mock(text='<h1>MyTechFun.com</h1><h1>Post 2</h1><p>body</p>')
+
+        with patch.object(crawler, '_check_robots_txt', return_value=True):
+            with patch.object(crawler.session, 'get', return_value=page) as mock_get:
+                posts = crawler.crawl_posts(self.base_url)
+
+        mock_get.assert_called_once_with("https://www.mytechfun.com/video/2", timeout=30, headers=None)
+        assert [post.url for post in posts] == [self.post.url, "https://www.mytechfun.com/video/2"]
+        assert crawler.request_counts['listing'] == 0
+        assert self.checkpoint.progress()['posts_completed'] == 2
+
+    def test_parser_restores_checkpointed_files_without_requests(self):
+        """Test that downloads finished before an interruption are not repeated."""
+        self.checkpoint.record_post(self.post)
+        self.checkpoint.record_files(self.post.url, [self.file])
+
+        parser = ParserService(checkpoint=self.checkpoint)
+        with patch.object(parser.session, 'get') as mock_get:
+            files = parser.extract_files(self.post)
+
+        mock_get.assert_not_called()
+        assert [f.__dict__ for f in files] == [self.file.__dict__]
+        assert parser.downloads_skipped == 1
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import Mock, patch
 from src.services.crawler_service import CrawlerService
 from src.models.post import Post
+from src.models.crawl_state import CrawlState
 
 
 class TestCrawlerService:
@@ -87,3 +88,52 @@ class TestCrawlerService:
             # Verify structured logging is used
             assert mock_logger.called
             mock_logger.return_value.info.assert_called()
+
+    def test_max_posts_limits_post_requests(self):
+        """Test that max_posts stops the crawler from fetching more post pages than needed."""
+        listing = Mock(text='<a href="/video/1">1</a><a href="/video/2">2</a><a href="/video/3">3</a>')
+        page = Mock(text='<h1>MyTechFun.com</h1><h1>Post</h1><p>body</p>')
+        self.crawler_service.rate_limit_delay = 0
+
+        with patch.object(self.crawler_service, '_check_robots_txt', return_value=True):
+            with patch.object(self.crawler_service.session, 'get', side_effect=[listing, page, page]):
+                posts = self.crawler_service.crawl_posts(self.base_url, max_posts=2)
+
+        assert len(posts) <= 2
+        assert self.crawler_service.request_counts['listing'] == 1
+        assert self.crawler_service.request_counts['post'] == 2
+
+    def test_incremental_crawl_fetches_new_ids_and_revisit_sample(self):
+        """Test that incremental mode fetches unseen post ids plus the least recently crawled ones."""
+        state = CrawlState()
+        state.posts = {
+            '1': {'url': 'https://www.mytechfun.com/video/1', 'post_hash': 'a', 'last_crawled': '2024-01-02T00:00:00Z'},
+            '2': {'url': 'https://www.mytechfun.com/video/2', 'post_hash': 'b', 'last_crawled': '2024-01-01T00:00:00Z'}
+        }
+        crawler = CrawlerService(state=state, revisit=1)
+        crawler.rate_limit_delay = 0
+        listing = Mock(text='<a href="/video/3">3</a><a href="/video/2">2</a><a href="/video/1">1</a>')
+        page = Mock(text='<h1>MyTechFun.com</h1><h1>Post</h1><p>body</p>')
+
+        with patch.object(crawler, '_check_robots_txt', return_value=True):
+            with patch.object(crawler.session, 'get', side_effect=[listing, page, page]) as mock_get:
+                crawler.crawl_posts(self.base_url)
+
+        fetched = [call.args[0] for call in mock_get.call_args_list[1:]]
+        assert fetched == ['https://www.mytechfun.com/video/3', 'https://www.mytechfun.com/video/2']
+        assert state.high_watermark == 3
+        assert state.posts['2']['last_crawled'] > '2024-01-02'
+
+    def test_crawl_state_round_trip(self, tmp_path):
+        """Test that crawl state survives a save/load cycle."""
+        state = CrawlState()
+        assert state.record('https://www.mytechfun.com/video/42', 'hash42') is True
+        assert state.record('https://www.mytechfun.com/video/42', 'hash42') is False
+
+        path = str(tmp_path / 'state' / 'crawl_state.json')
+        state.save(path)
+        loaded = CrawlState.load(path)
+
+        assert loaded.high_watermark == 42
+        assert loaded.posts['42']['post_hash'] == 'hash42'
+        assert CrawlState.load(str(tmp_path / 'missing.json')).posts == {}
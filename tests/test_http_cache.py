@@ -0,0 +1,118 @@
+import os
+import tempfile
+from unittest.mock import Mock
+from src.services.http_cache import HttpCache
+from src.services.crawler_service import CrawlerService
+from src.services.parser_service import ParserService
+from src.models.valid_file import ValidFile
+
+
+def _response(status_code=200, text="", headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = headers or {}
+    return response
+
+
+class TestHttpCache:
+    """Tests for conditional revalidation through HttpCache."""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = HttpCache(cache_dir=self.temp_dir)
+        self.url = "https://www.mytechfun.com/video/123/pla-test"
+
+    def test_first_fetch_is_a_miss_and_stores_validators(self):
+        """Test that a fresh response is returned, counted as a miss and its validators stored."""
+        fetch = Mock(return_value=_response(200, "<html>v1</html>", {'ETag': '"abc"'}))
+
+        assert self.cache.fetch_text(self.url, fetch) == "<html>v1</html>"
+
+        fetch.assert_called_once_with({})
+        assert self.cache.stats['misses'] == 1
+        assert self.cache.conditional_headers(self.url) == {'If-None-Match': '"abc"'}
+
+    def test_not_modified_is_served_from_cache(self):
+        """Test that a 304 answer returns the cached body and counts a hit."""
+        self.cache.store(self.url, {'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'},
+                         "<html>v1</html>")
+        fetch = Mock(return_value=_response(304))
+
+        assert self.cache.fetch_text(self.url, fetch) == "<html>v1</html>"
+
+        fetch.assert_called_once_with({
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        })
+        assert self.cache.stats['hits'] == 1
+        assert self.cache.stats['bytes_saved'] == len("<html>v1</html>")
+
+    def test_responses_without_validators_are_not_cached(self):
+        """Test that responses lacking ETag and Last-Modified are never revalidated."""
+        self.cache.store(self.url, {}, "<html>v1</html>")
+
+        assert self.cache.get_text(self.url) is None
+        assert self.cache.conditional_headers(self.url) == {}
+
+    def test_crawler_revalidates_pages_through_cache(self):
+        """Test that the crawler sends conditional headers once a page is cached."""
+        crawler = CrawlerService(cache=self.cache)
+        crawler.session.get = Mock(return_value=_response(200, "<html>v1</html>", {'ETag': '"abc"'}))
+        crawler._fetch_text(self.url)
+
+        crawler.session.get = Mock(return_value=_response(304))
+        assert crawler._fetch_text(self.url) == "<html>v1</html>"
+
+        crawler.session.get.assert_called_once_with(self.url, timeout=30, headers={'If-None-Match': '"abc"'})
+        assert crawler.request_counts['post'] == 2
+        assert self.cache.stats == {'hits': 1, 'misses': 1, 'bytes_saved': len("<html>v1</html>")}
+
+    def test_parser_reuses_download_on_not_modified(self):
+        """Test that an indexed download is revalidated and reused on 304 instead of re-transferred."""
+        raw_dir = tempfile.mkdtemp()
+        file_url = "https://www.mytechfun.com/files/pla_test.xlsx"
+        file_path = os.path.join(raw_dir, "pla_test.xlsx")
+        with open(file_path, 'wb') as f:
+            f.write(b"x" * 100)
+        existing = ValidFile(url=file_url, filename="pla_test.xlsx", file_type=".xlsx",
+                             sha256_hash="a" * 64, file_path=file_path, file_size=100,
+                             source_post_url=self.url, download_timestamp="2024-01-01T00:00:00Z")
+        self.cache.store(file_url, {'ETag': '"file-v1"'})
+
+        parser = ParserService(cache=self.cache)
+        parser.raw_dir = raw_dir
+        parser.rate_limit_delay = 0
+        parser.session.get = Mock(return_value=_response(304))
+
+        result = parser._download_file(file_url, self.url, existing)
+
+        assert result is existing
+        parser.session.get.assert_called_once_with(file_url, timeout=60, stream=True,
+                                                   headers={'If-None-Match': '"file-v1"'})
+        assert self.cache.stats['hits'] == 1
+        assert self.cache.stats['bytes_saved'] == 100
+
+    def test_parser_skips_indexed_download_without_validators(self):
+        """Test that an indexed download whose server sent no ETag/Last-Modified is not fetched again."""
+        raw_dir = tempfile.mkdtemp()
+        file_url = "https://www.mytechfun.com/files/pla_test.xlsx"
+        file_path = os.path.join(raw_dir, "pla_test.xlsx")
+        with open(file_path, 'wb') as f:
+            f.write(b"x" * 100)
+
+        parser = ParserService(cache=self.cache)
+        parser.raw_dir = raw_dir
+        parser.rate_limit_delay = 0
+        parser._record_download(ValidFile(url=file_url, filename="pla_test.xlsx", file_type=".xlsx",
+                                          sha256_hash="a" * 64, file_path=file_path, file_size=100,
+                                          source_post_url=self.url, download_timestamp="2024-01-01T00:00:00Z"))
+        self.cache.store(file_url, {})
+        parser.session.get = Mock()
+        parser._find_download_links = Mock(return_value=[file_url])
+
+        files = parser.extract_files(Mock(url=self.url, page=None))
+
+        assert [f.file_path for f in files] == [file_path]
+        parser.session.get.assert_not_called()
+        assert parser.downloads_skipped == 1
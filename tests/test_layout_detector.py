@@ -0,0 +1,124 @@
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from unittest.mock import Mock, patch
+
+from src.models.valid_file import ValidFile
+from src.services.layout_detector import LayoutDetector, SheetFingerprint, classify_layout
+from src.services.normalizer_service import NormalizerService
+from src.services.sheet_cache import SheetCache
+from src.services.workbook_loader import TableBounds
+
+
+def _horizontal():
+    return pd.DataFrame({
+        "Material": ["PLA", "PETG", "ASA"],
+        "Tensile strength": ["50 MPa", "48 MPa", "45 MPa"],
+        "Density": [1.24, 1.27, 1.07]
+    })
+
+
+def _vertical():
+    return pd.DataFrame({
+        "Unnamed: 0": ["Tensile strength", "Elongation at break", "Density", "Tg"],
+        "Unnamed: 1": ["50 MPa", "6 %", "1.24 g/cm³", "60 °C"]
+    })
+
+
+def _matrix():
+    rows = [[np.nan] * 6 for _ in range(12)]
+    rows[0][1] = "eSun ABS+, ePC test, MyTechFun"
+    rows[2][1] = "Tensile test, break load (kg)"
+    rows[3][2:5] = ["Test 1", "Test 2", "Average"]
+    rows[4][1:5] = ["ABS+", 82.8, 79.8, 81.3]
+    rows[5][1:5] = ["ePC", 118.6, 119.8, 119.2]
+    return pd.DataFrame(rows, columns=[f"Unnamed: {i}" for i in range(6)])
+
+
+def _time_series():
+    time = np.arange(500) * 0.01
+    return pd.DataFrame({"Time (s)": time, "Force (N)": np.sin(time) * 100, "Displacement (mm)": time * 2})
+
+
+class TestLayoutDetector:
+    """Tests for sheet layout classification."""
+
+    def test_labels_each_layout(self):
+        """Test that each layout is recognized from the header and first rows."""
+        detector = LayoutDetector()
+
+        assert detector.detect(_horizontal()).layout == "horizontal"
+        assert detector.detect(_vertical()).layout == "vertical"
+        assert detector.detect(_matrix()).layout == "matrix"
+        assert detector.detect(_time_series()).layout == "time_series"
+        assert detector.detect(pd.DataFrame()).layout == "empty"
+        assert detector.detect(_vertical()).parser == "property_value_parser"
+
+    def test_fingerprint_only_reads_the_first_rows(self):
+        """Test that rows past the sample (beyond the row-count bucket) do not change the fingerprint."""
+        df = _time_series()
+        changed = df.copy()
+        changed.iloc[100:, 0] = 0.0
+
+        assert SheetFingerprint.of(changed) == SheetFingerprint.of(df)
+        assert SheetFingerprint.of(df.iloc[:100]).key != SheetFingerprint.of(df).key
+
+    def test_known_fingerprints_skip_classification(self):
+        """Test that decisions are reused per fingerprint, including ones preloaded from discovery."""
+        detector = LayoutDetector()
+        first = detector.detect(_matrix())
+        detector.detect(_matrix())
+        assert detector.stats == {"misses": 1, "hits": 1}
+
+        preloaded = LayoutDetector(decisions=detector.decisions)
+        with patch("src.services.layout_detector.classify_layout", wraps=classify_layout) as mock_classify:
+            assert preloaded.detect(_matrix()) == first
+        assert mock_classify.call_count == 0
+        assert preloaded.stats == {"hits": 1}
+
+    def test_vertical_sheet_is_dispatched_to_the_property_value_parser(self):
+        """Test that a vertical sheet yields one material with a property per row."""
+        service = NormalizerService()
+        workbook = Mock(sheet_names=["Sheet1"], table=Mock(return_value=(_vertical(), TableBounds())))
+
+        df, layout = service._find_material_sheet(workbook)
+        materials = service._parsers[layout.parser](df, Mock(filename="pla-results.xlsx", sha256_hash="h"))
+
+        assert len(materials) == 1
+        assert materials[0].material_name == "PLA Material"
+        assert materials[0].normalized_values["tensile_strength"]["value"] == 50e6
+        assert materials[0].normalized_values["density"]["unit"] == "kg/m³"
+        assert materials[0].normalized_values["glass_transition_temperature"]["value"] == 333.15
+
+    def test_time_series_sheet_is_dispatched_to_the_series_parser(self):
+        """Test that a time_series sheet yields one material whose channels are kept whole as series."""
+        service = NormalizerService(extract_series=False)
+        workbook = Mock(sheet_names=["Sheet1"], table=Mock(return_value=(_time_series(), TableBounds())))
+
+        df, layout = service._find_material_sheet(workbook)
+        materials = service._parsers[layout.parser](df, Mock(filename="petg-tensile.csv", sha256_hash="h"))
+
+        assert layout.parser == "series_parser"
+        assert len(materials) == 1
+        assert materials[0].material_name == "PETG Material"
+        displacement = service.property_classifier.classify("Displacement (mm)")
+        assert len(materials[0].series[displacement]["values"]) == 500
+        assert materials[0].normalized_values[displacement]["value"] == df["Displacement (mm)"].max()
+        assert materials[0].normalized_values[displacement]["count"] == 500
+
+    def test_discovery_and_normalization_parse_each_file_once(self):
+        """Test that sheets read for layout detection are served from the sheet cache afterwards."""
+        temp_dir = tempfile.mkdtemp()
+        path = os.path.join(temp_dir, "pla-results.csv")
+        _horizontal().to_csv(path, index=False)
+        file = ValidFile(url="https://example.com/pla-results.csv", filename="pla-results.csv", file_type=".csv",
+                         sha256_hash="b" * 64, file_path=path, file_size=os.path.getsize(path),
+                         source_post_url="https://example.com/post", download_timestamp="2024-01-01T00:00:00Z")
+        sheet_cache = SheetCache(os.path.join(temp_dir, "cache"))
+
+        assert LayoutDetector().detect_file(file, "auto", sheet_cache)[0]["layout"] == "horizontal"
+        with patch("src.services.workbook_loader.Workbook._read", side_effect=AssertionError("parsed again")):
+            materials = NormalizerService(sheet_cache=sheet_cache).process_materials([file])
+
+        assert [material.material_name for material in materials] == ["PLA", "PETG", "ASA"]
@@ -158,3 +158,491 @@ class TestNormalizerService:
                 for file in [xlsx_file, xls_file, csv_file]:
                     materials = self.normalizer_service.process_materials([file])
                     assert isinstance(materials, list)
+
+
+class TestParallelNormalization:
+    """Tests for process-pool normalization in NormalizerService."""
+
+    def _write_file(self, tmp_path, name, content):
+        path = tmp_path / name
+        path.write_text(content)
+        return ValidFile(
+            filename=name,
+            file_type="." + name.rsplit(".", 1)[1],
+            sha256_hash=name,
+            file_path=str(path),
+            download_timestamp="2025-10-03T10:00:00Z",
+            source_post_url="https://test.com/post",
+            file_size=len(content),
+            url=f"https://test.com/files/{name}"
+        )
+
+    def test_workers_keep_input_order_and_raw_fallbacks(self, tmp_path):
+        """Test that pooled results match serial results, in input order, with failures as RAW entries."""
+        files = [
+            self._write_file(tmp_path, "pla.csv", "Material,Tensile Strength\nPLA basic,50 MPa\n"),
+            self._write_file(tmp_path, "broken.xlsx", "not a workbook"),
+            self._write_file(tmp_path, "petg.csv", "Material,Density\nPETG clear,1.27 g/cm³\n")
+        ]
+
+        serial = NormalizerService().process_materials(files)
+        service = NormalizerService(workers=2)
+        try:
+            pooled = service.process_materials(files)
+            # Workers are never forked from the (possibly multi-threaded) parent
+            assert service._executor._mp_context.get_start_method() in ("forkserver", "spawn")
+        finally:
+            service.close()
+
+        assert [m.material_name for m in pooled] == [m.material_name for m in serial]
+        assert [m.source_file_hash for m in pooled] == ["pla.csv", "broken.xlsx", "petg.csv"]
+        assert pooled[1].quality_rating.value == "RAW"
+        assert "error" in pooled[1].properties
+        assert pooled[0].normalized_values == serial[0].normalized_values
+
+
+class TestWorkbookLoading:
+    """Tests for opening each workbook once in NormalizerService."""
+
+    def test_workbook_is_opened_once_and_sheets_are_cached(self, tmp_path):
+        """Test that all sheets come from one ExcelFile handle and are parsed at most once."""
+        from src.services.workbook_loader import Workbook
+
+        path = tmp_path / "pla_results.xlsx"
+        with pd.ExcelWriter(path) as writer:
+            pd.DataFrame({"Material": ["PLA"], "Tensile": ["50 MPa"]}).to_excel(writer, sheet_name="Results", index=False)
+            pd.DataFrame({"Notes": ["printed at 210 °C"]}).to_excel(writer, sheet_name="Notes", index=False)
+
+        with patch("pandas.ExcelFile", wraps=pd.ExcelFile) as mock_excel_file:
+            with Workbook(str(path), engine="pandas") as workbook:
+                first = workbook.sheet("Results")
+                again = workbook.sheet(0)
+                sheets = workbook.sheets()
+
+        assert mock_excel_file.call_count == 1
+        assert first is again
+        assert list(sheets) == ["Results", "Notes"]
+        assert sheets["Notes"].iloc[0, 0] == "printed at 210 °C"
+
+
+class TestReaderEngines:
+    """Tests for the selectable spreadsheet reader engines."""
+
+    def test_engines_return_identical_frames(self, tmp_path):
+        """Test that streaming and calamine reads match the pandas engine cell for cell."""
+        from openpyxl import Workbook as OpenpyxlWorkbook
+        from src.services.workbook_loader import CALAMINE_AVAILABLE, Workbook
+
+        path = tmp_path / "mixed.xlsx"
+        book = OpenpyxlWorkbook()
+        sheet = book.active
+        sheet.title = "Results"
+        sheet.append(["Material", "Tensile (MPa)", "Samples", None, "Notes"])
+        sheet.append(["PLA", 50.5, 5.0, None, "ok"])
+        sheet.append([None, None, None, None, None])
+        sheet.append(["PETG", "#DIV/0!", 3, None, None])
+        book.create_sheet("Empty")
+        book.save(path)
+
+        engines = ["openpyxl-stream"] + (["calamine"] if CALAMINE_AVAILABLE else [])
+        with Workbook(str(path), engine="pandas") as workbook:
+            reference = workbook.sheets()
+        for engine in engines:
+            with Workbook(str(path), engine=engine) as workbook:
+                for name, df in workbook.sheets().items():
+                    pd.testing.assert_frame_equal(df, reference[name], obj=f"{engine} [{name}]")
+
+    def test_engine_resolution(self):
+        """Test auto-selection by file type and rejection of unknown engines."""
+        from src.services.workbook_loader import ARROW_CSV_AVAILABLE, CALAMINE_AVAILABLE, resolve_engine
+
+        assert resolve_engine(".csv", "calamine") == "csv"
+        assert resolve_engine(".csv", "auto") == ("csv-arrow" if ARROW_CSV_AVAILABLE else "csv")
+        assert resolve_engine(".xls", "openpyxl-stream") == "pandas"
+        assert resolve_engine(".xlsx", "auto") == ("calamine" if CALAMINE_AVAILABLE else "openpyxl-stream")
+        with pytest.raises(ValueError):
+            NormalizerService(reader_engine="fastest")
+
+
+class TestCsvReader:
+    """Tests for CSV format sniffing and the Arrow-backed CSV reader."""
+
+    def test_sniffs_encoding_and_delimiter(self, tmp_path):
+        """Test that semicolon, tab and BOM-marked files are detected, and read into the same frame."""
+        from src.services.workbook_loader import CsvFormat, Workbook, sniff_csv_format
+
+        rows = [["Material", "Tg"], ["PLA", "60 °C"], ["ASA", "100 °C"]]
+        expected = pd.DataFrame({"Material": ["PLA", "ASA"], "Tg": ["60 °C", "100 °C"]})
+        for name, delimiter, encoding in (("semicolon.csv", ";", "cp1252"), ("tab.csv", "\t", "utf-16"),
+                                          ("bom.csv", ",", "utf-8-sig"), ("plain.csv", ",", "utf-8")):
+            path = tmp_path / name
+            path.write_text("\n".join(delimiter.join(row) for row in rows) + "\n", encoding=encoding)
+
+            assert sniff_csv_format(str(path)) == CsvFormat(encoding, delimiter)
+            for engine in ("auto", "pandas"):
+                with Workbook(str(path), engine=engine) as workbook:
+                    pd.testing.assert_frame_equal(workbook.sheet(0), expected, check_dtype=False, obj=name)
+
+    def test_arrow_reader_matches_read_csv(self, tmp_path):
+        """Test that the Arrow reader labels and types columns as read_csv does."""
+        from src.services.workbook_loader import ARROW_CSV_AVAILABLE, Workbook
+
+        if not ARROW_CSV_AVAILABLE:
+            pytest.skip("pyarrow is not installed")
+        files = {
+            "labels.csv": "\n\nMaterial,,Tensile,Tensile,Notes\nPLA,1,50 MPa,50.5,NA\n\nPETG,,48,x,\n",
+            "types.csv": "Count,Date,Time,Flag,Force (N)\n1,2022-11-30,12:30:00,true,0.1\n,2022-12-01 10:00,,,1e3\n",
+            "ragged.csv": "A,B,C\n1,2\n3,4,5\n",
+            "header_only.csv": "A,B\n",
+        }
+        for name, content in files.items():
+            path = tmp_path / name
+            path.write_text(content)
+
+            with Workbook(str(path)) as workbook:
+                assert workbook.engine == "csv-arrow"
+                df = workbook.sheet(0)
+            pd.testing.assert_frame_equal(df, pd.read_csv(path, float_precision="round_trip"), obj=name)
+
+
+class TestTableReads:
+    """Tests for sniffing a sheet's table and reading only its range."""
+
+    @pytest.fixture
+    def results_with_raw_data(self, tmp_path):
+        """A 3-material results table in A1:C4, notes below it and a long raw data block in E:F."""
+        from openpyxl import Workbook as OpenpyxlWorkbook
+
+        path = tmp_path / "results.xlsx"
+        book = OpenpyxlWorkbook()
+        sheet = book.active
+        sheet.title = "Results"
+        for row in (["Material", "Tensile (MPa)", "Density"], ["PLA", 50.5, "1.24 g/cm³"],
+                    ["PETG", 48.0, "1.27 g/cm³"], ["ASA", 45.2, "1.07 g/cm³"]):
+            sheet.append(row)
+        sheet["A7"] = "Printed on Ender-3"
+        sheet["E1"], sheet["F1"] = "Time (s)", "Force (N)"
+        for row in range(2, 302):
+            sheet.cell(row=row, column=5, value=row * 0.1)
+            sheet.cell(row=row, column=6, value=row * 1.5)
+        sheet2 = book.create_sheet("Raw")
+        sheet2["B2"] = "Creep test"
+        for row in range(4, 40):
+            sheet2.cell(row=row, column=2, value=row)
+        book.save(path)
+        return str(path)
+
+    def test_only_the_table_is_read(self, results_with_raw_data):
+        """Test that every engine reads just the table and reports the regions it skipped."""
+        from src.services.workbook_loader import CALAMINE_AVAILABLE, Workbook
+
+        with Workbook(results_with_raw_data, engine="pandas") as workbook:
+            reference = workbook.sheet("Results")
+
+        for engine in ["pandas", "openpyxl-stream"] + (["calamine"] if CALAMINE_AVAILABLE else []):
+            with Workbook(results_with_raw_data, engine=engine) as workbook:
+                table, bounds = workbook.table("Results")
+
+            assert bounds.columns == (0, 1, 2) and bounds.rows == 3
+            assert bounds.skipped_regions == ["D:XFD", "5:1048576"]
+            assert bounds.read_range(table) == "A1:C4"
+            pd.testing.assert_frame_equal(table, reference.iloc[:3, :3], check_dtype=False, obj=engine)
+
+    def test_csv_table_is_read_with_usecols_and_nrows(self, tmp_path):
+        """Test that a CSV file's table is read with a bounded read_csv call."""
+        from src.services.workbook_loader import Workbook
+
+        path = tmp_path / "results.csv"
+        rows = ["Material,Tensile (MPa),,Time (s),Force (N)", "PLA,50,,0.0,1.0", "PETG,48,,0.1,2.0", ",,,0.2,3.0"]
+        rows += [f",,,{i / 10},{i}" for i in range(3, 60)]
+        path.write_text("\n".join(rows) + "\n")
+
+        with patch("pandas.read_csv", wraps=pd.read_csv) as mock_read_csv:
+            with Workbook(str(path)) as workbook:
+                table, bounds = workbook.table(0)
+
+        kwargs = mock_read_csv.call_args.kwargs
+        assert (kwargs["usecols"], kwargs["nrows"], kwargs["sep"]) == ([0, 1], 2, ",")
+        assert list(table["Material"]) == ["PLA", "PETG"]
+        assert bounds.skipped_regions == ["C:XFD", "4:1048576"]
+
+    def test_sheets_without_a_named_header_are_read_whole(self, results_with_raw_data, tmp_path):
+        """Test that titled blocks are not bounded, and that parsed or cached sheets are cut the same way."""
+        from src.services.sheet_cache import SheetCache
+        from src.services.workbook_loader import Workbook
+
+        with Workbook(results_with_raw_data, engine="pandas") as workbook:
+            raw, raw_bounds = workbook.table("Raw")
+            full = workbook.sheet("Results")
+            table, bounds = workbook.table("Results")
+
+        assert raw_bounds.complete and raw_bounds.skipped_regions == []
+        assert raw.shape == (38, 2)
+        assert bounds.columns == (0, 1, 2)
+        pd.testing.assert_frame_equal(table, full.iloc[:3, :3])
+
+        cache = SheetCache(str(tmp_path / "cache"))
+        with Workbook(results_with_raw_data, engine="pandas", cache=cache, sha256_hash="abc") as workbook:
+            cached_table, cached_bounds = workbook.table("Results")
+        assert cached_bounds == bounds
+        pd.testing.assert_frame_equal(cached_table, table)
+
+    def test_cache_miss_reads_only_the_table_and_caches_it(self, results_with_raw_data, tmp_path):
+        """Test that a sheet cache does not force whole-sheet reads, and serves the table with its bounds."""
+        from src.services.sheet_cache import SheetCache
+        from src.services.workbook_loader import Workbook
+
+        cache = SheetCache(str(tmp_path / "cache"))
+        with patch.object(Workbook, "_read", autospec=True, side_effect=Workbook._read) as mock_read:
+            with Workbook(results_with_raw_data, engine="openpyxl-stream", cache=cache, sha256_hash="abc") as workbook:
+                table, bounds = workbook.table("Results")
+        assert mock_read.call_args.kwargs == {"usecols": (0, 1, 2), "nrows": 3}
+
+        with patch.object(Workbook, "_open", side_effect=AssertionError("workbook reopened")):
+            with Workbook(results_with_raw_data, engine="openpyxl-stream", cache=cache, sha256_hash="abc") as workbook:
+                cached_table, cached_bounds = workbook.table("Results")
+        assert cached_bounds == bounds
+        pd.testing.assert_frame_equal(cached_table, table)
+        assert cache.stats["hits"] == 1
+
+
+class TestNormalizationManifest:
+    """Tests for the manifest that lets the normalize phase skip unchanged files."""
+
+    def _file(self, sha="a" * 64):
+        return ValidFile(
+            filename="pla.csv",
+            file_type=".csv",
+            sha256_hash=sha,
+            file_path="data/raw/pla.csv",
+            download_timestamp="2025-10-03T10:00:00Z",
+            source_post_url="https://test.com/post",
+            file_size=10,
+            url="https://test.com/files/pla.csv"
+        )
+
+    def test_file_is_current_only_for_same_hash_rules_and_storage_key(self, tmp_path):
+        """Test that a changed file hash, rule set or output key makes a file stale again."""
+        from src.models.normalization_manifest import NormalizationManifest
+
+        path = str(tmp_path / "state" / "normalization_manifest.json")
+        manifest = NormalizationManifest()
+        manifest.record(self._file(), "rules-v1", "post-hash")
+        manifest.save(path)
+
+        loaded = NormalizationManifest.load(path)
+        assert loaded.is_current(self._file(), "rules-v1", "post-hash")
+        assert not loaded.is_current(self._file(sha="b" * 64), "rules-v1", "post-hash")
+        assert not loaded.is_current(self._file(), "rules-v2", "post-hash")
+        assert not loaded.is_current(self._file(), "rules-v1", "other-post-hash")
+        assert not NormalizationManifest.load(str(tmp_path / "missing.json")).is_current(
+            self._file(), "rules-v1", "post-hash")
+
+    def test_rules_fingerprint_tracks_mappings(self):
+        """Test that the fingerprint is stable and changes with the unit or property mappings."""
+        service = NormalizerService()
+        fingerprint = service.rules_fingerprint()
+
+        assert NormalizerService().rules_fingerprint() == fingerprint
+        service.property_classifier.update_mappings({"tensile stress": "tensile_strength"})
+        assert service.rules_fingerprint() != fingerprint
+        service = NormalizerService()
+        service.unit_registry.define("°c", "K", 1.0, 273.0)
+        assert service.rules_fingerprint() != fingerprint
+
+
+class TestVectorizedExtraction:
+    """Tests for the column-at-a-time number/unit split."""
+
+    def test_split_matches_per_cell_parsing(self):
+        """Test that the vectorized split gives the same number and unit as parsing each cell on its own."""
+        import re
+        import numpy as np
+
+        df = pd.DataFrame({
+            "Tensile": pd.Series(["50.2 MPa", None, " 1.5e3 kPa ", 48, "n/a", "-0.5mm\nmeasured"], dtype=object),
+            "Density": [1.24, np.nan, 1.27, np.inf, 1.3, 2.0],
+            "Passed": [True, False, True, True, False, True]
+        })
+
+        split = NormalizerService()._split_numbers_and_units(df, [0, 1, 2])
+
+        pattern = r'([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)'
+        for position, (numbers, units) in enumerate(split):
+            cells = df.iloc[:, position].dropna()
+            assert len(numbers) == len(units) == len(cells)
+            for cell, number, unit in zip(cells, numbers, units):
+                text = str(cell).strip()
+                match = re.search(pattern, text)
+                if match is None:
+                    assert np.isnan(number)
+                else:
+                    assert number == float(match.group(1))
+                    assert unit == text[match.end():].strip()
+
+        numbers, _ = NormalizerService()._split_numbers_and_units(df, [0], limit=3)[0]
+        assert len(numbers) == 3
+
+    def test_split_window_ignores_sparse_unrequested_columns(self):
+        """Test that only the requested columns size the leading-rows window, and short columns stop growing it."""
+        import numpy as np
+        from src.services.normalizer_service import _SPLIT_WINDOW_ROWS, _split_window
+
+        rows = _SPLIT_WINDOW_ROWS * 8
+        notes = np.full(rows, None, dtype=object)
+        notes[rows - 1] = "checked"
+        sparse = np.full(rows, np.nan)
+        sparse[[5, 600]] = [1.0, 2.0]
+        df = pd.DataFrame({"Tensile": [f"{50 + i % 7} MPa" for i in range(rows)], "Spacer": np.nan,
+                           "Notes": notes, "Sparse": sparse, "Short": [1.0, 2.0] + [np.nan] * (rows - 2)})
+
+        assert _split_window(df, [0, 4], limit=3) == _SPLIT_WINDOW_ROWS
+        assert _split_window(df, [0, 3], limit=3) == _SPLIT_WINDOW_ROWS * 4
+        numbers, _ = NormalizerService()._split_numbers_and_units(df, [0, 3], limit=3)[1]
+        assert list(numbers) == [1.0, 2.0]
+
+    def test_series_mode_keeps_every_value_and_the_same_properties(self):
+        """Test that series mode adds single-unit SI arrays without changing the sampled properties."""
+        import numpy as np
+
+        df = pd.DataFrame({
+            "Tensile strength": ["[MPa]", "50", "52.5 MPa", "n/a", "49 MPa", "51"],
+            "Tg": ["60 °C", "62 °C", None, None, None, None]
+        })
+        file = Mock(sha256_hash="h")
+
+        sampled = NormalizerService(extract_series=False)._extract_single_material(df, "PLA", file)
+        full = NormalizerService(extract_series=True)._extract_single_material(df, "PLA", file)
+
+        # Series mode only adds fields (summary statistics) to the sampled properties
+        assert {name: {key: entry[key] for key in sampled.normalized_values[name]}
+                for name, entry in full.normalized_values.items()} == sampled.normalized_values
+        assert sampled.series == {}
+        tensile = full.series["tensile_strength"]
+        assert tensile["values"].dtype == np.float64
+        # The unit-less cells are left out rather than mixing MPa and Pa in one array
+        assert list(tensile["values"]) == [52.5e6, 49e6]
+        assert list(tensile["units"]) == ["Pa", "Pa"]
+        assert np.allclose(full.series["glass_transition_temperature"]["values"], [333.15, 335.15])
+
+    def test_series_mode_adds_summary_statistics(self):
+        """Test per-property statistics over the values sharing the property's unit."""
+        import numpy as np
+
+        df = pd.DataFrame({
+            "Tensile strength": ["50 MPa", "52 MPa", "see notes", "48 MPa", "55", "54 MPa"],
+            "Tg": ["60 °C", None, None, None, None, None]
+        })
+        material = NormalizerService(extract_series=True)._extract_single_material(df, "PLA", Mock(sha256_hash="h"))
+
+        tensile = material.normalized_values["tensile_strength"]
+        expected = np.array([50e6, 52e6, 48e6, 54e6])
+        assert tensile["value"] == 50e6
+        assert tensile["count"] == 4
+        assert tensile["mean"] == pytest.approx(expected.mean())
+        assert tensile["std"] == pytest.approx(expected.std(ddof=1))
+        assert (tensile["min"], tensile["max"], tensile["median"]) == (48e6, 54e6, 51e6)
+
+        tg = material.normalized_values["glass_transition_temperature"]
+        assert tg["count"] == 1 and tg["std"] is None
+        assert "count" not in NormalizerService(extract_series=False)._extract_single_material(
+            df, "PLA", Mock(sha256_hash="h")).normalized_values["tensile_strength"]
+
+
+class TestPropertyNameClassifier:
+    """Tests for column header classification."""
+
+    def test_matches_previous_header_rules(self):
+        """Test exact mappings, keyword rules in order, and the snake_case fallback."""
+        classifier = NormalizerService().property_classifier
+
+        assert classifier.classify("Young's Modulus ") == "elastic_modulus"
+        assert classifier.classify("Tg") == "glass_transition_temperature"
+        assert classifier.classify("Tensile strength (MPa)") == "tensile_strength"
+        assert classifier.classify("Elastic strain") == "elastic_modulus"
+        assert classifier.classify("Glass transition\ntemperature [°C]") == "glass_transition_temperature"
+        assert classifier.classify("Temperature") == "temperature"
+        assert classifier.classify("Print speed (mm/s) __ v2") == "print_speed_mm_s_v2"
+        assert classifier.classify("Ø") == ""
+
+    def test_repeated_headers_are_served_from_the_cache(self):
+        """Test that each distinct header is classified once and the hit rate is reported."""
+        classifier = NormalizerService().property_classifier
+
+        for _ in range(3):
+            for header in ["Tensile strength (MPa)", "Density", "Notes"]:
+                classifier.classify(header)
+
+        assert classifier.stats == {'hits': 6, 'misses': 3, 'cached': 3, 'hit_rate': 0.6667}
+        classifier.clear_cache()
+        assert classifier.stats['cached'] == 0
+
+    def test_mapping_updates_invalidate_memoized_headers(self):
+        """Test that the mappings are read-only and that update_mappings drops stale cached results."""
+        classifier = NormalizerService().property_classifier
+        assert classifier.classify("Notes") == "notes"
+
+        with pytest.raises(TypeError):
+            classifier.property_mappings["notes"] = "remarks"
+        classifier.update_mappings({"notes": "remarks"})
+
+        assert classifier.classify("Notes") == "remarks"
+
+
+class TestMaterialNames:
+    """Tests for material name identification."""
+
+    def test_first_column_names_keep_their_order(self):
+        """Test that polymer names are found across the vocabulary, once each, in first-seen order."""
+        df = pd.DataFrame({
+            "Sample": ["PETG-CF ", "Tensile strength", "PA6-CF", "TPU95A", "PETG-CF", None, "PC blend",
+                       "Generic filament", "pcbway CNC", "ASA", 12.5, "PPA-CF"],
+            "Value": range(12)
+        })
+
+        assert NormalizerService()._identify_materials(df) == [
+            "PETG-CF", "PA6-CF", "TPU95A", "PC blend", "Generic filament", "ASA", "PPA-CF"
+        ]
+
+    def test_file_names_give_the_first_polymer(self):
+        """Test that grades, blends and fibre suffixes are kept, and that non-material words are not matched."""
+        service = NormalizerService()
+
+        assert service._extract_material_name_from_file("bambulab-pa6-cf-gf.xlsx") == "PA6-CF Material"
+        assert service._extract_material_name_from_file("prusament-pc-blend-cf.xlsx") == "PC blend-CF Material"
+        assert service._extract_material_name_from_file("esun--tpu95-results.xlsx") == "TPU95 Material"
+        assert service._extract_material_name_from_file("extrudr-tpu98a.xlsx") == "TPU98A Material"
+        assert service._extract_material_name_from_file("tinmorry-placf-petgcf.xlsx") == "PLA-CF Material"
+        assert service._extract_material_name_from_file("kingroon-petg-pla-results.xlsx") == "PETG Material"
+        assert service._extract_material_name_from_file("pcbway-results.xlsx") == "pcbway-results"
+
+    def test_each_material_is_extracted_from_its_own_rows(self):
+        """Test that a comparison sheet gives each material the values of its row block."""
+        df = pd.DataFrame({
+            "Material": ["Printed at 220 °C", "PLA", None, "PETG", None, "PA6-CF", "PLA"],
+            "Tensile strength": ["", "50 MPa", "52 MPa", "48 MPa", "47 MPa", "45 MPa", "51 MPa"],
+            "Density": [None, "1.24 g/cm³", None, "1.27 g/cm³", None, "1.07 g/cm³", None],
+            "Tg": [None, "60 °C", None, "80 °C", None, "100 °C", None]
+        })
+
+        materials = NormalizerService()._extract_materials_from_df(df, Mock(filename="results.xlsx", sha256_hash="h"))
+
+        assert [m.material_name for m in materials] == ["PLA", "PETG", "PA6-CF"]
+        assert [m.normalized_values["tensile_strength"]["value"] for m in materials] == [50e6, 48e6, 45e6]
+        assert all("material" not in m.normalized_values for m in materials)
+        assert [m.normalized_values["glass_transition_temperature"]["value"] for m in materials] == [
+            333.15, 353.15, 373.15]
+
+    def test_material_columns_are_extracted_as_blocks(self):
+        """Test that a sheet with a column per material gives one material per column."""
+        df = pd.DataFrame({
+            "Property": ["Tensile strength", "Density", "Tg"],
+            "PLA": ["50 MPa", "1.24 g/cm³", "60 °C"],
+            "PETG-CF": ["48 MPa", "1.27 g/cm³", "80 °C"],
+            "Notes": ["ISO 527", None, None]
+        })
+
+        materials = NormalizerService()._extract_materials_from_df(df, Mock(filename="results.xlsx", sha256_hash="h"))
+
+        assert [m.material_name for m in materials] == ["PLA", "PETG-CF"]
+        assert [m.normalized_values["density"]["value"] for m in materials] == [1240.0, 1270.0]
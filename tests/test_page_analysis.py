@@ -0,0 +1,96 @@
+import json
+import os
+import pytest
+from unittest.mock import patch
+from src.models.fetched_page import FetchedPage
+from src.models.page_analysis import HTML_PARSERS, analyze_html, html_parser_backend
+from src.models.post import Post
+from src.services.crawler_service import CrawlerService
+
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "pages")
+
+with open(os.path.join(PAGES_DIR, "expected.json"), "r", encoding="utf-8") as f:
+    EXPECTED = json.load(f)
+
+
+def _load_page(name):
+    with open(os.path.join(PAGES_DIR, name), "r", encoding="utf-8") as f:
+        return FetchedPage(url=EXPECTED[name]["url"], html=f.read())
+
+
+class TestPageAnalysis:
+    """Tests for the single-parse post page analysis over saved post pages."""
+
+    @pytest.mark.parametrize("parser", HTML_PARSERS)
+    @pytest.mark.parametrize("name", sorted(EXPECTED))
+    def test_extracts_all_fields_from_saved_pages(self, name, parser):
+        """Test that every parser backend gives the expected title, links and cleaned text for each saved page."""
+        expected = EXPECTED[name]
+        page = _load_page(name)
+        analysis = analyze_html(page.url, page.html, parser)
+
+        assert analysis.title == expected["title"]
+        assert analysis.youtube_link == expected["youtube_link"]
+        assert analysis.manufacturer_links == expected["manufacturer_links"]
+        assert sorted(analysis.download_links) == expected["download_links"]
+        assert analysis.cleaned_text == expected["cleaned_text"]
+
+    def test_page_is_parsed_once(self):
+        """Test that building the post and finding its download links share one parse."""
+        page = _load_page("pla_tensile.html")
+
+        with patch("src.models.page_analysis.BeautifulSoup", wraps=__import__("bs4").BeautifulSoup) as mock_soup:
+            post = Post.from_page(page)
+            links = page.analysis.download_links
+
+        assert mock_soup.call_count == 1
+        assert post.title == EXPECTED["pla_tensile.html"]["title"]
+        assert "https://www.mytechfun.com/media/files/pla_vs_pla_plus_results.xlsx" in links
+
+    @pytest.mark.parametrize("name", sorted(EXPECTED))
+    def test_backends_build_identical_posts(self, name, monkeypatch):
+        """Test that the fast backend builds the same Post and download links as html.parser."""
+        results = []
+        for parser in HTML_PARSERS:
+            monkeypatch.setenv("MTF_HTML_PARSER", parser)
+            page = _load_page(name)
+            post = Post.from_page(page)
+            results.append((post.to_dict() | {"download_timestamp": None}, page.analysis.download_links))
+
+        assert results[0] == results[1]
+
+    def test_backends_find_identical_listing_urls(self, monkeypatch):
+        """Test that post URLs parsed from a listing page do not depend on the backend."""
+        listing = """
+        <ul><li><a href="/video/12">PLA</a><li><a href="https://www.mytechfun.com/video/13">PETG</a>
+        <li><a href="/videos/material_test">All</a><li><a href="https://youtu.be/video/1">YT</a>
+        <p><a href="/video/12">PLA again</a></ul>
+        """
+        results = []
+        for parser in HTML_PARSERS:
+            monkeypatch.setenv("MTF_HTML_PARSER", parser)
+            results.append(CrawlerService()._parse_post_urls(listing, "https://www.mytechfun.com/videos/material_test"))
+
+        assert results[0] == results[1] == [
+            "https://www.mytechfun.com/video/12",
+            "https://www.mytechfun.com/video/13"
+        ]
+
+    def test_parser_backend_selection(self, monkeypatch):
+        """Test that lxml is the default backend and unknown backends are rejected."""
+        monkeypatch.delenv("MTF_HTML_PARSER", raising=False)
+        assert html_parser_backend() in HTML_PARSERS
+
+        with patch("src.models.page_analysis.LXML_AVAILABLE", False):
+            assert html_parser_backend() == "html.parser"
+
+        monkeypatch.setenv("MTF_HTML_PARSER", "selectolax")
+        with pytest.raises(ValueError):
+            html_parser_backend()
+
+    def test_clean_html_content_matches_analysis(self):
+        """Test that Post._clean_html_content and the page analysis apply the same cleaning."""
+        page = _load_page("petg_heat.html")
+
+        assert Post._clean_html_content(page.html) == page.analysis.cleaned_text
@@ -139,3 +139,113 @@ class TestParserService:
                 for file in files:
                     expected_path = f"data/raw/{self.sample_post.post_hash}/"
                     assert file.file_path.startswith(expected_path)
+
+    def test_reuses_page_fetched_by_crawler(self):
+        """Test that a post carrying its fetched page is not downloaded a second time."""
+        from src.models.fetched_page import FetchedPage
+
+        html = """
+        <html><body>
+        <div class="files">Download files:
+            <a href="/download/7/results.xlsx">results.xlsx</a>
+            <a href="/download/7/model.stl">model.stl</a>
+        </div>
+        </body></html>
+        """
+        self.sample_post.page = FetchedPage(url=self.sample_post.url, html=html)
+
+        with patch.object(self.parser_service.session, 'get') as mock_get:
+            links = self.parser_service._find_download_links(self.sample_post.url, self.sample_post.page)
+
+            mock_get.assert_not_called()
+            assert "https://www.mytechfun.com/download/7/results.xlsx" in links
+            assert "https://www.mytechfun.com/download/7/model.stl" in links
+
+    def test_fetches_page_when_post_has_none(self):
+        """Test that posts loaded from discovery results still get their page fetched."""
+        with patch.object(self.parser_service.session, 'get') as mock_get:
+            mock_get.return_value.text = '<a href="/download/7/data.csv">data.csv</a>'
+
+            links = self.parser_service._find_download_links(self.sample_post.url)
+
+            mock_get.assert_called_once_with(self.sample_post.url, timeout=30, headers=None)
+            assert links == ["https://www.mytechfun.com/download/7/data.csv"]
+
+    def test_skips_files_already_downloaded(self, tmp_path):
+        """Test that a download URL recorded in data/raw/index.json is not fetched again."""
+        self.parser_service.raw_dir = str(tmp_path)
+        self.parser_service.rate_limit_delay = 0
+        url = "https://www.mytechfun.com/download/7/results.xlsx"
+        existing_path = tmp_path / "abc_results.xlsx"
+        existing_path.write_bytes(b"xlsx bytes")
+
+        downloaded = ValidFile(
+            filename="results.xlsx", file_type=".xlsx", sha256_hash="a" * 64,
+            file_path=str(existing_path), download_timestamp="2025-10-03T10:00:00Z",
+            source_post_url="https://www.mytechfun.com/video/7", file_size=10, url=url
+        )
+        self.parser_service._record_download(downloaded)
+
+        # A fresh service instance reads the persisted index
+        parser_service = ParserService()
+        parser_service.raw_dir = str(tmp_path)
+
+        with patch.object(parser_service, '_find_download_links', return_value=[url]):
+            with patch.object(parser_service, '_download_file') as mock_download:
+                files = parser_service.extract_files(self.sample_post)
+
+                mock_download.assert_not_called()
+
+        assert [f.file_path for f in files] == [str(existing_path)]
+        assert files[0].source_post_url == self.sample_post.url
+        assert parser_service.downloads_skipped == 1
+        assert parser_service.request_counts['download'] == 0
+
+    def test_streams_download_to_disk_with_incremental_hash(self, tmp_path):
+        """Test that downloads are streamed to <sha256>_<filename> without buffering the body."""
+        import hashlib
+        self.parser_service.raw_dir = str(tmp_path)
+        self.parser_service.rate_limit_delay = 0
+        chunks = [b"a" * 65536, b"b" * 65536, b"c" * 10]
+
+        with patch.object(self.parser_service.session, 'get') as mock_get:
+            mock_get.return_value.headers = {}
+            mock_get.return_value.iter_content.return_value = iter(chunks)
+
+            valid_file = self.parser_service._download_file(
+                "https://www.mytechfun.com/download/7/results.xlsx", self.sample_post.url
+            )
+
+        expected_hash = hashlib.sha256(b"".join(chunks)).hexdigest()
+        assert valid_file.sha256_hash == expected_hash
+        assert valid_file.file_size == sum(len(c) for c in chunks)
+        assert valid_file.file_path == str(tmp_path / f"{expected_hash}_results.xlsx")
+        assert sorted(p.name for p in tmp_path.iterdir()) == [f"{expected_hash}_results.xlsx"]
+
+    def test_rejects_downloads_over_size_limit(self, tmp_path):
+        """Test that the max-size guard aborts the download and leaves no partial file."""
+        self.parser_service.raw_dir = str(tmp_path)
+        self.parser_service.rate_limit_delay = 0
+        self.parser_service.max_download_bytes = 100
+
+        with patch.object(self.parser_service.session, 'get') as mock_get:
+            mock_get.return_value.headers = {}
+            mock_get.return_value.iter_content.return_value = iter([b"x" * 60, b"x" * 60])
+
+            with pytest.raises(Exception) as exc_info:
+                self.parser_service._download_file(
+                    "https://www.mytechfun.com/download/7/results.xlsx", self.sample_post.url
+                )
+
+        assert "exceeds" in str(exc_info.value)
+        assert list(tmp_path.iterdir()) == []
+
+        with patch.object(self.parser_service.session, 'get') as mock_get:
+            mock_get.return_value.headers = {'Content-Length': '5000'}
+
+            with pytest.raises(Exception):
+                self.parser_service._download_file(
+                    "https://www.mytechfun.com/download/7/results.xlsx", self.sample_post.url
+                )
+
+            mock_get.return_value.iter_content.assert_not_called()
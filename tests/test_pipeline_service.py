@@ -0,0 +1,113 @@
+import threading
+import time
+from unittest.mock import Mock
+from src.services.pipeline_service import PipelineService
+
+
+def make_post(n):
+    post = Mock(url=f"https://www.mytechfun.com/video/{n}", post_hash=f"hash{n}")
+    post.page = object()
+    return post
+
+
+class TestPipelineService:
+    """Tests for the streaming crawl → download → normalize → store pipeline."""
+
+    def setup_method(self):
+        self.crawler_service = Mock()
+        self.parser_service = Mock()
+        self.normalizer_service = Mock()
+        self.storage_service = Mock()
+        self.pipeline = PipelineService(
+            self.crawler_service, self.parser_service,
+            self.normalizer_service, self.storage_service, queue_size=1
+        )
+
+    def test_every_post_flows_through_all_stages(self):
+        """Test that each crawled post is downloaded, normalized and stored once, in order."""
+        posts = [make_post(n) for n in range(5)]
+        self.crawler_service.iter_posts.return_value = iter(posts)
+        self.parser_service.extract_files.side_effect = lambda post: [f"file-{post.post_hash}"]
+        self.normalizer_service.process_materials.side_effect = lambda files: [f"mat-{files[0]}"]
+
+        result = self.pipeline.run("https://www.mytechfun.com/videos/material_test")
+
+        assert result['posts_crawled'] == 5
+        assert result['files_downloaded'] == 5
+        assert result['materials_processed'] == 5
+        assert result['json_files_created'] == 5
+        assert result['posts'] == posts
+        saved = [call.args for call in self.storage_service.save_json.call_args_list]
+        assert saved[0] == (posts[0], ["file-hash0"], ["mat-file-hash0"])
+        # Parsed pages are released once download links are known
+        assert all(post.page is None for post in posts)
+
+    def test_first_output_is_stored_before_crawl_finishes(self):
+        """Test that storage starts while the crawler is still producing posts."""
+        crawl_finished = threading.Event()
+        stored_before_crawl_finished = []
+
+        def slow_crawl(base_url, max_posts=None):
+            for n in range(4):
+                yield make_post(n)
+                time.sleep(0.05)
+            crawl_finished.set()
+
+        self.crawler_service.iter_posts.side_effect = slow_crawl
+        self.parser_service.extract_files.return_value = []
+        self.storage_service.save_json.side_effect = \
+            lambda *args: stored_before_crawl_finished.append(not crawl_finished.is_set())
+
+        self.pipeline.run("https://www.mytechfun.com/videos/material_test")
+
+        assert stored_before_crawl_finished[0] is True
+
+    def test_stage_failure_does_not_stop_pipeline(self):
+        """Test that a failing download keeps the post and processing continues."""
+        posts = [make_post(n) for n in range(3)]
+        self.crawler_service.iter_posts.return_value = iter(posts)
+        self.parser_service.extract_files.side_effect = [Exception("boom"), [], []]
+
+        result = self.pipeline.run("https://www.mytechfun.com/videos/material_test")
+
+        assert result['json_files_created'] == 3
+        assert 'error' not in result
+
+    def test_crawl_failure_is_reported(self):
+        """Test that a crawler error ends the pipeline and is surfaced in the stats."""
+        self.crawler_service.iter_posts.side_effect = Exception("robots.txt disallows crawling")
+
+        result = self.pipeline.run("https://www.mytechfun.com/videos/material_test")
+
+        assert "robots.txt" in result['error']
+        assert result['json_files_created'] == 0
+
+    def test_normalize_failure_still_stores_the_post(self):
+        """Test that a post whose files fail to normalize is stored without materials."""
+        posts = [make_post(n) for n in range(3)]
+        self.crawler_service.iter_posts.return_value = iter(posts)
+        self.parser_service.extract_files.side_effect = lambda post: [f"file-{post.post_hash}"]
+        self.normalizer_service.process_materials.side_effect = [["mat-0"], Exception("boom"), ["mat-2"]]
+
+        result = self.pipeline.run("https://www.mytechfun.com/videos/material_test")
+
+        assert result['json_files_created'] == 3
+        assert result['materials_processed'] == 2
+        saved = [call.args for call in self.storage_service.save_json.call_args_list]
+        assert saved[1] == (posts[1], ["file-hash1"], [])
+
+    def test_stored_posts_are_recorded_in_the_manifest(self):
+        """Test that the store stage records each stored post's files in the normalization manifest."""
+        manifest = Mock()
+        pipeline = PipelineService(self.crawler_service, self.parser_service, self.normalizer_service,
+                                   self.storage_service, manifest=manifest, rules_fingerprint="rules-v1")
+        posts = [make_post(n) for n in range(2)]
+        self.crawler_service.iter_posts.return_value = iter(posts)
+        self.parser_service.extract_files.side_effect = lambda post: [f"file-{post.post_hash}"]
+        self.normalizer_service.process_materials.return_value = []
+
+        pipeline.run("https://www.mytechfun.com/videos/material_test")
+
+        assert [call.args for call in manifest.record.call_args_list] == [
+            ("file-hash0", "rules-v1", "hash0"), ("file-hash1", "rules-v1", "hash1")
+        ]
@@ -0,0 +1,84 @@
+import tempfile
+from decimal import Decimal
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.services.sheet_cache import SheetCache
+from src.services.workbook_loader import Workbook
+
+
+class TestSheetCache:
+    """Tests for the content-addressed parsed-sheet cache."""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = SheetCache(cache_dir=self.temp_dir)
+
+    def _write_workbook(self, tmp_path):
+        path = tmp_path / "pla_results.xlsx"
+        df = pd.DataFrame({
+            "Property": ["Tensile", "Density", "Notes"],
+            "PLA": [50, 1.24, "brittle"],
+            "PETG": [np.nan, 1.27, "tough"]
+        })
+        with pd.ExcelWriter(path) as writer:
+            df.to_excel(writer, sheet_name="Results", index=False)
+        return str(path)
+
+    def test_mixed_object_columns_round_trip_exactly(self):
+        """Test that str/int/float/NaN cells come back with the same values and types."""
+        df = pd.DataFrame({
+            "Property": ["Tensile", "Density", "Notes"],
+            "PLA": pd.Series([50, 1.24, "brittle"], dtype=object),
+            "PETG": pd.Series([np.nan, None, True], dtype=object),
+            "Samples": [5, 5, 6]
+        })
+        key = self.cache.key("abc123", "pandas-test")
+
+        assert self.cache.store(key, 0, df)
+        loaded = self.cache.load(key, 0)
+
+        pd.testing.assert_frame_equal(loaded, df)
+        for column in ["PLA", "PETG"]:
+            assert [type(v) for v in loaded[column]] == [type(v) for v in df[column]]
+        assert self.cache.stats['hits'] == 1
+
+    def test_values_that_cannot_round_trip_are_not_cached(self):
+        """Test that unsupported cell types are reported as uncacheable instead of stored lossily."""
+        df = pd.DataFrame({"Price": pd.Series([Decimal("19.99")], dtype=object)})
+        key = self.cache.key("abc123", "pandas-test")
+
+        assert not self.cache.store(key, 0, df)
+        assert self.cache.load(key, 0) is None
+        assert self.cache.stats['uncacheable'] == 1
+
+    def test_cached_workbook_is_not_reopened(self, tmp_path):
+        """Test that a second read of the same hash serves every sheet without opening the file."""
+        path = self._write_workbook(tmp_path)
+
+        with Workbook(path, engine="pandas", cache=self.cache, sha256_hash="abc123") as workbook:
+            first = workbook.sheets()
+
+        with patch("pandas.ExcelFile", wraps=pd.ExcelFile) as mock_excel_file:
+            with Workbook(path, engine="pandas", cache=self.cache, sha256_hash="abc123") as workbook:
+                second = workbook.sheets()
+
+        assert mock_excel_file.call_count == 0
+        assert list(second) == ["Results"]
+        pd.testing.assert_frame_equal(second["Results"], first["Results"])
+
+    def test_reader_engine_is_part_of_the_key(self, tmp_path):
+        """Test that sheets parsed by one engine are not served to another."""
+        path = self._write_workbook(tmp_path)
+
+        with Workbook(path, engine="pandas", cache=self.cache, sha256_hash="abc123") as workbook:
+            workbook.sheets()
+        with Workbook(path, engine="openpyxl-stream", cache=self.cache, sha256_hash="abc123") as workbook:
+            workbook.sheets()
+
+        assert self.cache.stats['hits'] == 0
+        assert self.cache.stats['misses'] == 2
@@ -1,10 +1,13 @@
 import pytest
 from unittest.mock import Mock, patch, mock_open
 import json
+import os
+import tempfile
+import numpy as np
 from src.services.storage_service import StorageService
 from src.models.post import Post
 from src.models.valid_file import ValidFile
-from src.models.material_data import MaterialData
+from src.models.material_data import MaterialData, QualityRating
 from src.models.json_data import JSONData
 
 
@@ -209,3 +212,75 @@ class TestStorageService:
 
                 for field in required_compliance_fields:
                     assert hasattr(compliance, field) or field in compliance
+
+
+class TestSeriesSidecar:
+    """Tests for the binary sidecar holding full value series."""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.storage_service = StorageService()
+        self.storage_service.output_dir = self.temp_dir
+        raw_path = os.path.join(self.temp_dir, "file123hash.xlsx")
+        with open(raw_path, "wb") as f:
+            f.write(b"PK" + b"\0" * 2046)
+        self.post = Post(
+            url="https://www.mytechfun.com/videos/material_test/sample",
+            title="Test Material Analysis",
+            cleaned_text="Cleaned post content",
+            youtube_link=None,
+            manufacturer_links=[],
+            download_timestamp="2025-10-03T10:00:00Z",
+            post_hash="abc123def456"
+        )
+        self.files = [
+            ValidFile(
+                filename="test_data.xlsx",
+                file_type=".xlsx",
+                sha256_hash="file123hash",
+                file_path=raw_path,
+                download_timestamp="2025-10-03T10:01:00Z",
+                source_post_url=self.post.url,
+                file_size=2048,
+                url="https://www.mytechfun.com/files/test_data.xlsx"
+            )
+        ]
+
+    def _material(self, series):
+        return MaterialData.create_normalized(
+            material_name="PLA Material",
+            source_file_hash="file123hash",
+            properties={"tensile_strength": {"value": 50e6, "unit": "Pa"}},
+            quality=QualityRating.WARN,
+            series=series
+        )
+
+    def test_series_round_trip_next_to_the_json(self):
+        """Test that series are stored as float64 arrays keyed by material and property, outside the JSON."""
+        series = {"tensile_strength": {"values": np.array([50e6, 52e6, 49.5e6]),
+                                       "units": np.array(["Pa", "Pa", "Pa"], dtype=object)}}
+
+        self.storage_service.save_json(self.post, self.files, [self._material(series), self._material(series)])
+
+        with open(os.path.join(self.temp_dir, "abc123def456.json"), encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["_metadata"]["series_file"] == "abc123def456.series.npz"
+        assert "series" not in data["materials"][0]
+
+        loaded = self.storage_service.load_series("abc123def456")
+        assert sorted(loaded) == ["PLA Material", "PLA Material #2"]
+        values = loaded["PLA Material"]["tensile_strength"]["values"]
+        assert values.dtype == np.float64
+        assert list(values) == [50e6, 52e6, 49.5e6]
+        assert list(loaded["PLA Material #2"]["tensile_strength"]["units"]) == ["Pa", "Pa", "Pa"]
+
+    def test_stale_sidecar_is_removed(self):
+        """Test that re-saving a post without series removes its old sidecar."""
+        series = {"density": {"values": np.array([1240.0]), "units": np.array(["kg/m³"], dtype=object)}}
+
+        self.storage_service.save_json(self.post, self.files, [self._material(series)])
+        assert self.storage_service.load_series("abc123def456")
+        self.storage_service.save_json(self.post, self.files, [self._material({})])
+
+        assert self.storage_service.load_series("abc123def456") == {}
+        assert not os.path.exists(os.path.join(self.temp_dir, "abc123def456.series.npz"))
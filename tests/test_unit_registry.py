@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from src.services.unit_registry import UnitRegistry, _canonical
+
+# Every unit the registry knows: (unit as written, value, expected SI value, expected SI unit)
+CONVERSION_TABLE = [
+    ("MPa", 50.0, 50e6, "Pa"),
+    ("GPa", 2.5, 2.5e9, "Pa"),
+    ("kPa", 101.325, 101325.0, "Pa"),
+    ("psi", 1.0, 6894.76, "Pa"),
+    ("ksi", 2.0, 13.78952e6, "Pa"),
+    ("°C", 100.0, 373.15, "K"),
+    ("°C", -273.15, 0.0, "K"),
+    ("°F", 212.0, 373.15, "K"),
+    ("°F", -40.0, 233.15, "K"),
+    ("g/cm³", 1.24, 1240.0, "kg/m³"),
+    ("mm", 4.0, 0.004, "m"),
+    ("cm", 12.0, 0.12, "m"),
+    ("in", 1.0, 0.0254, "m"),
+    ("ft", 3.0, 0.9144, "m"),
+    # Aliases and spelling variants
+    ("N/mm²", 50.0, 50e6, "Pa"),
+    ("N/mm^2", 50.0, 50e6, "Pa"),
+    ("Celsius", 60.0, 333.15, "K"),
+    ("degC", 60.0, 333.15, "K"),
+    ("deg C", 60.0, 333.15, "K"),
+    ("ºC", 60.0, 333.15, "K"),
+    ("Fahrenheit", 140.0, 333.15, "K"),
+    ("degF", 140.0, 333.15, "K"),
+    ("deg  F", 140.0, 333.15, "K"),
+    ("g/cm^3", 1.0, 1000.0, "kg/m³"),
+    ("g/cm3", 1.0, 1000.0, "kg/m³"),
+    ("g/cc", 1.0, 1000.0, "kg/m³"),
+    ("inch", 2.0, 0.0508, "m"),
+    ("inches", 2.0, 0.0508, "m"),
+]
+
+
+class TestUnitRegistry:
+    """Tests for SI unit conversion."""
+
+    def setup_method(self):
+        self.registry = UnitRegistry()
+
+    @pytest.mark.parametrize("unit,value,expected,si_unit", CONVERSION_TABLE)
+    def test_conversion_table(self, unit, value, expected, si_unit):
+        """Test each unit against a hand-computed SI value, as a scalar and in bulk."""
+        conversion = self.registry.resolve(unit)
+        assert conversion.si_unit == si_unit
+        assert conversion.apply(value) == pytest.approx(expected, abs=1e-9)
+
+        values, units = self.registry.convert(np.array([value, value]), np.array([unit, unit], dtype=object))
+        assert values == pytest.approx([expected, expected], abs=1e-9)
+        assert list(units) == [si_unit, si_unit]
+
+    def test_table_covers_every_unit_and_alias(self):
+        """Test that the correctness table is extended whenever a unit or alias is registered."""
+        covered = {self.registry.resolve(unit) for unit, *_ in CONVERSION_TABLE}
+        assert covered == set(self.registry.conversions.values())
+
+        tested_spellings = {_canonical(unit) for unit, *_ in CONVERSION_TABLE}
+        assert set(self.registry.aliases) <= tested_spellings
+
+    def test_bulk_conversion_keeps_unknown_units(self):
+        """Test that mixed units convert per value and unknown units pass through unchanged."""
+        values, units = self.registry.convert(
+            np.array([50.0, 2.0, 7.0, 60.0, np.nan]),
+            np.array(["MPa", "GPa", "widgets", "°C", ""], dtype=object))
+
+        assert values[:4] == pytest.approx([50e6, 2e9, 7.0, 333.15])
+        assert np.isnan(values[4])
+        assert list(units) == ["Pa", "Pa", "widgets", "K", ""]
+
+    def test_redefining_a_unit_invalidates_resolved_spellings(self):
+        """Test that a unit resolved before it was redefined picks up the new conversion."""
+        assert self.registry.resolve("degC").offset == 273.15
+
+        self.registry.define("°C", "K", 1.0, 273.0)
+
+        assert self.registry.resolve("degC").offset == 273.0
+        with pytest.raises(KeyError):
+            self.registry.alias("degR", "°R")